@@ -22,19 +22,22 @@ from fastapi.middleware.cors import CORSMiddleware
 from ecom_arb.api.routers import admin, amazon, checkout, crawl, exclusions, orders, products, scored
 from ecom_arb.config import get_settings
 from ecom_arb.db.base import Base, engine
+from ecom_arb.services import cj_parser, llm_analyzer
 
 settings = get_settings()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Create database tables on startup."""
+    """Create database tables on startup; release shared clients on shutdown."""
     # Import all models to ensure they're registered with Base
     from ecom_arb.db import models  # noqa: F401
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     yield
+    await llm_analyzer.close_client()
+    await cj_parser.close_client()
 
 app = FastAPI(
     title="ecom-arb API",
@@ -1410,6 +1410,7 @@ async def analyze_single_product(
         weight_grams=product.weight_grams,
         cost=float(product.product_cost),
         category=product.category,
+        bypass_cache=True,  # Re-analysis must not return a stale cached answer
     )
 
     logger.info(f"Product type: {understanding.product_type}")
@@ -1452,7 +1453,9 @@ async def analyze_single_product(
     ]
 
     # Step 3: LLM compares Amazon products
-    amazon_analysis = await compare_amazon_products(understanding, amazon_products)
+    amazon_analysis = await compare_amazon_products(
+        understanding, amazon_products, bypass_cache=True
+    )
 
     logger.info(f"Similar products: {amazon_analysis.sample_size}, Market price: ${amazon_analysis.market_price.get('weighted_median')}")
 
@@ -1628,7 +1631,10 @@ async def deep_keyword_exploration(
         min_relevance=min_relevance,
         max_keywords_per_tier=50,  # Allow more keywords in deep mode
     )
-    exploration = await explorer.explore(understanding)
+    try:
+        exploration = await explorer.explore(understanding)
+    finally:
+        explorer.close()
 
     # Find new keywords
     new_keywords = []
@@ -1650,7 +1656,8 @@ async def deep_keyword_exploration(
     # MERGE new keywords with existing ones (don't replace!)
     existing_exploration = product.keyword_analysis.get("exploration", {})
     existing_by_tier = existing_exploration.get("by_tier", {})
-    new_by_tier = exploration.to_dict().get("by_tier", {})
+    exploration_dict = exploration.to_dict()
+    new_by_tier = exploration_dict.get("by_tier", {})
 
     # Merge keywords by tier, avoiding duplicates
     merged_by_tier = {}
@@ -1672,7 +1679,7 @@ async def deep_keyword_exploration(
 
     # Merge top_opportunities
     existing_top = existing_exploration.get("top_opportunities", [])
-    new_top = exploration.to_dict().get("top_opportunities", [])
+    new_top = exploration_dict.get("top_opportunities", [])
     merged_top = []
     top_seen = set()
     for kw in existing_top + new_top:
@@ -55,6 +55,20 @@ class Settings(BaseSettings):
     # Get key from https://openrouter.ai/
     openrouter_api_key: str = ""
     openrouter_model: str = "anthropic/claude-3.5-haiku"  # cheaper alternative: claude-3.5-haiku
+    # Cheaper/faster model for simple tagging tasks like keyword relevance
+    # (empty = openrouter_model)
+    openrouter_model_fast: str = "openai/gpt-4o-mini"
+    # Seconds without data from OpenRouter (connect, first byte or between stream chunks)
+    # before an attempt is retried; total completion time is not capped
+    openrouter_request_timeout: float = 30.0
+
+    # Persistent cache of LLM keyword relevance scores
+    # (absolute SQLite file path, opt-in; empty = disabled)
+    keyword_score_cache_path: str = ""
+
+    # Persistent cache of OpenRouter responses keyed by exact request
+    # (absolute SQLite file path, opt-in; empty = disabled)
+    llm_cache_path: str = ""
 
 
 @lru_cache
@@ -8,12 +8,33 @@ from typing import Any
 
 from sqlalchemy import JSON, Boolean, DateTime, Enum, ForeignKey, Numeric, String, Text, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.engine import Dialect
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
+from sqlalchemy.types import TypeDecorator
 
 from ecom_arb.db.base import Base
 
 
+class FloatNumeric(TypeDecorator):
+    """Numeric column that also accepts plain floats and ints on write.
+
+    Floats are converted via repr (shortest round-trip form), so callers can
+    assign scoring results directly instead of building Decimals themselves.
+    Values read back are Decimals, as with Numeric.
+    """
+
+    impl = Numeric
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> Decimal | None:
+        if value is None or isinstance(value, Decimal):
+            return value
+        if isinstance(value, float):
+            return Decimal(repr(value))
+        return Decimal(value)
+
+
 class OrderStatus(str, enum.Enum):
     """Order status enumeration."""
 
@@ -115,15 +136,15 @@ class ScoredProduct(Base):
     source_url: Mapped[str | None] = mapped_column(String(1000), nullable=True)
 
     # Pricing inputs
-    product_cost: Mapped[Decimal] = mapped_column(Numeric(10, 2))
-    shipping_cost: Mapped[Decimal] = mapped_column(Numeric(10, 2))
-    selling_price: Mapped[Decimal] = mapped_column(Numeric(10, 2))
+    product_cost: Mapped[Decimal] = mapped_column(FloatNumeric(10, 2))
+    shipping_cost: Mapped[Decimal] = mapped_column(FloatNumeric(10, 2))
+    selling_price: Mapped[Decimal] = mapped_column(FloatNumeric(10, 2))
 
     # Category
     category: Mapped[str] = mapped_column(String(100))
 
     # Market data
-    estimated_cpc: Mapped[Decimal] = mapped_column(Numeric(10, 2))
+    estimated_cpc: Mapped[Decimal] = mapped_column(FloatNumeric(10, 2))
     monthly_search_volume: Mapped[int | None] = mapped_column(nullable=True)
     keyword_analysis: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
 
@@ -133,10 +154,12 @@ class ScoredProduct(Base):
     viability_reasons: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
 
     # Amazon competitor data
-    amazon_median_price: Mapped[Decimal | None] = mapped_column(Numeric(10, 2), nullable=True)
-    amazon_min_price: Mapped[Decimal | None] = mapped_column(Numeric(10, 2), nullable=True)
+    amazon_median_price: Mapped[Decimal | None] = mapped_column(FloatNumeric(10, 2), nullable=True)
+    amazon_min_price: Mapped[Decimal | None] = mapped_column(FloatNumeric(10, 2), nullable=True)
     amazon_avg_review_count: Mapped[int | None] = mapped_column(nullable=True)
-    amazon_prime_percentage: Mapped[Decimal | None] = mapped_column(Numeric(5, 2), nullable=True)
+    amazon_prime_percentage: Mapped[Decimal | None] = mapped_column(
+        FloatNumeric(5, 2), nullable=True
+    )
     amazon_search_results: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
 
     # Shipping/logistics data (from supplier)
@@ -150,11 +173,11 @@ class ScoredProduct(Base):
     inventory_count: Mapped[int | None] = mapped_column(nullable=True)
 
     # Calculated financials
-    cogs: Mapped[Decimal] = mapped_column(Numeric(10, 2))
-    gross_margin: Mapped[Decimal] = mapped_column(Numeric(10, 4))
-    net_margin: Mapped[Decimal] = mapped_column(Numeric(10, 4))
-    max_cpc: Mapped[Decimal] = mapped_column(Numeric(10, 2))
-    cpc_buffer: Mapped[Decimal] = mapped_column(Numeric(10, 2))
+    cogs: Mapped[Decimal] = mapped_column(FloatNumeric(10, 2))
+    gross_margin: Mapped[Decimal] = mapped_column(FloatNumeric(10, 4))
+    net_margin: Mapped[Decimal] = mapped_column(FloatNumeric(10, 4))
+    max_cpc: Mapped[Decimal] = mapped_column(FloatNumeric(10, 2))
+    cpc_buffer: Mapped[Decimal] = mapped_column(FloatNumeric(10, 2))
 
     # Filter result
     passed_filters: Mapped[bool] = mapped_column(Boolean, default=False)
@@ -163,7 +186,7 @@ class ScoredProduct(Base):
     # Point scoring
     points: Mapped[int | None] = mapped_column(nullable=True)
     point_breakdown: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
-    rank_score: Mapped[Decimal | None] = mapped_column(Numeric(10, 2), nullable=True)
+    rank_score: Mapped[Decimal | None] = mapped_column(FloatNumeric(10, 2), nullable=True)
 
     # Recommendation
     recommendation: Mapped[str] = mapped_column(String(50), default="REJECT")
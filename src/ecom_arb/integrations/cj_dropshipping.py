@@ -304,6 +304,16 @@ class CJDropshippingClient:
         self._refresh_token: Optional[str] = None
         self._token_expires: Optional[datetime] = None
 
+    def close(self):
+        """Drop cached tokens.
+
+        Each call is a one-shot requests call, so there is no connection to
+        release; close() exists so owners can close this like KeepaClient.
+        """
+        self._access_token = None
+        self._refresh_token = None
+        self._token_expires = None
+
     def _get_headers(self) -> dict:
         """Get request headers with authentication."""
         headers = {"Content-Type": "application/json"}
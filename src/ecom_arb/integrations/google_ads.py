@@ -10,9 +10,11 @@ See: PLAN/04_risks_and_spikes.md (SPIKE-002)
 See: PLAN/03_decisions.md (ADR-005)
 """
 
+import sys
 from dataclasses import dataclass
 from decimal import Decimal
 from enum import Enum
+from functools import cached_property
 from typing import Optional
 
 from google.ads.googleads.client import GoogleAdsClient as GoogleAdsApiClient
@@ -56,6 +58,11 @@ class CPCEstimate:
         """Average of low and high CPC estimates."""
         return (self.low_cpc + self.high_cpc) / 2
 
+    @cached_property
+    def kw_key(self) -> str:
+        """Lowercased, interned keyword, used as the dedup key during exploration."""
+        return sys.intern(self.keyword.lower())
+
     @classmethod
     def from_micros(
         cls,
@@ -195,22 +195,18 @@ class KeepaClient:
             return []
 
         data = csv_data[price_type]
-        history = []
-
-        # Data is pairs of [time, price, time, price, ...]
-        for i in range(0, len(data) - 1, 2):
-            keepa_time = data[i]
-            price = data[i + 1]
-
-            if keepa_time is not None and price is not None:
-                history.append(
-                    PricePoint(
-                        timestamp=self._keepa_time_to_datetime(keepa_time),
-                        price_cents=price if price >= 0 else -1,
-                    )
-                )
-
-        return history
+        epoch = self.KEEPA_EPOCH
+
+        # Data is pairs of [time, price, time, price, ...]; a trailing
+        # unpaired time is dropped by zip
+        return [
+            PricePoint(
+                timestamp=epoch + timedelta(minutes=keepa_time),
+                price_cents=price if price >= 0 else -1,
+            )
+            for keepa_time, price in zip(data[::2], data[1::2])
+            if keepa_time is not None and price is not None
+        ]
 
     def _parse_buy_box(self, product: dict) -> Optional[BuyBoxData]:
         """Parse buy box data from product response."""
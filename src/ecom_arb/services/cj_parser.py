@@ -5,6 +5,7 @@ Parses HTML pages fetched by SerpWatch to extract:
 - Product URLs from search result pages
 """
 
+import asyncio
 import json
 import logging
 import re
@@ -16,6 +17,12 @@ import httpx
 
 logger = logging.getLogger(__name__)
 
+_ZERO = Decimal("0")
+
+# Shared client for SerpWatch HTML fetches (keeps connections alive across calls)
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
 
 class CJParserError(Exception):
     """Exception raised for CJ parsing errors."""
@@ -74,6 +81,63 @@ def extract_product_id(url: str) -> str | None:
     return match.group(1) if match else None
 
 
+def _dec(value: Any) -> Decimal:
+    """Convert a raw CJ numeric value to Decimal.
+
+    Floats go through repr, the shortest string that round-trips, so 1.005
+    stays 1.005 instead of being rounded or picking up binary noise.
+
+    Args:
+        value: int, float, Decimal or numeric string from productDetailData
+
+    Returns:
+        Decimal value as CJ wrote it; zero for None/empty
+    """
+    if value is None or value == "":
+        return _ZERO
+    if type(value) is float:
+        return Decimal(repr(value))
+    return Decimal(value)
+
+
+def _looks_like_html(content: bytes) -> bool:
+    """Check whether a response body is already plain HTML.
+
+    Brotli streams have no magic number, so sniff for markup instead: a
+    decoded page starts with `<` after optional BOM/whitespace.
+    """
+    head = content[:256]
+    if head.startswith(b"\xef\xbb\xbf"):
+        head = head[3:]
+    return head.lstrip()[:1] == b"<"
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared SerpWatch client, creating it on first use.
+
+    A client is bound to the event loop it was created on, so a new one is
+    made if the loop changes (e.g. separate asyncio.run calls in scripts).
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=32),
+        )
+        _client_loop = loop
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared SerpWatch client (call on application shutdown)."""
+    global _client, _client_loop
+    if _client is not None:
+        await _client.aclose()
+    _client = None
+    _client_loop = None
+
+
 async def fetch_html(html_url: str) -> str:
     """Fetch HTML content from SerpWatch storage URL.
 
@@ -94,12 +158,15 @@ async def fetch_html(html_url: str) -> str:
         raise CJParserError("brotli package not installed. Run: pip install brotli") from e
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(html_url)
-            response.raise_for_status()
-
-            # Try Brotli decompression first, fall back to raw content
-            # SerpWatch may or may not compress depending on the response
+        response = await _get_client().get(html_url)
+        response.raise_for_status()
+
+        # SerpWatch may or may not compress depending on the response, and httpx
+        # already decodes `Content-Encoding: br`. Only attempt Brotli when the
+        # body doesn't already look like markup.
+        if _looks_like_html(response.content):
+            html = response.text
+        else:
             try:
                 html = brotli.decompress(response.content).decode("utf-8")
                 logger.debug(f"Decompressed Brotli content from {html_url}")
@@ -108,7 +175,7 @@ async def fetch_html(html_url: str) -> str:
                 logger.debug(f"Brotli decompression failed ({decomp_err}), using raw content")
                 html = response.text
 
-            return html
+        return html
 
     except httpx.HTTPError as e:
         raise CJParserError(f"Failed to fetch HTML: {e}") from e
@@ -116,44 +183,90 @@ async def fetch_html(html_url: str) -> str:
         raise CJParserError(f"Error processing HTML: {e}") from e
 
 
-def _extract_json_with_balanced_braces(text: str, start_pos: int) -> str:
+_BRACE_RE = re.compile(r"[{}]")
+
+
+def _extract_json_with_balanced_braces(
+    text: str, start_pos: int, max_len: int = 4_000_000
+) -> str:
     """Extract JSON object using balanced brace matching.
 
     Args:
         text: The full text containing JSON
         start_pos: Position of the opening brace
+        max_len: Maximum object length to scan before giving up, so a corrupt
+            page with an unbalanced brace fails fast
 
     Returns:
-        The extracted JSON string
+        The extracted JSON string, or "" if no balanced object is found
+        within max_len characters
     """
     depth = 0
     end_pos = start_pos
 
-    for i, char in enumerate(text[start_pos:], start_pos):
-        if char == "{":
+    # Jump between braces with the C regex scanner instead of a per-char Python loop
+    for match in _BRACE_RE.finditer(text, start_pos, start_pos + max_len):
+        if match.group() == "{":
             depth += 1
-        elif char == "}":
+        else:
             depth -= 1
             if depth == 0:
-                end_pos = i + 1
+                end_pos = match.end()
                 break
 
     return text[start_pos:end_pos]
 
 
+# Single-pass JS fix-ups: `: undefined` -> `: null` and trailing commas (common in JS)
+_JSFIX = re.compile(r":(\s*)undefined|,(\s*[}\]])")
+
+
+def _js_fix_sub(match: re.Match[str]) -> str:
+    if match.group(1) is not None:
+        return ":" + match.group(1) + "null"
+    return match.group(2)
+
+
+# JS string literals: double-quoted ones are matched only so their contents
+# (e.g. "Men's") are skipped; single-quoted ones are captured for conversion
+_JS_STRING = re.compile(r'"(?:[^"\\]|\\.)*"|\'((?:[^\'\\]|\\.)*)\'', re.DOTALL)
+# A single quote opening a value or key; cheap gate for the string-aware pass
+_JS_SINGLE_QUOTE_HINT = re.compile(r"[:,\[{]\s*'")
+_JS_ESCAPE = re.compile(r'\\.|"', re.DOTALL)
+
+
+def _js_escape_sub(match: re.Match[str]) -> str:
+    token = match.group()
+    if token == '"':
+        return '\\"'
+    if token == "\\'":
+        return "'"
+    return token
+
+
+def _js_string_sub(match: re.Match[str]) -> str:
+    body = match.group(1)
+    if body is None:
+        return match.group()
+    return '"' + _JS_ESCAPE.sub(_js_escape_sub, body) + '"'
+
+
 def _fix_javascript_json(json_str: str) -> str:
     """Fix JavaScript-specific syntax to valid JSON.
 
+    Rewrites `undefined`, trailing commas and, only when the payload has any,
+    single-quoted strings (the string-aware pass is skipped otherwise, since
+    it visits every string literal).
+
     Args:
         json_str: JavaScript object literal string
 
     Returns:
         Valid JSON string
     """
-    # Replace undefined with null
-    json_str = re.sub(r":(\s*)undefined", r":\1null", json_str)
-    # Remove trailing commas (common in JS)
-    json_str = re.sub(r",(\s*[}\]])", r"\1", json_str)
+    json_str = _JSFIX.sub(_js_fix_sub, json_str)
+    if _JS_SINGLE_QUOTE_HINT.search(json_str):
+        json_str = _JS_STRING.sub(_js_string_sub, json_str)
     return json_str
 
 
@@ -327,11 +440,11 @@ def transform_cj_data(data: dict[str, Any]) -> CJProductData:
     # Extract pricing - handle None and invalid values
     sell_price = data.get("sellPrice") or data.get("sellPriceMin") or 0
     try:
-        sell_price_min = Decimal(str(data.get("sellPriceMin") or sell_price or 0))
+        sell_price_min = _dec(data.get("sellPriceMin") or sell_price)
     except Exception:
-        sell_price_min = Decimal("0")
+        sell_price_min = _ZERO
     try:
-        sell_price_max = Decimal(str(data.get("sellPriceMax") or sell_price or 0))
+        sell_price_max = _dec(data.get("sellPriceMax") or sell_price)
     except Exception:
         sell_price_max = sell_price_min
 
@@ -372,17 +485,30 @@ def transform_cj_data(data: dict[str, Any]) -> CJProductData:
     # Extract variants
     variants = []
     variant_data = data.get("variants", data.get("variantList", []))
+    # Bind lookups to locals: variant lists can run to hundreds of entries
+    append = variants.append
+    dec = _dec
     for var in variant_data:
         if isinstance(var, dict):
-            variant = CJVariant(
-                sku=var.get("sku", var.get("variantSku", "")),
-                sell_price=Decimal(str(var.get("sellPrice", var.get("variantSellPrice", 0)))),
-                retail_price=Decimal(str(var.get("retailPrice", 0))) if var.get("retailPrice") else None,
-                weight=int(var.get("weight", var.get("variantWeight", 0))) if var.get("weight") or var.get("variantWeight") else None,
-                pack_weight=int(var.get("packWeight", 0)) if var.get("packWeight") else None,
-                vid=var.get("vid", var.get("variantId")),
+            g = var.get
+            retail_price = g("retailPrice")
+            weight = g("weight")
+            variant_weight = g("variantWeight")
+            pack_weight = g("packWeight")
+            append(
+                CJVariant(
+                    sku=g("sku", g("variantSku", "")),
+                    sell_price=dec(g("sellPrice", g("variantSellPrice", 0))),
+                    retail_price=dec(retail_price) if retail_price else None,
+                    weight=(
+                        int(g("weight", variant_weight))
+                        if weight or variant_weight
+                        else None
+                    ),
+                    pack_weight=int(pack_weight) if pack_weight else None,
+                    vid=g("vid", g("variantId")),
+                )
             )
-            variants.append(variant)
 
     # Extract warehouse/shipping info
     warehouse_country = data.get("warehouseCountry", data.get("warehouseCountryCode"))
@@ -12,6 +12,7 @@ import asyncio
 import logging
 from dataclasses import dataclass
 from decimal import Decimal
+from functools import lru_cache
 from typing import Optional
 
 from ecom_arb.integrations.cj_dropshipping import (
@@ -90,6 +91,28 @@ CJ_CATEGORY_MAP: dict[str, ProductCategory] = {
 }
 
 
+@lru_cache(maxsize=512)
+def _match_category(cj_category: str) -> ProductCategory:
+    """Resolve a raw CJ category name to a scoring ProductCategory.
+
+    Cached because many products share a category name, so the lowercasing
+    and partial-match scan run once per distinct name.
+    """
+    category_lower = cj_category.lower()
+
+    # Try direct match
+    if category_lower in CJ_CATEGORY_MAP:
+        return CJ_CATEGORY_MAP[category_lower]
+
+    # Try partial match
+    for key, value in CJ_CATEGORY_MAP.items():
+        if key in category_lower or category_lower in key:
+            return value
+
+    # Default to home decor (medium risk)
+    return ProductCategory.HOME_DECOR
+
+
 @dataclass
 class DiscoveredProduct:
     """Product with enriched data from all sources."""
@@ -176,8 +199,9 @@ class DiscoveryService:
 
     Usage:
         service = DiscoveryService(cj_config, keepa_config, google_ads_config)
-        products = service.discover_products(category="pet", limit=50)
+        products = await service.discover_products(category="pet", limit=50)
         scoring_products = [p.to_scoring_product() for p in products]
+        service.close()
     """
 
     # Default markup from CJ cost to selling price
@@ -207,19 +231,7 @@ class DiscoveryService:
 
     def _map_category(self, cj_category: str) -> ProductCategory:
         """Map CJ category to scoring ProductCategory."""
-        category_lower = cj_category.lower()
-
-        # Try direct match
-        if category_lower in CJ_CATEGORY_MAP:
-            return CJ_CATEGORY_MAP[category_lower]
-
-        # Try partial match
-        for key, value in CJ_CATEGORY_MAP.items():
-            if key in category_lower or category_lower in key:
-                return value
-
-        # Default to home decor (medium risk)
-        return ProductCategory.HOME_DECOR
+        return _match_category(cj_category)
 
     def _calculate_selling_price(self, cj_product: CJProduct) -> Decimal:
         """Calculate selling price with markup."""
@@ -229,7 +241,24 @@ class DiscoveryService:
         rounded = int(base_price) + Decimal("0.99")
         return rounded
 
-    def discover_products(
+    def _cheapest_freight(self, product_id: str) -> Optional[FreightOption]:
+        """Fetch US freight options for a product and pick the cheapest (blocking)."""
+        freight_options = self.cj_client.calculate_freight(
+            product_id=product_id,
+            quantity=1,
+            country_code="US",
+        )
+        return min(freight_options, key=lambda f: f.price) if freight_options else None
+
+    async def _freight_async(self, product_id: str) -> Optional[FreightOption]:
+        """Get cheapest freight off the event loop, returning None on failure."""
+        try:
+            return await asyncio.to_thread(self._cheapest_freight, product_id)
+        except Exception as e:
+            logger.warning(f"Failed to get freight for {product_id}: {e}")
+            return None
+
+    async def discover_products(
         self,
         category: Optional[str] = None,
         limit: int = 50,
@@ -249,7 +278,8 @@ class DiscoveryService:
         """
         # Fetch products from CJ
         logger.info(f"Fetching products from CJ (category={category}, limit={limit})")
-        cj_products = self.cj_client.get_products(
+        cj_products = await asyncio.to_thread(
+            self.cj_client.get_products,
             category_id=category,
             page_size=min(limit, 100),
         )
@@ -260,22 +290,12 @@ class DiscoveryService:
 
         logger.info(f"Found {len(cj_products)} products from CJ")
 
-        # Get freight for each product
-        products_with_freight: list[tuple[CJProduct, Optional[FreightOption]]] = []
-        for product in cj_products[:limit]:
-            try:
-                freight_options = self.cj_client.calculate_freight(
-                    product_id=product.pid,
-                    quantity=1,
-                    country_code="US",
-                )
-                # Pick cheapest option
-                freight = min(freight_options, key=lambda f: f.price) if freight_options else None
-            except Exception as e:
-                logger.warning(f"Failed to get freight for {product.pid}: {e}")
-                freight = None
-
-            products_with_freight.append((product, freight))
+        # Get freight for each product concurrently
+        cj_products = cj_products[:limit]
+        freights = await asyncio.gather(*(self._freight_async(p.pid) for p in cj_products))
+        products_with_freight: list[tuple[CJProduct, Optional[FreightOption]]] = list(
+            zip(cj_products, freights)
+        )
 
         # Batch enrich with Keepa (Amazon data)
         keepa_data: dict[str, KeepaProduct] = {}
@@ -293,7 +313,9 @@ class DiscoveryService:
 
             try:
                 logger.info(f"Fetching CPC estimates for {len(keywords)} keywords")
-                estimates = self.google_ads_client.get_keyword_cpc_estimates(keywords)
+                estimates = await asyncio.to_thread(
+                    self.google_ads_client.get_keyword_cpc_estimates, keywords
+                )
                 for est in estimates:
                     cpc_data[est.keyword.lower()] = est
             except GoogleAdsError as e:
@@ -324,7 +346,7 @@ class DiscoveryService:
         logger.info(f"Discovered {len(discovered)} products")
         return discovered
 
-    def discover_by_keywords(
+    async def discover_by_keywords(
         self,
         keywords: list[str],
         limit_per_keyword: int = 10,
@@ -344,30 +366,23 @@ class DiscoveryService:
             logger.info(f"Searching for keyword: {keyword}")
             try:
                 # Search CJ by keyword
-                cj_products = self.cj_client.search_products(
+                cj_products = await asyncio.to_thread(
+                    self.cj_client.search_products,
                     keyword=keyword,
                     page_size=limit_per_keyword,
                 )
 
+                # Skip duplicates, then fetch freight for the rest concurrently
+                new_products: dict[str, CJProduct] = {}
                 for cj_product in cj_products:
-                    if cj_product.pid in all_products:
-                        continue  # Skip duplicates
-
-                    # Get freight
-                    try:
-                        freight_options = self.cj_client.calculate_freight(
-                            product_id=cj_product.pid,
-                            quantity=1,
-                            country_code="US",
-                        )
-                        freight = (
-                            min(freight_options, key=lambda f: f.price)
-                            if freight_options
-                            else None
-                        )
-                    except Exception:
-                        freight = None
+                    if cj_product.pid not in all_products:
+                        new_products.setdefault(cj_product.pid, cj_product)
+
+                freights = await asyncio.gather(
+                    *(self._freight_async(pid) for pid in new_products)
+                )
 
+                for cj_product, freight in zip(new_products.values(), freights):
                     category = self._map_category(cj_product.category_name)
                     selling_price = self._calculate_selling_price(cj_product)
 
@@ -431,5 +446,6 @@ class DiscoveryService:
 
     def close(self):
         """Close API clients."""
+        self.cj_client.close()
         if self.keepa_client:
             self.keepa_client.close()
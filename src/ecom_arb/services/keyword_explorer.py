@@ -1,6 +1,6 @@
 """Keyword exploration service for product advertising.
 
-Recursively explores Google Ads Keyword Planner to find optimal keywords:
+Iteratively explores Google Ads Keyword Planner to find optimal keywords:
 - Start with LLM-generated seed keywords
 - Expand through related keywords
 - Score relevance with LLM
@@ -8,9 +8,20 @@ Recursively explores Google Ads Keyword Planner to find optimal keywords:
 """
 
 import asyncio
+import hashlib
+import heapq
 import logging
+import math
+import re
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from decimal import Decimal
+from functools import cached_property, lru_cache
+from operator import attrgetter
 from typing import Any
 
 from ecom_arb.config import get_settings
@@ -28,7 +39,228 @@ from ecom_arb.services.llm_analyzer import (
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# Filler words ignored when matching near-duplicate keywords
+_KEYWORD_STOPWORDS = frozenset({"a", "an", "and", "for", "in", "of", "on", "the", "to", "with"})
+_KEYWORD_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+@lru_cache(maxsize=16384)
+def _canonical_keyword(keyword: str) -> str:
+    """Lexical key for near-duplicate keywords.
+
+    Lowercases and drops filler words and naive plurals, keeping word order,
+    so "running shoes" and "the running shoe" share a key while "dog bed for
+    cats" and "cat bed for dogs" do not. Memoized, since the same keywords
+    recur across products and every cached row is re-keyed on near-duplicate
+    lookups.
+    """
+    tokens = []
+    for token in _KEYWORD_TOKEN_RE.findall(keyword.lower()):
+        if token in _KEYWORD_STOPWORDS:
+            continue
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.append(token)
+    return " ".join(tokens)
+
+
+class ScoreCache:
+    """Persistent keyword relevance cache backed by SQLite.
+
+    Scores are keyed by (product fingerprint, keyword), so re-exploring the
+    same product - or products with overlapping keywords - skips the LLM for
+    anything already scored. Methods are blocking and thread-safe; the
+    explorer calls them via asyncio.to_thread.
+    """
+
+    # Stay well under SQLite's host-parameter limit for IN (...) lookups
+    _MAX_PARAMS = 500
+
+    def __init__(self, path: str):
+        """Open (or create) the cache database.
+
+        Args:
+            path: SQLite database file path
+        """
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS scores (
+                product_hash TEXT NOT NULL,
+                keyword TEXT NOT NULL,
+                relevance INTEGER NOT NULL,
+                reason TEXT NOT NULL,
+                PRIMARY KEY (product_hash, keyword)
+            )
+            """
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def fingerprint(product_understanding: ProductUnderstanding, model: str | None = None) -> str:
+        """Hash the scoring model and the product description it sees.
+
+        Args:
+            product_understanding: Product the keywords are scored against
+            model: OpenRouter model id (defaults to the model
+                score_keyword_relevance uses), so switching models never
+                serves another model's scores
+        """
+        if model is None:
+            settings = get_settings()
+            model = settings.openrouter_model_fast or settings.openrouter_model
+        digest = hashlib.blake2b(model.encode(), digest_size=16)
+        digest.update(b"\0")
+        digest.update(product_understanding.prompt_prefix.encode())
+        return digest.hexdigest()
+
+    def get_many(self, product_hash: str, keywords: list[str]) -> dict[str, dict]:
+        """Look up cached scores.
+
+        Returns dict mapping keyword -> {relevance, reason} for cache hits only.
+        """
+        result: dict[str, dict] = {}
+        for i in range(0, len(keywords), self._MAX_PARAMS):
+            batch = keywords[i:i + self._MAX_PARAMS]
+            placeholders = ",".join("?" * len(batch))
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT keyword, relevance, reason FROM scores "
+                    f"WHERE product_hash = ? AND keyword IN ({placeholders})",
+                    (product_hash, *batch),
+                ).fetchall()
+            for keyword, relevance, reason in rows:
+                result[keyword] = {"relevance": relevance, "reason": reason}
+        return result
+
+    def get_near_duplicates(self, product_hash: str, keywords: list[str]) -> dict[str, dict]:
+        """Reuse scores of previously scored paraphrases of the given keywords.
+
+        Matches on _canonical_keyword, so only filler-word and plural
+        variants of a cached keyword hit; word order must match.
+
+        Returns dict mapping keyword -> {relevance, reason} for matches only.
+        """
+        wanted: dict[str, list[str]] = {}
+        for keyword in keywords:
+            key = _canonical_keyword(keyword)
+            if key:
+                wanted.setdefault(key, []).append(keyword)
+        if not wanted:
+            return {}
+
+        result: dict[str, dict] = {}
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT keyword, relevance, reason FROM scores WHERE product_hash = ?",
+                (product_hash,),
+            ).fetchall()
+        for cached_keyword, relevance, reason in rows:
+            matches = wanted.pop(_canonical_keyword(cached_keyword), None)
+            if matches:
+                for keyword in matches:
+                    result[keyword] = {"relevance": relevance, "reason": reason}
+                if not wanted:
+                    break
+        return result
+
+    def put_many(self, product_hash: str, scores: dict[str, dict]) -> None:
+        """Store scores (keyword -> {relevance, reason}), replacing existing rows."""
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO scores (product_hash, keyword, relevance, reason) "
+                "VALUES (?, ?, ?, ?)",
+                [
+                    (product_hash, keyword, score["relevance"], score["reason"])
+                    for keyword, score in scores.items()
+                ],
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+@lru_cache
+def _default_score_cache() -> ScoreCache | None:
+    """Shared ScoreCache from settings (None if disabled or unavailable)."""
+    path = get_settings().keyword_score_cache_path
+    if not path:
+        return None
+    try:
+        return ScoreCache(path)
+    except sqlite3.Error as e:
+        logger.warning(f"Keyword score cache unavailable ({path}): {e}")
+        return None
+
+
+class EstimateCache:
+    """In-memory TTL + LRU cache of Keyword Planner results.
+
+    Keyed by the sorted, lowercased seed set, since Google Ads returns the
+    same ideas for a seed set within a short window. Lets explorations of
+    related products (e.g. variants of one SKU) skip repeat RPCs.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600.0):
+        """Create an empty cache.
+
+        Args:
+            maxsize: Max seed sets kept before evicting the least recently used
+            ttl: Seconds an entry stays valid
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[tuple[str, ...], tuple[float, list[CPCEstimate]]] = OrderedDict()
+
+    @staticmethod
+    def key(keywords: list[str]) -> tuple[str, ...]:
+        """Order- and case-insensitive key for a seed list."""
+        return tuple(sorted({k.lower() for k in keywords}))
+
+    def get(self, key: tuple[str, ...]) -> list[CPCEstimate] | None:
+        """Return cached estimates for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, estimates = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return list(estimates)
+
+    def put(self, key: tuple[str, ...], estimates: list[CPCEstimate]) -> None:
+        """Store estimates for key, evicting the oldest entry when full."""
+        self._entries[key] = (time.monotonic() + self.ttl, list(estimates))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+
+# Shared across explorers: one is built per request, so a per-instance cache never hits
+_estimate_cache = EstimateCache()
+
+
+def _coerce_relevance(value: Any) -> int:
+    """Parse an LLM relevance score to int, falling back to 0."""
+    try:
+        score = float(value)
+    except (TypeError, ValueError):
+        return 0
+    return int(score) if math.isfinite(score) else 0
+
+
+@dataclass(slots=True, frozen=True)
 class KeywordOpportunity:
     """A keyword with advertising metrics and relevance."""
 
@@ -41,9 +273,20 @@ class KeywordOpportunity:
     tier: str  # exact, specific, broad
     source: str  # seed, expanded, related
     depth: int  # 0 = seed, 1+ = expansion depth
+    # Derived once in __post_init__ (instances are frozen)
+    opportunity_score: float = field(init=False, repr=False, compare=False)
+    kw_key: str = field(init=False, repr=False, compare=False)  # Lowercased dedup key
+
+    def __post_init__(self):
+        # LLM scores may arrive as floats, strings, None or drift out of range;
+        # store a compact 0-100 int (0 when unparseable)
+        object.__setattr__(
+            self, "relevance_score", min(max(_coerce_relevance(self.relevance_score), 0), 100)
+        )
+        object.__setattr__(self, "opportunity_score", self._compute_opportunity_score())
+        object.__setattr__(self, "kw_key", sys.intern(self.keyword.lower()))
 
-    @property
-    def opportunity_score(self) -> float:
+    def _compute_opportunity_score(self) -> float:
         """Combined score factoring volume, CPC efficiency, and relevance.
 
         Higher is better:
@@ -55,7 +298,6 @@ class KeywordOpportunity:
             return 0.0
 
         # Volume factor (log scale to handle wide range)
-        import math
         volume_factor = math.log10(max(self.monthly_volume, 10)) / 6  # Normalize ~0-1
 
         # CPC efficiency (inverse, capped)
@@ -72,32 +314,71 @@ class KeywordOpportunity:
         ) * 100
 
 
+def _make_opportunity(
+    estimate: CPCEstimate,
+    relevance: dict[str, Any],
+    tier: str,
+    source: str,
+    depth: int,
+) -> KeywordOpportunity:
+    """Build a KeywordOpportunity from an Ads estimate and its LLM score."""
+    return KeywordOpportunity(
+        keyword=estimate.keyword,
+        monthly_volume=estimate.avg_monthly_searches,
+        avg_cpc=float(estimate.avg_cpc),
+        competition=estimate.competition,
+        relevance_score=relevance["relevance"],
+        relevance_reason=relevance["reason"],
+        tier=tier,
+        source=source,
+        depth=depth,
+    )
+
+
+_opportunity_score = attrgetter("opportunity_score")
+_monthly_searches = attrgetter("avg_monthly_searches")
+
+# Bulk field extraction for ExplorationResult.to_dict
+_top_fields = attrgetter(
+    "keyword", "monthly_volume", "avg_cpc", "relevance_score", "opportunity_score", "tier"
+)
+_TIER_KEYS = ("keyword", "volume", "cpc", "relevance", "reason")
+_tier_fields = attrgetter(
+    "keyword", "monthly_volume", "avg_cpc", "relevance_score", "relevance_reason"
+)
+
+
 @dataclass
 class ExplorationResult:
     """Results from keyword exploration."""
 
-    keywords: list[KeywordOpportunity]
+    keywords: tuple[KeywordOpportunity, ...]
     total_explored: int
     depth_reached: int
     errors: list[str] = field(default_factory=list)
 
-    @property
+    def __post_init__(self):
+        # Frozen into a tuple so the cached views below can't go stale
+        self.keywords = tuple(self.keywords)
+
+    @cached_property
     def by_tier(self) -> dict[str, list[KeywordOpportunity]]:
-        """Group keywords by tier."""
+        """Group keywords by tier (computed once per result)."""
         result: dict[str, list[KeywordOpportunity]] = {
             "exact": [],
             "specific": [],
             "broad": [],
         }
         for kw in self.keywords:
-            if kw.tier in result:
-                result[kw.tier].append(kw)
+            bucket = result.get(kw.tier)
+            if bucket is not None:
+                bucket.append(kw)
         return result
 
-    @property
+    @cached_property
     def top_opportunities(self) -> list[KeywordOpportunity]:
-        """Top 10 keywords by opportunity score."""
-        return sorted(self.keywords, key=lambda k: k.opportunity_score, reverse=True)[:10]
+        """Top 10 keywords by opportunity score (computed once per result)."""
+        return heapq.nlargest(10, self.keywords, key=_opportunity_score)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dict for JSON serialization."""
@@ -108,24 +389,20 @@ class ExplorationResult:
             "errors": self.errors,
             "top_opportunities": [
                 {
-                    "keyword": k.keyword,
-                    "volume": k.monthly_volume,
-                    "cpc": k.avg_cpc,
-                    "relevance": k.relevance_score,
-                    "opportunity_score": round(k.opportunity_score, 1),
-                    "tier": k.tier,
+                    "keyword": keyword,
+                    "volume": volume,
+                    "cpc": cpc,
+                    "relevance": relevance,
+                    "opportunity_score": round(score, 1),
+                    "tier": tier,
                 }
-                for k in self.top_opportunities
+                for keyword, volume, cpc, relevance, score, tier in map(
+                    _top_fields, self.top_opportunities
+                )
             ],
             "by_tier": {
                 tier: [
-                    {
-                        "keyword": k.keyword,
-                        "volume": k.monthly_volume,
-                        "cpc": k.avg_cpc,
-                        "relevance": k.relevance_score,
-                        "reason": k.relevance_reason,
-                    }
+                    dict(zip(_TIER_KEYS, _tier_fields(k)))
                     for k in keywords
                 ]
                 for tier, keywords in self.by_tier.items()
@@ -147,12 +424,18 @@ class KeywordExplorer:
     5. Return prioritized opportunity map
     """
 
+    # Max concurrent LLM scoring calls per explorer (OpenRouter rate limits)
+    MAX_CONCURRENT_SCORING = 4
+    # Max concurrent Keyword Planner requests per explorer (Google Ads quota)
+    MAX_CONCURRENT_ADS_REQUESTS = 2
+
     def __init__(
         self,
         google_ads_client: GoogleAdsClient | None = None,
         max_depth: int = 2,
         min_relevance: int = 50,
         max_keywords_per_tier: int = 20,
+        score_cache: ScoreCache | None = None,
     ):
         """Initialize keyword explorer.
 
@@ -161,10 +444,21 @@ class KeywordExplorer:
             max_depth: Maximum expansion depth (0 = seeds only)
             min_relevance: Minimum LLM relevance score to keep
             max_keywords_per_tier: Max keywords to keep per tier
+            score_cache: Relevance score cache (defaults to the shared
+                cache configured by KEYWORD_SCORE_CACHE_PATH)
         """
         self.max_depth = max_depth
         self.min_relevance = min_relevance
         self.max_keywords_per_tier = max_keywords_per_tier
+        self.score_cache = score_cache if score_cache is not None else _default_score_cache()
+        self._scoring_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SCORING)
+        self._ads_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_ADS_REQUESTS)
+        # Dedicated threads for blocking Ads RPCs, so they never queue behind
+        # (or starve) other work on the default executor
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.MAX_CONCURRENT_ADS_REQUESTS,
+            thread_name_prefix="kwexpl-ads",
+        )
 
         if google_ads_client:
             self.google_client = google_ads_client
@@ -183,6 +477,10 @@ class KeywordExplorer:
             else:
                 self.google_client = None
 
+    def close(self) -> None:
+        """Release the explorer's Ads thread pool."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
     async def explore(
         self,
         product_understanding: ProductUnderstanding,
@@ -204,79 +502,45 @@ class KeywordExplorer:
             logger.info("max_depth=0, skipping Google Ads - returning seed keywords with LLM scoring only")
             return await self._explore_without_google(product_understanding)
 
-        all_keywords: dict[str, KeywordOpportunity] = {}
-        explored_count = 0
-        max_depth_reached = 0
-        errors: list[str] = []
-
         # Get seed keywords from product understanding
         seed_keywords = product_understanding.seed_keywords
 
-        # Process each tier
-        for tier, keywords in seed_keywords.items():
-            if not keywords:
-                continue
-
-            logger.info(f"Exploring {tier} tier: {len(keywords)} seeds")
-
-            # Depth 0: Query seeds
-            try:
-                estimates = self._get_keyword_estimates(keywords)
-                explored_count += len(keywords)
-
-                # Take only top 10 by volume for quick analysis
-                # Deep analysis can be triggered manually for promising products
-                sorted_estimates = sorted(estimates, key=lambda e: e.avg_monthly_searches, reverse=True)
-                top_estimates = sorted_estimates[:10]
-
-                # Score relevance with LLM (just 10 keywords = 1 LLM call)
-                scored = await self._score_keywords(
-                    [e.keyword for e in top_estimates],
-                    product_understanding,
+        # Seeds repeated across tiers are only queried for the first (most specific) tier
+        queried_seeds: set[str] = set()
+        tier_seeds: dict[str, list[str]] = {}
+        for tier, seeds in seed_keywords.items():
+            keywords = []
+            for kw in seeds:
+                kw_key = kw.lower()
+                if kw_key not in queried_seeds:
+                    queried_seeds.add(kw_key)
+                    keywords.append(kw)
+            if keywords:
+                tier_seeds[tier] = keywords
+
+        # Tiers are explored concurrently; keywords surfaced by several tiers
+        # are scored once and shared through this map
+        shared_scores: dict[str, asyncio.Future] = {}
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(
+                    self._process_tier(tier, keywords, product_understanding, shared_scores)
                 )
+                for tier, keywords in tier_seeds.items()
+            ]
 
-                estimates = top_estimates
-
-                # Build opportunities
-                for estimate in estimates:
-                    relevance = scored.get(estimate.keyword, {"relevance": 0, "reason": ""})
-                    if relevance["relevance"] >= self.min_relevance:
-                        kw_key = estimate.keyword.lower()
-                        if kw_key not in all_keywords:
-                            all_keywords[kw_key] = KeywordOpportunity(
-                                keyword=estimate.keyword,
-                                monthly_volume=estimate.avg_monthly_searches,
-                                avg_cpc=float(estimate.avg_cpc),
-                                competition=estimate.competition,
-                                relevance_score=relevance["relevance"],
-                                relevance_reason=relevance["reason"],
-                                tier=tier,
-                                source="seed",
-                                depth=0,
-                            )
-
-                # Recursive expansion for deep analysis (max_depth > 1)
-                if self.max_depth > 1:
-                    deeper = await self._expand_keywords(
-                        estimates,
-                        product_understanding,
-                        tier,
-                        1,  # current_depth
-                        all_keywords,
-                    )
-                    explored_count += deeper
-                    max_depth_reached = max(max_depth_reached, self.max_depth)
-                else:
-                    max_depth_reached = 1
-
-            except GoogleAdsError as e:
-                error_msg = f"Google Ads error for {tier} tier: {str(e)}"
-                logger.warning(error_msg)
-                errors.append(error_msg)
-            except Exception as e:
-                error_msg = f"Error exploring {tier} tier: {str(e)}"
-                logger.exception(error_msg)
-                errors.append(error_msg)
+        # Merge in tier order so earlier (more specific) tiers keep shared keywords
+        all_keywords: dict[str, KeywordOpportunity] = {}
+        explored_count = 0
+        max_depth_reached = 0
+        errors: list[str] = []
+        for task in tasks:
+            tier_keywords, explored, depth_reached, tier_errors = task.result()
+            for kw_key, opportunity in tier_keywords.items():
+                all_keywords.setdefault(kw_key, opportunity)
+            explored_count += explored
+            max_depth_reached = max(max_depth_reached, depth_reached)
+            errors.extend(tier_errors)
 
         # Sort by opportunity score and limit per tier
         result_keywords = self._limit_by_tier(list(all_keywords.values()))
@@ -288,6 +552,87 @@ class KeywordExplorer:
             errors=errors,
         )
 
+    async def _process_tier(
+        self,
+        tier: str,
+        keywords: list[str],
+        product_understanding: ProductUnderstanding,
+        shared_scores: dict[str, asyncio.Future] | None = None,
+    ) -> tuple[dict[str, KeywordOpportunity], int, int, list[str]]:
+        """Query, score and expand the seeds of a single tier.
+
+        Errors are caught and reported per tier so one failing tier never
+        cancels the others. shared_scores dedupes LLM scoring across tiers
+        (see _score_keywords).
+
+        Returns:
+            Tuple of (opportunities by lowercased keyword, keywords explored,
+            depth reached, errors)
+        """
+        tier_keywords: dict[str, KeywordOpportunity] = {}
+        # Lowercased keywords already scored in this tier (kept or not), so
+        # expansion never re-scores them
+        seen: set[str] = set()
+        explored_count = 0
+        depth_reached = 0
+        errors: list[str] = []
+
+        logger.info(f"Exploring {tier} tier: {len(keywords)} seeds")
+
+        # Depth 0: Query seeds
+        try:
+            estimates = await self._get_keyword_estimates(keywords)
+            explored_count += len(keywords)
+
+            # Take only top 10 by volume for quick analysis
+            # Deep analysis can be triggered manually for promising products
+            top_estimates = heapq.nlargest(10, estimates, key=_monthly_searches)
+
+            # Score relevance with LLM (just 10 keywords = 1 LLM call)
+            scored = await self._score_keywords(
+                [e.keyword for e in top_estimates],
+                product_understanding,
+                shared_scores,
+            )
+
+            seen.update(e.kw_key for e in top_estimates)
+
+            # Build opportunities
+            for estimate in top_estimates:
+                relevance = scored.get(estimate.keyword, {"relevance": 0, "reason": ""})
+                if relevance["relevance"] >= self.min_relevance:
+                    tier_keywords.setdefault(
+                        estimate.kw_key,
+                        _make_opportunity(estimate, relevance, tier, "seed", 0),
+                    )
+
+            # Expansion for deep analysis (max_depth > 1)
+            if self.max_depth > 1:
+                deeper = await self._expand_keywords(
+                    top_estimates,
+                    product_understanding,
+                    tier,
+                    1,  # current_depth
+                    tier_keywords,
+                    seen,
+                    shared_scores,
+                )
+                explored_count += deeper
+                depth_reached = self.max_depth
+            else:
+                depth_reached = 1
+
+        except GoogleAdsError as e:
+            error_msg = f"Google Ads error for {tier} tier: {str(e)}"
+            logger.warning(error_msg)
+            errors.append(error_msg)
+        except Exception as e:
+            error_msg = f"Error exploring {tier} tier: {str(e)}"
+            logger.exception(error_msg)
+            errors.append(error_msg)
+
+        return tier_keywords, explored_count, depth_reached, errors
+
     async def _explore_without_google(
         self,
         product_understanding: ProductUnderstanding,
@@ -318,10 +663,12 @@ class KeywordExplorer:
             errors=["Google Ads client not configured"],
         )
 
-    def _get_keyword_estimates(self, keywords: list[str]) -> list[CPCEstimate]:
+    async def _get_keyword_estimates(self, keywords: list[str]) -> list[CPCEstimate]:
         """Get keyword estimates from Google Ads.
 
         The Keyword Planner returns related keywords beyond just the input.
+        The client call is a blocking gRPC request, so it runs on the
+        explorer's thread pool to keep the event loop free.
         """
         if not keywords:
             return []
@@ -329,8 +676,18 @@ class KeywordExplorer:
         # Limit to avoid quota issues
         keywords = keywords[:10]
 
+        cache_key = EstimateCache.key(keywords)
+        cached = _estimate_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            return self.google_client.get_keyword_cpc_estimates(keywords)
+            async with self._ads_semaphore:
+                estimates = await asyncio.get_running_loop().run_in_executor(
+                    self._pool, self.google_client.get_keyword_cpc_estimates, keywords
+                )
+            _estimate_cache.put(cache_key, estimates)
+            return estimates
         except GoogleAdsError:
             raise
         except Exception as e:
@@ -341,30 +698,104 @@ class KeywordExplorer:
         self,
         keywords: list[str],
         product_understanding: ProductUnderstanding,
+        shared_scores: dict[str, asyncio.Future] | None = None,
+    ) -> dict[str, dict]:
+        """Score keywords for relevance, at most once per exploration.
+
+        Keywords are claimed in shared_scores (keyword -> future score) before
+        scoring; keywords another tier already claimed are awaited instead of
+        being sent to the LLM again. Claiming never awaits, so it is atomic on
+        the event loop.
+
+        Returns dict mapping keyword -> {relevance, reason}
+        """
+        if shared_scores is None:
+            return await self._fetch_scores(keywords, product_understanding)
+
+        loop = asyncio.get_running_loop()
+        claimed: list[str] = []
+        pending: dict[str, asyncio.Future] = {}
+        for kw in dict.fromkeys(keywords):
+            future = shared_scores.get(kw)
+            if future is None:
+                shared_scores[kw] = loop.create_future()
+                claimed.append(kw)
+            else:
+                pending[kw] = future
+
+        result: dict[str, dict] = {}
+        try:
+            result = await self._fetch_scores(claimed, product_understanding)
+        finally:
+            # Always resolve claims (None = unscored) so waiting tiers never hang
+            for kw in claimed:
+                shared_scores[kw].set_result(result.get(kw))
+
+        for kw, future in pending.items():
+            score = await future
+            if score is not None:
+                result[kw] = score
+        return result
+
+    async def _fetch_scores(
+        self,
+        keywords: list[str],
+        product_understanding: ProductUnderstanding,
     ) -> dict[str, dict]:
-        """Score keywords for relevance using LLM.
+        """Score keywords from the score cache, falling back to the LLM.
 
         Returns dict mapping keyword -> {relevance, reason}
         """
         if not keywords:
             return {}
 
-        # Batch in groups of 15 (keep responses within token limits)
-        result = {}
-        for i in range(0, len(keywords), 15):
-            batch = keywords[i:i + 15]
-            try:
-                scores = await score_keyword_relevance(batch, product_understanding)
-                for score in scores:
-                    result[score.keyword] = {
-                        "relevance": score.relevance,
-                        "reason": score.reason,
-                    }
-            except Exception as e:
-                logger.warning(f"Failed to score keywords: {e}")
-                # Return neutral scores on failure
+        result: dict[str, dict] = {}
+
+        # Serve previously scored keywords from the cache, only send misses to the LLM
+        product_hash = None
+        if self.score_cache is not None:
+            product_hash = ScoreCache.fingerprint(product_understanding)
+            result.update(
+                await asyncio.to_thread(self.score_cache.get_many, product_hash, keywords)
+            )
+            keywords = [kw for kw in keywords if kw not in result]
+            if keywords:
+                result.update(await asyncio.to_thread(
+                    self.score_cache.get_near_duplicates, product_hash, keywords
+                ))
+                keywords = [kw for kw in keywords if kw not in result]
+            if not keywords:
+                return result
+
+        # Batch in groups of 15 (keep responses within token limits), scored concurrently
+        batches = [keywords[i:i + 15] for i in range(0, len(keywords), 15)]
+
+        async def score_batch(batch: list[str]):
+            async with self._scoring_semaphore:
+                return await score_keyword_relevance(batch, product_understanding)
+
+        batch_results = await asyncio.gather(
+            *(score_batch(batch) for batch in batches),
+            return_exceptions=True,
+        )
+
+        fresh: dict[str, dict] = {}
+        for batch, scores in zip(batches, batch_results):
+            if isinstance(scores, BaseException):
+                logger.warning(f"Failed to score keywords: {scores}")
+                # Return neutral scores on failure (not cached)
                 for kw in batch:
                     result[kw] = {"relevance": 50, "reason": "Scoring failed"}
+                continue
+            for score in scores:
+                fresh[score.keyword] = {
+                    "relevance": _coerce_relevance(score.relevance),
+                    "reason": score.reason,
+                }
+
+        if product_hash is not None and fresh:
+            await asyncio.to_thread(self.score_cache.put_many, product_hash, fresh)
+        result.update(fresh)
 
         return result
 
@@ -375,75 +806,69 @@ class KeywordExplorer:
         tier: str,
         current_depth: int,
         all_keywords: dict[str, KeywordOpportunity],
+        seen: set[str],
+        shared_scores: dict[str, asyncio.Future] | None = None,
     ) -> int:
-        """Recursively expand into related keywords.
+        """Expand into related keywords, one depth level per iteration.
+
+        Each level sends its top seeds to Google Ads in one call and scores all
+        new related keywords in one LLM pass; highly relevant keywords seed the
+        next level until max_depth.
 
         Returns count of keywords explored.
         """
-        if current_depth > self.max_depth:
-            return 0
-
         explored = 0
+        frontier = estimates
+        depth = current_depth
 
-        # Take top keywords by volume for expansion
-        sorted_estimates = sorted(estimates, key=lambda e: e.avg_monthly_searches, reverse=True)
-        expansion_seeds = [e.keyword for e in sorted_estimates[:5]]  # Top 5 for expansion
-
-        if not expansion_seeds:
-            return 0
-
-        try:
-            # Get related keywords
-            related_estimates = self._get_keyword_estimates(expansion_seeds)
-            explored += len(expansion_seeds)
-
-            # Filter out already-seen keywords
-            new_estimates = [
-                e for e in related_estimates
-                if e.keyword.lower() not in all_keywords
-            ]
-
-            if not new_estimates:
-                return explored
+        while frontier and depth <= self.max_depth:
+            # Take top keywords by volume for expansion
+            expansion_seeds = [
+                e.keyword for e in heapq.nlargest(5, frontier, key=_monthly_searches)
+            ]  # Top 5 for expansion
 
-            # Score relevance
-            scored = await self._score_keywords(
-                [e.keyword for e in new_estimates],
-                product_understanding,
-            )
+            try:
+                # Get related keywords
+                related_estimates = await self._get_keyword_estimates(expansion_seeds)
+                explored += len(expansion_seeds)
+
+                # Filter out already-seen keywords (including duplicates within this batch)
+                new_estimates = []
+                for e in related_estimates:
+                    kw_key = e.kw_key
+                    if kw_key not in seen and kw_key not in all_keywords:
+                        seen.add(kw_key)
+                        new_estimates.append(e)
+
+                if not new_estimates:
+                    break
+
+                # Score relevance
+                scored = await self._score_keywords(
+                    [e.keyword for e in new_estimates],
+                    product_understanding,
+                    shared_scores,
+                )
 
-            # Build opportunities
-            for estimate in new_estimates:
-                relevance = scored.get(estimate.keyword, {"relevance": 0, "reason": ""})
-                if relevance["relevance"] >= self.min_relevance:
-                    kw_key = estimate.keyword.lower()
-                    all_keywords[kw_key] = KeywordOpportunity(
-                        keyword=estimate.keyword,
-                        monthly_volume=estimate.avg_monthly_searches,
-                        avg_cpc=float(estimate.avg_cpc),
-                        competition=estimate.competition,
-                        relevance_score=relevance["relevance"],
-                        relevance_reason=relevance["reason"],
-                        tier=tier,
-                        source="expanded",
-                        depth=current_depth,
-                    )
+                # Build opportunities
+                for estimate in new_estimates:
+                    relevance = scored.get(estimate.keyword, {"relevance": 0, "reason": ""})
+                    if relevance["relevance"] >= self.min_relevance:
+                        all_keywords[estimate.kw_key] = _make_opportunity(
+                            estimate, relevance, tier, "expanded", depth
+                        )
+
+                # Continue expansion from the keywords that scored well
+                frontier = [
+                    e for e in new_estimates
+                    if scored.get(e.keyword, {}).get("relevance", 0) >= 70
+                ]
 
-            # Continue expansion if we found good keywords
-            if current_depth < self.max_depth:
-                high_relevance = [e for e in new_estimates if scored.get(e.keyword, {}).get("relevance", 0) >= 70]
-                if high_relevance:
-                    deeper = await self._expand_keywords(
-                        high_relevance,
-                        product_understanding,
-                        tier,
-                        current_depth + 1,
-                        all_keywords,
-                    )
-                    explored += deeper
+            except Exception as e:
+                logger.warning(f"Expansion failed at depth {depth}: {e}")
+                break
 
-        except Exception as e:
-            logger.warning(f"Expansion failed at depth {current_depth}: {e}")
+            depth += 1
 
         return explored
 
@@ -452,18 +877,24 @@ class KeywordExplorer:
         keywords: list[KeywordOpportunity],
     ) -> list[KeywordOpportunity]:
         """Limit keywords per tier, keeping best opportunities."""
-        by_tier: dict[str, list[KeywordOpportunity]] = {}
+        by_tier: defaultdict[str, list[KeywordOpportunity]] = defaultdict(list)
 
         for kw in keywords:
-            if kw.tier not in by_tier:
-                by_tier[kw.tier] = []
             by_tier[kw.tier].append(kw)
 
+        limit = self.max_keywords_per_tier
         result = []
         for tier, tier_keywords in by_tier.items():
-            # Sort by opportunity score
-            sorted_kw = sorted(tier_keywords, key=lambda k: k.opportunity_score, reverse=True)
-            result.extend(sorted_kw[:self.max_keywords_per_tier])
+            # Zero-volume keywords always score 0.0, so only rank the rest and
+            # backfill with zero-volume ones in their original order
+            active = []
+            idle = []
+            for kw in tier_keywords:
+                (active if kw.monthly_volume > 0 else idle).append(kw)
+            best = heapq.nlargest(limit, active, key=_opportunity_score)
+            if len(best) < limit:
+                best.extend(idle[:limit - len(best)])
+            result.extend(best)
 
         return result
 
@@ -487,4 +918,7 @@ async def explore_product_keywords(
         max_depth=max_depth,
         min_relevance=min_relevance,
     )
-    return await explorer.explore(product_understanding)
+    try:
+        return await explorer.explore(product_understanding)
+    finally:
+        explorer.close()
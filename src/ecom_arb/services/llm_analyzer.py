@@ -6,10 +6,20 @@ Provides semantic understanding of products for:
 - Amazon product similarity comparison
 """
 
+import asyncio
+import hashlib
 import json
 import logging
+import math
+import random
+import re
+import sqlite3
+import threading
+import time
 from dataclasses import dataclass
-from decimal import Decimal
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import cached_property, lru_cache
 from typing import Any
 
 import httpx
@@ -20,6 +30,114 @@ logger = logging.getLogger(__name__)
 
 OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
 
+# Items sent per LLM call when scoring keywords or comparing Amazon products
+KEYWORD_BATCH_SIZE = 50
+AMAZON_BATCH_SIZE = 50
+
+# Below this many word-overlap candidates, compare every Amazon product instead
+AMAZON_MIN_CANDIDATES = 5
+
+# Max concurrent OpenRouter calls per batched operation (OpenRouter rate limits)
+MAX_CONCURRENT_LLM_CALLS = 8
+
+# Retries for timed-out, rate-limited (429) or 5xx OpenRouter calls (exponential
+# backoff from the base delay, or the server's Retry-After when longer, up to the cap)
+OPENROUTER_MAX_RETRIES = 3
+OPENROUTER_RETRY_BASE_DELAY = 1.0
+OPENROUTER_MAX_RETRY_AFTER = 60.0
+
+# filter_related_keywords keeps a keyword without asking the LLM when it names
+# the product type and at least this share of its words appear in the product
+# description
+LOCAL_MATCH_THRESHOLD = 0.75
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+# Words too generic to signal that an Amazon title matches our product
+_FILLER_WORDS = frozenset({"a", "an", "and", "for", "in", "of", "on", "or", "the", "to", "with"})
+
+# Markdown code fences around a JSON reply, and a JSON object inside free text
+_FENCE_RE = re.compile(r"^\s*```(?:json)?|```\s*$")
+_JSON_OBJECT_RE = re.compile(r"\{[\s\S]*\}")
+
+# System prompts carry each task's fixed instructions and JSON schema, so every
+# call for a task starts with identical bytes (lets provider prompt caching hit);
+# user messages hold only the per-call data.
+_ANALYZE_SYSTEM = """You are an e-commerce product analyst. Analyze products to understand what they are, who buys them, and what keywords people would search for.
+
+Always respond with valid JSON matching the requested schema. Be specific and practical.
+
+Return JSON with this exact structure:
+{
+  "product_type": "specific product type (e.g., 'ceiling pendant lamp', 'bluetooth speaker', 'cable organizer bag')",
+  "style": ["style descriptor 1", "style descriptor 2"],
+  "materials": ["material 1", "material 2"],
+  "use_cases": ["where/how used 1", "where/how used 2"],
+  "buyer_persona": "description of who buys this",
+  "quality_tier": "budget|mid-range|premium",
+  "price_expectation": "$X-Y range (what buyers expect to pay)",
+  "seed_keywords": {
+    "exact": ["highly specific 3-5 word keywords that exactly describe this product"],
+    "specific": ["2-3 word product type keywords"],
+    "broad": ["1-2 word category keywords"]
+  }
+}
+
+Generate 3-5 keywords for each tier. Keywords should be what real shoppers would search for on Google."""
+
+_COMPARE_SYSTEM = """You are comparing products to find similar items on Amazon.
+Rate each product's similarity to the target product on a 0-100 scale.
+Be strict - only high scores for truly similar products.
+
+Rate each Amazon product's similarity (0-100):
+- 90-100: Nearly identical (same type, style, quality tier)
+- 70-89: Very similar (same category, similar features)
+- 50-69: Somewhat similar (related but noticeably different)
+- <50: Different product (don't include these)
+
+Return JSON:
+{
+  "similar_products": [
+    {"index": 1, "similarity": 85, "reason": "brief reason"},
+    ...only include products with similarity >= 50
+  ]
+}
+
+Be selective - only include genuinely similar products."""
+
+_KEYWORD_SYSTEM = """You score keyword relevance for e-commerce advertising.
+A keyword is relevant if someone searching for it would want to buy our specific product.
+
+Rate each keyword's relevance (0-100):
+- 90-100: Perfect match - searcher wants exactly our product
+- 70-89: Strong match - high purchase intent for our product
+- 50-69: Moderate - might want our product
+- 30-49: Weak - low intent for our specific product
+- <30: Poor - different product or wrong intent
+
+Return JSON:
+{
+  "scores": [
+    {"keyword": "keyword text", "relevance": 85, "reason": "brief reason"}
+  ]
+}"""
+
+_VIABILITY_SYSTEM = """You assess product viability for e-commerce dropshipping.
+Consider margin, competition, keyword availability, and market validation.
+
+Return JSON:
+{
+  "score": 0-100,
+  "pros": ["pro 1", "pro 2", ...],
+  "cons": ["con 1", "con 2", ...],
+  "recommendation": "launch|maybe|skip",
+  "summary": "one sentence summary"
+}"""
+
+# Shared OpenRouter client (keeps TLS connections alive across calls)
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
 
 @dataclass
 class ProductUnderstanding:
@@ -34,6 +152,25 @@ class ProductUnderstanding:
     price_expectation: str  # e.g., "$60-150"
     seed_keywords: dict[str, list[str]]  # exact, specific, broad
 
+    @cached_property
+    def prompt_prefix(self) -> str:
+        """Product description block shared by every keyword scoring prompt.
+
+        Built once per instance so batched scoring calls reuse the same string
+        (and the same prompt prefix for provider-side caching).
+        """
+        return f"""Our Product:
+- Type: {self.product_type}
+- Style: {', '.join(self.style)}
+- Materials: {', '.join(self.materials)}
+- Use cases: {', '.join(self.use_cases)}"""
+
+    @cached_property
+    def keyword_vocabulary(self) -> frozenset[str]:
+        """Normalized words describing the product, for local keyword matching."""
+        text = " ".join([self.product_type, *self.style, *self.materials, *self.use_cases])
+        return frozenset(_keyword_words(text))
+
 
 @dataclass
 class AmazonMatch:
@@ -66,17 +203,247 @@ class KeywordScore:
     reason: str
 
 
+class LLMResponseCache:
+    """Persistent cache of parsed OpenRouter responses backed by SQLite.
+
+    Entries are keyed by a SHA-256 of the canonicalized request (model,
+    messages and sampling parameters), so an identical prompt - e.g. the same
+    product re-analyzed on a later pipeline run - skips the API entirely.
+    Only exact matches are served; near-duplicate prompts still hit the model,
+    since a small wording change (CPC vs CPM) can change the right answer.
+    Entries expire after ttl seconds and are purged when the cache is opened.
+    Methods are blocking and thread-safe; async callers run them via
+    asyncio.to_thread so disk I/O never stalls the event loop.
+    """
+
+    DEFAULT_TTL = 7 * 24 * 3600  # One week
+
+    def __init__(self, path: str, ttl: float = DEFAULT_TTL):
+        """Open (or create) the cache database.
+
+        Args:
+            path: SQLite database file path
+            ttl: Seconds a cached response stays valid
+        """
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                hash TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "DELETE FROM llm_cache WHERE created_at < ?", (time.time() - self.ttl,)
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def key(payload: dict) -> str:
+        """Hash a request payload independent of dict ordering."""
+        canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def get(self, key: str) -> dict | None:
+        """Return the cached response for key, or None on a miss or expiry."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM llm_cache WHERE hash = ? AND created_at >= ?",
+                (key, time.time() - self.ttl),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, key: str, response: dict) -> None:
+        """Store a parsed response, replacing any existing entry."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (hash, response, created_at) VALUES (?, ?, ?)",
+                (key, json.dumps(response), time.time()),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+_default_llm_cache_lock = threading.Lock()
+
+
+def _default_llm_cache() -> LLMResponseCache | None:
+    """Shared LLMResponseCache from settings (None if disabled or unavailable).
+
+    The first call opens the database (schema setup and expiry purge), so
+    async callers run this via asyncio.to_thread. The lock stops concurrent
+    first calls from opening it twice.
+    """
+    with _default_llm_cache_lock:
+        return _open_default_llm_cache()
+
+
+@lru_cache
+def _open_default_llm_cache() -> LLMResponseCache | None:
+    """Open the LLMResponseCache configured in settings (once per process)."""
+    path = get_settings().llm_cache_path
+    if not path:
+        return None
+    try:
+        return LLMResponseCache(path)
+    except sqlite3.Error as e:
+        logger.warning(f"LLM response cache unavailable ({path}): {e}")
+        return None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared OpenRouter client, creating it on first use.
+
+    A client is bound to the event loop it was created on, so a new one is
+    made if the loop changes (e.g. separate asyncio.run calls in scripts).
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(60.0, connect=5.0),
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        )
+        _client_loop = loop
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared OpenRouter client (call on application shutdown)."""
+    global _client, _client_loop
+    if _client is not None:
+        await _client.aclose()
+    _client = None
+    _client_loop = None
+
+
+@lru_cache(maxsize=4)
+def _openrouter_headers(api_key: str) -> dict[str, str]:
+    """Request headers for an API key (built once, not per call)."""
+    return {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+        "HTTP-Referer": "https://ecom-arb.local",  # Required by OpenRouter
+        "X-Title": "ecom-arb",
+    }
+
+
+@lru_cache(maxsize=16384)
+def _keyword_words(text: str) -> frozenset[str]:
+    """Lowercased words of text with naive plurals folded ("lamps" -> "lamp").
+
+    Memoized: the same keywords and Amazon titles recur across products.
+    """
+    words = set()
+    for word in _WORD_RE.findall(text.lower()):
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        words.add(word)
+    return frozenset(words)
+
+
+def _retry_after_seconds(value: str | None) -> float | None:
+    """Parse a Retry-After header (delay in seconds or an HTTP date)."""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+    return min(max(seconds, 0.0), OPENROUTER_MAX_RETRY_AFTER)
+
+
+async def _stream_completion(
+    client: httpx.AsyncClient,
+    headers: dict[str, str],
+    payload: dict[str, Any],
+    timeout: float,
+) -> tuple[int, str, float | None]:
+    """POST a streaming chat completion and assemble the reply from its deltas.
+
+    Streaming lets the body be consumed as the model generates it instead of
+    buffering the whole response first. The timeout bounds connecting and each
+    wait for data (first byte, then the gap between chunks), not the whole
+    stream, so long completions that keep producing tokens are not cut off.
+
+    Returns:
+        Tuple of (status code, message content - or the error body when the
+        status is not 200, Retry-After delay in seconds if the server sent one)
+
+    Raises:
+        httpx.TimeoutException: If no data arrives within timeout
+        Exception: If the stream reports an error mid-response
+    """
+    async with client.stream(
+        "POST",
+        f"{OPENROUTER_BASE_URL}/chat/completions",
+        headers=headers,
+        json={**payload, "stream": True},
+        timeout=httpx.Timeout(timeout, connect=min(timeout, 5.0)),
+    ) as response:
+        if response.status_code != 200:
+            body = await response.aread()
+            retry_after = _retry_after_seconds(response.headers.get("retry-after"))
+            return response.status_code, body.decode(errors="replace"), retry_after
+
+        parts = []
+        async for line in response.aiter_lines():
+            # Skip SSE comments/keep-alives (": OPENROUTER PROCESSING") and blank lines
+            if not line.startswith("data: "):
+                continue
+            data = line[6:]
+            if data == "[DONE]":
+                break
+            chunk = json.loads(data)
+            if "error" in chunk:
+                raise Exception(f"OpenRouter stream error: {chunk['error']}")
+            choices = chunk.get("choices")
+            if not choices:
+                continue
+            parts.append(choices[0].get("delta", {}).get("content") or "")
+            if choices[0].get("finish_reason") == "length":
+                logger.warning("OpenRouter response truncated at max_tokens")
+        return 200, "".join(parts), None
+
+
 async def _call_openrouter(
     messages: list[dict],
     temperature: float = 0.3,
     max_tokens: int = 2000,
+    bypass_cache: bool = False,
+    model: str | None = None,
 ) -> dict:
     """Make a call to OpenRouter API.
 
+    Identical requests are answered from the LLM response cache when enabled.
+    An attempt times out when OpenRouter sends nothing for
+    settings.openrouter_request_timeout seconds (connect, first byte or between
+    stream chunks); timeouts, connection errors, 429 and 5xx responses are
+    retried with exponential backoff (honoring Retry-After) so one stalled
+    routing or rate limit doesn't fail a whole batch.
+
     Args:
         messages: List of message dicts with role and content
         temperature: Sampling temperature (lower = more deterministic)
         max_tokens: Maximum tokens in response
+        bypass_cache: Always call the API (the fresh response is still cached)
+        model: OpenRouter model id (defaults to settings.openrouter_model)
 
     Returns:
         Parsed JSON response from the model
@@ -89,60 +456,73 @@ async def _call_openrouter(
     if not settings.openrouter_api_key:
         raise ValueError("OPENROUTER_API_KEY not configured")
 
-    headers = {
-        "Authorization": f"Bearer {settings.openrouter_api_key}",
-        "Content-Type": "application/json",
-        "HTTP-Referer": "https://ecom-arb.local",  # Required by OpenRouter
-        "X-Title": "ecom-arb",
-    }
+    headers = _openrouter_headers(settings.openrouter_api_key)
 
     payload = {
-        "model": settings.openrouter_model,
+        "model": model or settings.openrouter_model,
         "messages": messages,
         "temperature": temperature,
         "max_tokens": max_tokens,
         "response_format": {"type": "json_object"},
     }
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        response = await client.post(
-            f"{OPENROUTER_BASE_URL}/chat/completions",
-            headers=headers,
-            json=payload,
-        )
+    cache = await asyncio.to_thread(_default_llm_cache)
+    cache_key = LLMResponseCache.key(payload) if cache else ""
+    if cache and not bypass_cache:
+        cached = await asyncio.to_thread(cache.get, cache_key)
+        if cached is not None:
+            return cached
 
-        if response.status_code != 200:
-            logger.error(f"OpenRouter error: {response.status_code} - {response.text}")
-            raise Exception(f"OpenRouter API error: {response.status_code}")
-
-        data = response.json()
-        content = data["choices"][0]["message"]["content"]
-
-        # Strip markdown code blocks if present
-        content = content.strip()
-        if content.startswith("```json"):
-            content = content[7:]
-        elif content.startswith("```"):
-            content = content[3:]
-        if content.endswith("```"):
-            content = content[:-3]
-        content = content.strip()
-
-        # Parse JSON from response - try to find JSON object in text
+    client = _get_client()
+    for attempt in range(OPENROUTER_MAX_RETRIES + 1):
         try:
-            return json.loads(content)
-        except json.JSONDecodeError:
-            # Try to extract JSON from text (model might include preamble)
-            import re
-            json_match = re.search(r'\{[\s\S]*\}', content)
-            if json_match:
-                try:
-                    return json.loads(json_match.group())
-                except json.JSONDecodeError:
-                    pass
+            status_code, content, retry_after = await _stream_completion(
+                client, headers, payload, settings.openrouter_request_timeout
+            )
+        except httpx.TransportError as e:
+            if attempt == OPENROUTER_MAX_RETRIES:
+                raise Exception(f"OpenRouter API error: {type(e).__name__}") from e
+            failure = type(e).__name__
+            retry_after = None
+        else:
+            retryable = status_code == 429 or status_code >= 500
+            if not retryable or attempt == OPENROUTER_MAX_RETRIES:
+                break
+            failure = f"HTTP {status_code}"
+
+        delay = OPENROUTER_RETRY_BASE_DELAY * 2**attempt + random.random() * 0.1
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        logger.warning(f"OpenRouter call failed ({failure}), retrying in {delay:.1f}s")
+        await asyncio.sleep(delay)
+
+    if status_code != 200:
+        logger.error(f"OpenRouter error: {status_code} - {content}")
+        raise Exception(f"OpenRouter API error: {status_code}")
+
+    # Strip markdown code blocks if present
+    content = _FENCE_RE.sub("", content).strip()
+
+    # Parse JSON from response - try to find JSON object in text
+    try:
+        result = json.loads(content)
+    except json.JSONDecodeError:
+        # Try to extract JSON from text (model might include preamble)
+        json_match = _JSON_OBJECT_RE.search(content)
+        result = None
+        if json_match:
+            try:
+                result = json.loads(json_match.group())
+            except json.JSONDecodeError:
+                pass
+        if result is None:
             logger.error(f"Failed to parse LLM response as JSON: {content[:500]}")
             raise Exception(f"Invalid JSON response from LLM: content={content[:200]}")
 
+    if cache:
+        await asyncio.to_thread(cache.put, cache_key, result)
+    return result
+
 
 async def analyze_product(
     name: str,
@@ -150,6 +530,7 @@ async def analyze_product(
     cost: float | None = None,
     category: str | None = None,
     description: str | None = None,
+    bypass_cache: bool = False,
 ) -> ProductUnderstanding:
     """Analyze a product to understand what it is.
 
@@ -159,6 +540,7 @@ async def analyze_product(
         cost: Product cost in USD (optional)
         category: Product category (optional)
         description: Product description (optional)
+        bypass_cache: Skip the LLM response cache (e.g. explicit re-analysis)
 
     Returns:
         ProductUnderstanding with type, style, materials, keywords, etc.
@@ -174,39 +556,16 @@ async def analyze_product(
         product_info += f"\nDescription: {description[:500]}"
 
     messages = [
-        {
-            "role": "system",
-            "content": """You are an e-commerce product analyst. Analyze products to understand what they are, who buys them, and what keywords people would search for.
-
-Always respond with valid JSON matching the requested schema. Be specific and practical.""",
-        },
+        {"role": "system", "content": _ANALYZE_SYSTEM},
         {
             "role": "user",
             "content": f"""Analyze this product for e-commerce advertising:
 
-{product_info}
-
-Return JSON with this exact structure:
-{{
-  "product_type": "specific product type (e.g., 'ceiling pendant lamp', 'bluetooth speaker', 'cable organizer bag')",
-  "style": ["style descriptor 1", "style descriptor 2"],
-  "materials": ["material 1", "material 2"],
-  "use_cases": ["where/how used 1", "where/how used 2"],
-  "buyer_persona": "description of who buys this",
-  "quality_tier": "budget|mid-range|premium",
-  "price_expectation": "$X-Y range (what buyers expect to pay)",
-  "seed_keywords": {{
-    "exact": ["highly specific 3-5 word keywords that exactly describe this product"],
-    "specific": ["2-3 word product type keywords"],
-    "broad": ["1-2 word category keywords"]
-  }}
-}}
-
-Generate 3-5 keywords for each tier. Keywords should be what real shoppers would search for on Google.""",
+{product_info}""",
         },
     ]
 
-    result = await _call_openrouter(messages, temperature=0.3)
+    result = await _call_openrouter(messages, temperature=0.3, bypass_cache=bypass_cache)
 
     return ProductUnderstanding(
         product_type=result.get("product_type", "unknown"),
@@ -220,36 +579,191 @@ Generate 3-5 keywords for each tier. Keywords should be what real shoppers would
     )
 
 
+async def analyze_products_batch(
+    products: list[dict[str, Any]],
+    max_concurrency: int = 16,
+) -> list[ProductUnderstanding | None]:
+    """Analyze many products concurrently.
+
+    Args:
+        products: analyze_product keyword arguments (name, weight_grams,
+            cost, category, description), one dict per product
+        max_concurrency: Max analyze_product calls in flight
+
+    Returns:
+        ProductUnderstanding per input product, in order (None where analysis failed)
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def analyze_one(product: dict[str, Any]) -> ProductUnderstanding:
+        async with semaphore:
+            return await analyze_product(**product)
+
+    results = await asyncio.gather(
+        *(analyze_one(product) for product in products),
+        return_exceptions=True,
+    )
+
+    understandings: list[ProductUnderstanding | None] = []
+    for product, result in zip(products, results):
+        if isinstance(result, BaseException):
+            logger.warning(f"Product analysis failed for {product.get('name')!r}: {result}")
+            understandings.append(None)
+        else:
+            understandings.append(result)
+    return understandings
+
+
 async def compare_amazon_products(
     product_understanding: ProductUnderstanding,
     amazon_products: list[dict],
+    bypass_cache: bool = False,
 ) -> AmazonAnalysis:
     """Compare Amazon products to find similar items.
 
     Args:
         product_understanding: Our understanding of the source product
         amazon_products: List of Amazon products with title, price, reviews, asin
+        bypass_cache: Skip the LLM response cache (e.g. explicit re-analysis)
 
     Returns:
         AmazonAnalysis with similar products and market price
     """
-    # Format Amazon products for the prompt
-    amazon_list = []
-    for i, p in enumerate(amazon_products[:50]):  # Limit to 50
-        price = p.get("price", "N/A")
-        reviews = p.get("review_count", p.get("reviews", 0))
-        title = p.get("title", "")[:100]
-        amazon_list.append(f"{i+1}. \"{title}\" - ${price} - {reviews} reviews")
+    # Only pay the LLM for titles that plausibly describe the same kind of product
+    indexes = _amazon_candidates(product_understanding, amazon_products)
+
+    # Compare in batches of AMAZON_BATCH_SIZE, concurrently for large result sets
+    offsets = range(0, max(len(indexes), 1), AMAZON_BATCH_SIZE)
+    if len(offsets) == 1:
+        matches = await _compare_amazon_batch(
+            product_understanding, amazon_products, indexes, bypass_cache
+        )
+    else:
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_LLM_CALLS)
+
+        async def compare_batch(offset: int) -> list[AmazonMatch]:
+            async with semaphore:
+                return await _compare_amazon_batch(
+                    product_understanding,
+                    amazon_products,
+                    indexes[offset:offset + AMAZON_BATCH_SIZE],
+                    bypass_cache,
+                )
+
+        results = await asyncio.gather(*(compare_batch(offset) for offset in offsets))
+        matches = [match for batch_matches in results for match in batch_matches]
+
+    # Calculate market price from similar products (60%+ similarity)
+    high_similarity = [m for m in matches if m.similarity >= 60]
+
+    return AmazonAnalysis(
+        similar_products=matches,
+        market_price=_market_price(high_similarity),
+        sample_size=len(high_similarity),
+    )
+
+
+def _market_price(matches: list[AmazonMatch]) -> dict[str, float | None]:
+    """Weighted median, min and max price of priced matches, in one pass.
+
+    Each price is weighted by similarity and log of review count.
+    """
+    weighted_prices = []
+    total = 0.0
+    low = high = None
+    for m in matches:
+        if m.price <= 0:
+            continue
+        weight = (m.similarity / 100) * (1 + math.log10(m.reviews + 1))
+        weighted_prices.append((m.price, weight))
+        total += weight
+        if low is None or m.price < low:
+            low = m.price
+        if high is None or m.price > high:
+            high = m.price
+    if not weighted_prices:
+        return {"weighted_median": None, "min": None, "max": None}
+
+    weighted_median = _weighted_median(weighted_prices, total)
+    return {
+        "weighted_median": round(weighted_median, 2) if weighted_median else None,
+        "min": round(low, 2),
+        "max": round(high, 2),
+    }
+
+
+def _weighted_median(
+    weighted_values: list[tuple[float, float]],
+    total: float | None = None,
+) -> float | None:
+    """Weighted median of (value, weight) pairs.
+
+    Returns the smallest value at which the cumulative weight reaches half of
+    the total, or None if there is no positive weight. Callers that already
+    summed the weights pass the sum as total.
+    """
+    if total is None:
+        total = sum(weight for _, weight in weighted_values)
+    if total <= 0:
+        return None
+    half = total / 2
+    cumulative = 0.0
+    for value, weight in sorted(weighted_values):
+        cumulative += weight
+        if cumulative >= half:
+            return value
+    return None
+
+
+def _amazon_candidates(
+    product_understanding: ProductUnderstanding,
+    amazon_products: list[dict],
+) -> list[int]:
+    """Indexes of Amazon products worth sending to the LLM for comparison.
+
+    A title is kept when it shares at least one descriptive word with our
+    product's type, style, materials or use cases. If fewer than
+    AMAZON_MIN_CANDIDATES titles pass, every product is kept rather than
+    risk discarding matches phrased with synonyms.
+    """
+    vocabulary = product_understanding.keyword_vocabulary - _FILLER_WORDS
+    candidates = [
+        i for i, p in enumerate(amazon_products)
+        if _keyword_words(p.get("title") or "") & vocabulary
+    ]
+    if len(candidates) < AMAZON_MIN_CANDIDATES:
+        return list(range(len(amazon_products)))
+    return candidates
 
-    amazon_text = "\n".join(amazon_list)
+
+async def _compare_amazon_batch(
+    product_understanding: ProductUnderstanding,
+    all_products: list[dict],
+    indexes: list[int],
+    bypass_cache: bool = False,
+) -> list[AmazonMatch]:
+    """Rate one batch of Amazon products with a single LLM call.
+
+    Args:
+        product_understanding: Our understanding of the source product
+        all_products: Full Amazon product list
+        indexes: Positions in all_products to rate (at most AMAZON_BATCH_SIZE)
+        bypass_cache: Skip the LLM response cache
+
+    Returns:
+        AmazonMatch for each product the model rated as similar
+    """
+    amazon_products = [all_products[i] for i in indexes]
+
+    # Format Amazon products for the prompt
+    amazon_text = "\n".join(
+        f"{i}. \"{(p.get('title') or '')[:100]}\" - ${p.get('price', 'N/A')}"
+        f" - {p.get('review_count', p.get('reviews', 0))} reviews"
+        for i, p in enumerate(amazon_products[:AMAZON_BATCH_SIZE], 1)
+    )
 
     messages = [
-        {
-            "role": "system",
-            "content": """You are comparing products to find similar items on Amazon.
-Rate each product's similarity to the target product on a 0-100 scale.
-Be strict - only high scores for truly similar products.""",
-        },
+        {"role": "system", "content": _COMPARE_SYSTEM},
         {
             "role": "user",
             "content": f"""Find Amazon products similar to ours.
@@ -262,27 +776,11 @@ Our Product:
 - Expected price: {product_understanding.price_expectation}
 
 Amazon Products:
-{amazon_text}
-
-Rate each Amazon product's similarity (0-100):
-- 90-100: Nearly identical (same type, style, quality tier)
-- 70-89: Very similar (same category, similar features)
-- 50-69: Somewhat similar (related but noticeably different)
-- <50: Different product (don't include these)
-
-Return JSON:
-{{
-  "similar_products": [
-    {{"index": 1, "similarity": 85, "reason": "brief reason"}},
-    ...only include products with similarity >= 50
-  ]
-}}
-
-Be selective - only include genuinely similar products.""",
+{amazon_text}""",
         },
     ]
 
-    result = await _call_openrouter(messages, temperature=0.2)
+    result = await _call_openrouter(messages, temperature=0.2, bypass_cache=bypass_cache)
 
     similar = result.get("similar_products", [])
 
@@ -294,7 +792,7 @@ Be selective - only include genuinely similar products.""",
             ap = amazon_products[idx]
             matches.append(
                 AmazonMatch(
-                    index=idx,
+                    index=indexes[idx],
                     title=ap.get("title", ""),
                     price=float(ap.get("price", 0)) if ap.get("price") else 0,
                     reviews=ap.get("review_count", ap.get("reviews", 0)),
@@ -304,37 +802,7 @@ Be selective - only include genuinely similar products.""",
                 )
             )
 
-    # Calculate market price from similar products (60%+ similarity)
-    high_similarity = [m for m in matches if m.similarity >= 60]
-    if high_similarity:
-        prices = [m.price for m in high_similarity if m.price > 0]
-        if prices:
-            # Weight by similarity and log of reviews
-            import math
-            weighted_prices = []
-            weights = []
-            for m in high_similarity:
-                if m.price > 0:
-                    weight = (m.similarity / 100) * (1 + math.log10(m.reviews + 1))
-                    weighted_prices.append(m.price * weight)
-                    weights.append(weight)
-
-            weighted_median = sum(weighted_prices) / sum(weights) if weights else None
-            market_price = {
-                "weighted_median": round(weighted_median, 2) if weighted_median else None,
-                "min": round(min(prices), 2),
-                "max": round(max(prices), 2),
-            }
-        else:
-            market_price = {"weighted_median": None, "min": None, "max": None}
-    else:
-        market_price = {"weighted_median": None, "min": None, "max": None}
-
-    return AmazonAnalysis(
-        similar_products=matches,
-        market_price=market_price,
-        sample_size=len(high_similarity),
-    )
+    return matches
 
 
 async def score_keyword_relevance(
@@ -343,6 +811,9 @@ async def score_keyword_relevance(
 ) -> list[KeywordScore]:
     """Score how relevant keywords are to our product.
 
+    Keywords are split into batches of KEYWORD_BATCH_SIZE that are scored
+    concurrently (at most MAX_CONCURRENT_LLM_CALLS in flight).
+
     Args:
         keywords: List of keywords to score
         product_understanding: Our understanding of the product
@@ -350,44 +821,53 @@ async def score_keyword_relevance(
     Returns:
         List of KeywordScore with relevance 0-100
     """
-    keyword_list = "\n".join(f"- {kw}" for kw in keywords[:15])  # Limit to 15
+    if not keywords:
+        return []
+
+    batches = [
+        keywords[i:i + KEYWORD_BATCH_SIZE]
+        for i in range(0, len(keywords), KEYWORD_BATCH_SIZE)
+    ]
+    if len(batches) == 1:
+        return await _score_keyword_batch(batches[0], product_understanding)
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_LLM_CALLS)
+
+    async def score_batch(batch: list[str]) -> list[KeywordScore]:
+        async with semaphore:
+            return await _score_keyword_batch(batch, product_understanding)
+
+    results = await asyncio.gather(*(score_batch(batch) for batch in batches))
+    return [score for batch_scores in results for score in batch_scores]
+
+
+async def _score_keyword_batch(
+    keywords: list[str],
+    product_understanding: ProductUnderstanding,
+) -> list[KeywordScore]:
+    """Score a single batch of keywords with one LLM call."""
+    keyword_list = "\n".join(f"- {kw}" for kw in keywords)
 
     messages = [
-        {
-            "role": "system",
-            "content": """You score keyword relevance for e-commerce advertising.
-A keyword is relevant if someone searching for it would want to buy our specific product.""",
-        },
+        {"role": "system", "content": _KEYWORD_SYSTEM},
         {
             "role": "user",
             "content": f"""Score these keywords for our product.
 
-Our Product:
-- Type: {product_understanding.product_type}
-- Style: {', '.join(product_understanding.style)}
-- Materials: {', '.join(product_understanding.materials)}
-- Use cases: {', '.join(product_understanding.use_cases)}
+{product_understanding.prompt_prefix}
 
 Keywords to score:
-{keyword_list}
-
-Rate each keyword's relevance (0-100):
-- 90-100: Perfect match - searcher wants exactly our product
-- 70-89: Strong match - high purchase intent for our product
-- 50-69: Moderate - might want our product
-- 30-49: Weak - low intent for our specific product
-- <30: Poor - different product or wrong intent
-
-Return JSON:
-{{
-  "scores": [
-    {{"keyword": "keyword text", "relevance": 85, "reason": "brief reason"}}
-  ]
-}}""",
+{keyword_list}""",
         },
     ]
 
-    result = await _call_openrouter(messages, temperature=0.2, max_tokens=4000)
+    # Relevance tagging doesn't need the flagship model
+    result = await _call_openrouter(
+        messages,
+        temperature=0.2,
+        max_tokens=4000,
+        model=get_settings().openrouter_model_fast or None,
+    )
 
     scores = []
     for item in result.get("scores", []):
@@ -409,6 +889,10 @@ async def filter_related_keywords(
 ) -> list[str]:
     """Filter related keywords to only relevant ones.
 
+    Keywords that name the product type and are made up (almost) entirely of
+    words from the product description are kept without an LLM call; all
+    other keywords are scored by the model.
+
     Args:
         related_keywords: Keywords from Google Ads API
         product_understanding: Our product understanding
@@ -420,9 +904,25 @@ async def filter_related_keywords(
     if not related_keywords:
         return []
 
-    scores = await score_keyword_relevance(related_keywords, product_understanding)
+    vocabulary = product_understanding.keyword_vocabulary
+    type_words = _keyword_words(product_understanding.product_type) - _FILLER_WORDS
+    relevant = []
+    to_score = []
+    for keyword in related_keywords:
+        words = _keyword_words(keyword)
+        if (
+            words & type_words
+            and len(words & vocabulary) / len(words) >= LOCAL_MATCH_THRESHOLD
+        ):
+            relevant.append(keyword)
+        else:
+            to_score.append(keyword)
+
+    if to_score:
+        scores = await score_keyword_relevance(to_score, product_understanding)
+        relevant.extend(s.keyword for s in scores if s.relevance >= min_relevance)
 
-    return [s.keyword for s in scores if s.relevance >= min_relevance]
+    return relevant
 
 
 async def generate_viability_assessment(
@@ -450,11 +950,7 @@ async def generate_viability_assessment(
     margin_pct = ((median - cost) / median * 100) if median and median > cost else 0
 
     messages = [
-        {
-            "role": "system",
-            "content": """You assess product viability for e-commerce dropshipping.
-Consider margin, competition, keyword availability, and market validation.""",
-        },
+        {"role": "system", "content": _VIABILITY_SYSTEM},
         {
             "role": "user",
             "content": f"""Assess this product's viability:
@@ -470,16 +966,7 @@ Best Keyword: {best_keyword.get('keyword', 'N/A') if best_keyword else 'None fou
 - Relevance: {best_keyword.get('relevance', 'N/A') if best_keyword else 'N/A'}%
 
 Total Keywords Found: {keyword_count}
-Similar Amazon Products: {amazon_match_count}
-
-Return JSON:
-{{
-  "score": 0-100,
-  "pros": ["pro 1", "pro 2", ...],
-  "cons": ["con 1", "con 2", ...],
-  "recommendation": "launch|maybe|skip",
-  "summary": "one sentence summary"
-}}""",
+Similar Amazon Products: {amazon_match_count}""",
         },
     ]
 
@@ -10,16 +10,17 @@ Usage:
 
 import logging
 from dataclasses import dataclass, field
-from decimal import Decimal
-from typing import Optional
+from typing import Any, Optional
 
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ecom_arb.db.models import ScoredProduct
 from ecom_arb.scoring.models import Product, ProductScore
 from ecom_arb.scoring.scorer import score_product
 from ecom_arb.services.discovery import DiscoveryService
+from ecom_arb.services.llm_analyzer import ProductUnderstanding, analyze_products_batch
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +34,7 @@ class PipelineResult:
     passed_count: int = 0
     rejected_count: int = 0
     saved_count: int = 0
+    analyzed_count: int = 0
     scores: list[ProductScore] = field(default_factory=list)
 
     @property
@@ -67,6 +69,80 @@ def score_products(products: list[Product]) -> list[ProductScore]:
     return scores
 
 
+# Rows per upsert statement (keeps bound parameters well under driver limits)
+_UPSERT_BATCH_SIZE = 500
+
+# Dialect-specific INSERT constructs that support ON CONFLICT DO UPDATE
+_UPSERT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+# Columns refreshed on every save vs. only when the source Product is known
+_SCORE_COLUMNS = (
+    "name",
+    "cogs",
+    "gross_margin",
+    "net_margin",
+    "max_cpc",
+    "cpc_buffer",
+    "passed_filters",
+    "rejection_reasons",
+    "points",
+    "point_breakdown",
+    "rank_score",
+    "recommendation",
+)
+_PRODUCT_COLUMNS = (
+    "product_cost",
+    "shipping_cost",
+    "selling_price",
+    "category",
+    "estimated_cpc",
+    "monthly_search_volume",
+)
+
+# Product fields for new records scored without their source Product
+_MISSING_PRODUCT_FIELDS = {
+    "product_cost": 0,
+    "shipping_cost": 0,
+    "selling_price": 0,
+    "category": "unknown",
+    "estimated_cpc": 0,
+    "monthly_search_volume": 1000,
+}
+
+
+def _score_fields(score: ProductScore) -> dict[str, Any]:
+    """ScoredProduct column values taken from a ProductScore."""
+    return {
+        "name": score.product_name,
+        "cogs": score.cogs,
+        "gross_margin": score.gross_margin,
+        "net_margin": score.net_margin,
+        "max_cpc": score.max_cpc,
+        "cpc_buffer": score.cpc_buffer,
+        "passed_filters": score.passed_filters,
+        "rejection_reasons": score.rejection_reasons,
+        "points": score.points,
+        "point_breakdown": score.point_breakdown,
+        "rank_score": score.rank_score if score.rank_score else None,
+        "recommendation": score.recommendation,
+    }
+
+
+def _product_fields(product: Product) -> dict[str, Any]:
+    """ScoredProduct column values taken from the source Product."""
+    return {
+        "product_cost": product.product_cost,
+        "shipping_cost": product.shipping_cost,
+        "selling_price": product.selling_price,
+        "category": product.category.value,
+        "estimated_cpc": product.estimated_cpc,
+        "monthly_search_volume": product.monthly_search_volume,
+    }
+
+
 async def save_scores(
     scores: list[ProductScore],
     session: AsyncSession,
@@ -75,6 +151,8 @@ async def save_scores(
     """Save product scores to database.
 
     Updates existing records if source_product_id already exists (upsert behavior).
+    On PostgreSQL and SQLite this is a bulk INSERT ... ON CONFLICT DO UPDATE;
+    other databases fall back to per-row updates.
 
     Args:
         scores: List of ProductScore to save.
@@ -93,65 +171,108 @@ async def save_scores(
         for p in products:
             product_lookup[p.id] = p
 
+    insert = _UPSERT_INSERTS.get(session.get_bind().dialect.name)
+    if insert is None:
+        return await _save_scores_per_row(scores, session, product_lookup)
+
+    # Rows with a source Product also refresh pricing fields on conflict; the
+    # last score wins if a product appears twice (ON CONFLICT can't hit a row twice)
+    rows_with_product: dict[str, dict[str, Any]] = {}
+    rows_without_product: dict[str, dict[str, Any]] = {}
+    for score in scores:
+        product = product_lookup.get(score.product_id)
+        row = {"source_product_id": score.product_id, **_score_fields(score)}
+        rows_with_product.pop(score.product_id, None)
+        rows_without_product.pop(score.product_id, None)
+        if product:
+            row.update(_product_fields(product))
+            rows_with_product[score.product_id] = row
+        else:
+            row.update(_MISSING_PRODUCT_FIELDS)
+            rows_without_product[score.product_id] = row
+
+    saved_by_id: dict[str, ScoredProduct] = {}
+    for rows, update_columns in (
+        (list(rows_with_product.values()), _SCORE_COLUMNS + _PRODUCT_COLUMNS),
+        (list(rows_without_product.values()), _SCORE_COLUMNS),
+    ):
+        for i in range(0, len(rows), _UPSERT_BATCH_SIZE):
+            stmt = insert(ScoredProduct).values(rows[i:i + _UPSERT_BATCH_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[ScoredProduct.source_product_id],
+                set_={
+                    **{column: stmt.excluded[column] for column in update_columns},
+                    "updated_at": func.now(),
+                },
+            )
+            result = await session.scalars(
+                stmt.returning(ScoredProduct),
+                execution_options={"populate_existing": True},
+            )
+            for record in result:
+                saved_by_id[record.source_product_id] = record
+
+    return [saved_by_id[score.product_id] for score in scores]
+
+
+def _understanding_fields(understanding: ProductUnderstanding) -> dict[str, Any]:
+    """ScoredProduct.product_understanding JSON for an LLM analysis."""
+    return {
+        "product_type": understanding.product_type,
+        "style": understanding.style,
+        "materials": understanding.materials,
+        "use_cases": understanding.use_cases,
+        "buyer_persona": understanding.buyer_persona,
+        "quality_tier": understanding.quality_tier,
+        "price_expectation": understanding.price_expectation,
+    }
+
+
+async def _save_scores_per_row(
+    scores: list[ProductScore],
+    session: AsyncSession,
+    product_lookup: dict[str, Product],
+) -> list[ScoredProduct]:
+    """Upsert scores row by row (databases without ON CONFLICT support).
+
+    Existing records are fetched with one IN query up front, so the loop
+    itself never touches the database.
+    """
+    existing_by_id: dict[str, ScoredProduct] = {}
+    product_ids = list({score.product_id for score in scores})
+    for i in range(0, len(product_ids), _UPSERT_BATCH_SIZE):
+        result = await session.scalars(
+            select(ScoredProduct).where(
+                ScoredProduct.source_product_id.in_(product_ids[i:i + _UPSERT_BATCH_SIZE])
+            )
+        )
+        existing_by_id.update((row.source_product_id, row) for row in result)
+
     saved = []
 
     for score in scores:
         # Get original product for additional fields
         product = product_lookup.get(score.product_id)
 
-        # Check if product already exists
-        result = await session.execute(
-            select(ScoredProduct).where(ScoredProduct.source_product_id == score.product_id)
-        )
-        existing = result.scalar_one_or_none()
+        existing = existing_by_id.get(score.product_id)
 
         if existing:
-            # Update existing record
-            existing.name = score.product_name
-            existing.cogs = Decimal(str(score.cogs))
-            existing.gross_margin = Decimal(str(score.gross_margin))
-            existing.net_margin = Decimal(str(score.net_margin))
-            existing.max_cpc = Decimal(str(score.max_cpc))
-            existing.cpc_buffer = Decimal(str(score.cpc_buffer))
-            existing.passed_filters = score.passed_filters
-            existing.rejection_reasons = score.rejection_reasons
-            existing.points = score.points
-            existing.point_breakdown = score.point_breakdown
-            existing.rank_score = Decimal(str(score.rank_score)) if score.rank_score else None
-            existing.recommendation = score.recommendation
-            # Update pricing fields if product available
+            # Update existing record (pricing fields only if product available)
+            fields = _score_fields(score)
             if product:
-                existing.product_cost = Decimal(str(product.product_cost))
-                existing.shipping_cost = Decimal(str(product.shipping_cost))
-                existing.selling_price = Decimal(str(product.selling_price))
-                existing.category = product.category.value
-                existing.estimated_cpc = Decimal(str(product.estimated_cpc))
-                existing.monthly_search_volume = product.monthly_search_volume
+                fields.update(_product_fields(product))
+            for column, value in fields.items():
+                setattr(existing, column, value)
             saved.append(existing)
         else:
             # Create new record
             db_score = ScoredProduct(
                 source_product_id=score.product_id,
-                name=score.product_name,
-                product_cost=Decimal(str(product.product_cost)) if product else Decimal("0"),
-                shipping_cost=Decimal(str(product.shipping_cost)) if product else Decimal("0"),
-                selling_price=Decimal(str(product.selling_price)) if product else Decimal("0"),
-                category=product.category.value if product else "unknown",
-                estimated_cpc=Decimal(str(product.estimated_cpc)) if product else Decimal("0"),
-                monthly_search_volume=product.monthly_search_volume if product else 1000,
-                cogs=Decimal(str(score.cogs)),
-                gross_margin=Decimal(str(score.gross_margin)),
-                net_margin=Decimal(str(score.net_margin)),
-                max_cpc=Decimal(str(score.max_cpc)),
-                cpc_buffer=Decimal(str(score.cpc_buffer)),
-                passed_filters=score.passed_filters,
-                rejection_reasons=score.rejection_reasons,
-                points=score.points,
-                point_breakdown=score.point_breakdown,
-                rank_score=Decimal(str(score.rank_score)) if score.rank_score else None,
-                recommendation=score.recommendation,
+                **_score_fields(score),
+                **(_product_fields(product) if product else _MISSING_PRODUCT_FIELDS),
             )
             session.add(db_score)
+            existing_by_id[score.product_id] = db_score
             saved.append(db_score)
 
     await session.flush()
@@ -191,6 +312,7 @@ class PipelineService:
         limit: int = 50,
         enrich_amazon: bool = True,
         enrich_cpc: bool = True,
+        analyze: bool = False,
     ) -> PipelineResult:
         """Run the full pipeline: discover → score → save.
 
@@ -199,6 +321,8 @@ class PipelineService:
             limit: Maximum products to process.
             enrich_amazon: Fetch Amazon competition data.
             enrich_cpc: Fetch CPC estimates.
+            analyze: Run LLM product analysis on products that passed filters
+                (concurrently) and store it on their records.
 
         Returns:
             PipelineResult with counts and scores.
@@ -207,7 +331,7 @@ class PipelineService:
 
         # Step 1: Discover products
         logger.info(f"Discovering products (category={category}, limit={limit})")
-        discovered = self.discovery.discover_products(
+        discovered = await self.discovery.discover_products(
             category=category,
             limit=limit,
             enrich_amazon=enrich_amazon,
@@ -242,8 +366,54 @@ class PipelineService:
         saved = await save_scores(scores, self.session, products)
         result.saved_count = len(saved)
 
+        # Step 5: LLM analysis of passing products
+        if analyze:
+            result.analyzed_count = await self._analyze_saved(saved, products)
+
         return result
 
+    async def _analyze_saved(
+        self,
+        saved: list[ScoredProduct],
+        products: list[Product],
+    ) -> int:
+        """Run LLM analysis for saved records that passed filters.
+
+        Args:
+            saved: Records returned by save_scores.
+            products: Scoring Products the records came from.
+
+        Returns:
+            Number of records that received a product understanding.
+        """
+        product_lookup = {p.id: p for p in products}
+        records = list({
+            r.source_product_id: r for r in saved
+            if r.passed_filters and r.source_product_id in product_lookup
+        }.values())
+        if not records:
+            return 0
+
+        logger.info(f"Analyzing {len(records)} passing products with LLM")
+        understandings = await analyze_products_batch([
+            {
+                "name": record.name,
+                "weight_grams": product_lookup[record.source_product_id].weight_grams,
+                "cost": float(record.product_cost),
+                "category": record.category,
+            }
+            for record in records
+        ])
+
+        analyzed = 0
+        for record, understanding in zip(records, understandings):
+            if understanding is not None:
+                record.product_understanding = _understanding_fields(understanding)
+                analyzed += 1
+
+        await self.session.flush()
+        return analyzed
+
     async def score_and_save(
         self,
         products: list[Product],
@@ -4,15 +4,20 @@ Extracts quantitative and qualitative specs from product titles/descriptions
 and compares products for similarity scoring.
 """
 
-import re
 import logging
-from dataclasses import dataclass, field
-from decimal import Decimal
+import math
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from itertools import repeat
+from operator import attrgetter
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProductSpecs:
     """Extracted product specifications."""
 
@@ -32,6 +37,7 @@ class ProductSpecs:
     power_source: str | None = None  # usb, battery, plug-in, solar
     connectivity: str | None = None  # bluetooth, wifi, wired
     features: list[str] = field(default_factory=list)
+    feature_mask: int = 0  # features as bits of FEATURE_INDEX (set by extract_specs)
     color: str | None = None
     style: str | None = None
     product_type: str | None = None  # lamp, speaker, charger, etc.
@@ -40,54 +46,127 @@ class ProductSpecs:
     raw_title: str = ""
 
 
-# Regex patterns for spec extraction
-PATTERNS = {
+# Quantitative units per field, in priority order (the first unit found
+# anywhere in the text wins), with converters from the matched number
+FIELD_UNITS = {
     # Weight: 200g, 1.5kg, 200 grams
-    "weight_grams": [
-        (r"(\d+(?:\.\d+)?)\s*kg\b", lambda m: int(float(m.group(1)) * 1000)),
-        (r"(\d+(?:\.\d+)?)\s*g(?:rams?)?\b", lambda m: int(float(m.group(1)))),
-        (r"(\d+(?:\.\d+)?)\s*oz\b", lambda m: int(float(m.group(1)) * 28.35)),
-        (r"(\d+(?:\.\d+)?)\s*lbs?\b", lambda m: int(float(m.group(1)) * 453.6)),
-    ],
-
+    "weight_grams": {
+        "kg": lambda v: int(float(v) * 1000),
+        "g": lambda v: int(float(v)),
+        "oz": lambda v: int(float(v) * 28.35),
+        "lb": lambda v: int(float(v) * 453.6),
+    },
     # Capacity: 150ml, 1.5L, 500 ml
-    "capacity_ml": [
-        (r"(\d+(?:\.\d+)?)\s*l(?:iter)?s?\b", lambda m: int(float(m.group(1)) * 1000)),
-        (r"(\d+(?:\.\d+)?)\s*ml\b", lambda m: int(float(m.group(1)))),
-        (r"(\d+(?:\.\d+)?)\s*oz\b", lambda m: int(float(m.group(1)) * 29.57)),  # fluid oz
-    ],
-
+    "capacity_ml": {
+        "l": lambda v: int(float(v) * 1000),
+        "ml": lambda v: int(float(v)),
+        "floz": lambda v: int(float(v) * 29.57),  # fluid oz
+    },
     # Power: 10W, 100 watts
-    "power_watts": [
-        (r"(\d+(?:\.\d+)?)\s*w(?:atts?)?\b", lambda m: int(float(m.group(1)))),
-    ],
-
+    "power_watts": {"w": lambda v: int(float(v))},
     # Lumens: 1000lm, 500 lumens
-    "lumens": [
-        (r"(\d+)\s*(?:lm|lumens?)\b", lambda m: int(m.group(1))),
-    ],
-
+    "lumens": {"lm": int},
     # Battery: 2000mAh, 5000 mah
-    "battery_mah": [
-        (r"(\d+)\s*mah\b", lambda m: int(m.group(1))),
-    ],
-
+    "battery_mah": {"mah": int},
     # Dimensions: 10cm, 5.5 inches, 100mm
-    "length_cm": [
-        (r"(\d+(?:\.\d+)?)\s*cm\b", lambda m: float(m.group(1))),
-        (r"(\d+(?:\.\d+)?)\s*mm\b", lambda m: float(m.group(1)) / 10),
-        (r"(\d+(?:\.\d+)?)\s*(?:inch(?:es)?|in|\")\b", lambda m: float(m.group(1)) * 2.54),
-        (r"(\d+(?:\.\d+)?)\s*m\b", lambda m: float(m.group(1)) * 100),
-    ],
-
-    # Quantity: 3pcs, 5 pack, set of 2
-    "quantity": [
-        (r"(\d+)\s*(?:pcs?|pieces?|pack|count)\b", lambda m: int(m.group(1))),
-        (r"set\s*(?:of\s*)?(\d+)\b", lambda m: int(m.group(1))),
-        (r"(\d+)\s*(?:in\s*1|in1)\b", lambda m: int(m.group(1))),
-    ],
+    "length_cm": {
+        "cm": float,
+        "mm": lambda v: float(v) / 10,
+        "inch": lambda v: float(v) * 2.54,
+        "m": lambda v: float(v) * 100,
+    },
+    # Quantity: 3pcs, 5 pack, set of 2, 3 in 1
+    "quantity": {"pcs": int, "set": int, "in1": int},
+}
+
+def _check_lowercase(keywords) -> None:
+    """Reject vocabulary entries that could never match lowercased text.
+
+    All matching runs on lowercased text without IGNORECASE, so this runs at
+    import for every vocabulary.
+    """
+    for kw in keywords:
+        if kw != kw.lower():
+            raise ValueError(f"Spec keyword must be lowercase: {kw!r}")
+
+
+# Unit spelling -> (field, unit) slots it fills ("oz" is both weight and volume)
+UNIT_SPELLINGS = {
+    "kg": [("weight_grams", "kg")],
+    "g": [("weight_grams", "g")],
+    "gram": [("weight_grams", "g")],
+    "grams": [("weight_grams", "g")],
+    "oz": [("weight_grams", "oz"), ("capacity_ml", "floz")],
+    "lb": [("weight_grams", "lb")],
+    "lbs": [("weight_grams", "lb")],
+    "l": [("capacity_ml", "l")],
+    "ls": [("capacity_ml", "l")],
+    "liter": [("capacity_ml", "l")],
+    "liters": [("capacity_ml", "l")],
+    "ml": [("capacity_ml", "ml")],
+    "w": [("power_watts", "w")],
+    "watt": [("power_watts", "w")],
+    "watts": [("power_watts", "w")],
+    "lm": [("lumens", "lm")],
+    "lumen": [("lumens", "lm")],
+    "lumens": [("lumens", "lm")],
+    "mah": [("battery_mah", "mah")],
+    "cm": [("length_cm", "cm")],
+    "mm": [("length_cm", "mm")],
+    "inch": [("length_cm", "inch")],
+    "inches": [("length_cm", "inch")],
+    "in": [("length_cm", "inch")],
+    '"': [("length_cm", "inch")],
+    "m": [("length_cm", "m")],
+    "pc": [("quantity", "pcs")],
+    "pcs": [("quantity", "pcs")],
+    "piece": [("quantity", "pcs")],
+    "pieces": [("quantity", "pcs")],
+    "pack": [("quantity", "pcs")],
+    "count": [("quantity", "pcs")],
 }
 
+# Units whose numbers are whole: from "1.5mah" only the "5" counts
+_INTEGER_UNITS = {"lm", "mah", "pcs", "set", "in1"}
+
+# Every quantity in one scan: a number and unit spelling, "N in 1", or "set of N".
+# Numbers after "set" and the "1" of "in 1" sit in lookaheads so a following
+# unit can still match them. Text is lowercased before matching.
+_check_lowercase(UNIT_SPELLINGS)
+_WORD_UNITS = sorted((u for u in UNIT_SPELLINGS if u != '"'), key=len, reverse=True)
+QUANTITY_RE = re.compile(
+    r"(?P<num>\d+(?:\.\d+)?)\s*(?:"
+    r"(?P<unit>" + "|".join(_WORD_UNITS) + r")\b"
+    r"|(?P<quote>\")(?=\w)"
+    r"|(?P<in1>in)(?=\s*1\b))"
+    r"|set\s*(?:of\s*)?(?=(?P<set>\d+)\b)"
+)
+_IN1_TAIL = re.compile(r"\s*1\b")
+
+
+def _find_quantities(text: str) -> dict[tuple[str, str], str]:
+    """First number found for each (field, unit) slot, in one pass over text."""
+    found: dict[tuple[str, str], str] = {}
+    for match in QUANTITY_RE.finditer(text):
+        number = match["num"]
+        if match["unit"]:
+            slots = UNIT_SPELLINGS[match["unit"]]
+            # "in" followed by "1" is also an "N in 1" set
+            if match["unit"] == "in" and _IN1_TAIL.match(text, match.end()):
+                slots = slots + [("quantity", "in1")]
+        elif match["quote"]:
+            slots = UNIT_SPELLINGS['"']
+        elif match["in1"]:
+            slots = [("quantity", "in1")]
+        else:
+            slots = [("quantity", "set")]
+            number = match["set"]
+        for slot in slots:
+            if slot not in found:
+                found[slot] = number.rpartition(".")[2] if slot[1] in _INTEGER_UNITS else number
+    return found
+
+
 # Material keywords
 MATERIALS = {
     "plastic": ["plastic", "abs", "pvc", "acrylic", "polycarbonate", "resin"],
@@ -127,6 +206,10 @@ FEATURES = [
     "charger", "wireless charging", "fast charging",
 ]
 
+# Bit position of each feature in ProductSpecs.feature_mask
+_check_lowercase(FEATURES)
+FEATURE_INDEX = {f: i for i, f in enumerate(FEATURES)}
+
 # Product type keywords (for type matching)
 PRODUCT_TYPES = {
     "lamp": ["lamp", "light", "lighting", "bulb", "fixture", "lantern", "sconce"],
@@ -139,17 +222,77 @@ PRODUCT_TYPES = {
 }
 
 
+def _keyword_table(vocabulary: dict[str, list[str]]) -> tuple[tuple[str, str], ...]:
+    """Flatten a label -> keywords vocabulary into (keyword, label) pairs.
+
+    Pairs keep the vocabulary's order, so the first keyword found in a text
+    gives the same label as checking each label's keywords in turn. Keywords
+    that contain a keyword of their own or an earlier label (e.g. "wooden"
+    after "wood") can never decide the label and are left out.
+
+    Labels are interned, so every extracted value is one shared string and
+    equality checks in calculate_similarity hit the identity fast path.
+    """
+    table = []
+    decided: list[str] = []  # keywords of this and earlier labels
+    for label, keywords in vocabulary.items():
+        label = sys.intern(label)
+        _check_lowercase(keywords)
+        decided.extend(keywords)
+        for kw in keywords:
+            if not any(other in kw and other != kw for other in decided):
+                table.append((kw, label))
+    return tuple(table)
+
+
+# Built once at import; scanned with plain substring checks (C-level search)
+_MATERIAL_KEYWORDS = _keyword_table(MATERIALS)
+_POWER_SOURCE_KEYWORDS = _keyword_table(POWER_SOURCES)
+_CONNECTIVITY_KEYWORDS = _keyword_table(CONNECTIVITY)
+_PRODUCT_TYPE_KEYWORDS = _keyword_table(PRODUCT_TYPES)
+
+
+def _first_label(text: str, table: tuple[tuple[str, str], ...]) -> str | None:
+    """Label of the first keyword from table that appears in text."""
+    for kw, label in table:
+        if kw in text:
+            return label
+    return None
+
+
 def extract_specs(title: str, description: str = "", weight_grams: int | None = None) -> ProductSpecs:
     """Extract product specs from title and description.
 
+    Results are memoized per (title, description, weight_grams), so the same
+    Amazon listing compared against many source products is parsed once.
+
     Args:
         title: Product title
         description: Product description (optional)
         weight_grams: Known weight in grams (e.g., from CJ data)
 
     Returns:
-        ProductSpecs with extracted values
+        ProductSpecs with extracted values (a fresh copy the caller may modify)
+    """
+    return _copy_specs(_extract_specs_cached(title, description, weight_grams))
+
+
+def _copy_specs(specs: ProductSpecs) -> ProductSpecs:
+    """Copy of cached specs that callers can modify freely."""
+    return replace(specs, features=list(specs.features))
+
+
+def extract_product_type(title: str, description: str = "") -> str | None:
+    """Detect only the product type, as extract_specs would.
+
+    A cheap pre-check for candidates that can be rejected on type alone.
     """
+    return _first_label(f"{title} {description}".lower(), _PRODUCT_TYPE_KEYWORDS)
+
+
+@lru_cache(maxsize=8192)
+def _extract_specs_cached(title: str, description: str, weight_grams: int | None) -> ProductSpecs:
+    """Uncached extraction behind extract_specs; never hand the result out directly."""
     text = f"{title} {description}".lower()
     specs = ProductSpecs(raw_title=title)
 
@@ -157,138 +300,216 @@ def extract_specs(title: str, description: str = "", weight_grams: int | None =
     if weight_grams:
         specs.weight_grams = weight_grams
 
-    # Extract quantitative specs using regex
-    for field_name, patterns in PATTERNS.items():
+    # Extract quantitative specs (one regex scan for all fields)
+    found = _find_quantities(text)
+    for field_name, converters in FIELD_UNITS.items():
         if field_name == "weight_grams" and specs.weight_grams:
             continue  # Skip if already set
 
-        for pattern, converter in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
+        for unit, converter in converters.items():
+            if (field_name, unit) in found:
                 try:
-                    setattr(specs, field_name, converter(match))
+                    setattr(specs, field_name, converter(found[field_name, unit]))
                     break
                 except (ValueError, TypeError):
                     continue
 
-    # Extract material
-    for material, keywords in MATERIALS.items():
-        if any(kw in text for kw in keywords):
-            specs.material = material
-            break
-
-    # Extract power source
-    for source, keywords in POWER_SOURCES.items():
-        if any(kw in text for kw in keywords):
-            specs.power_source = source
-            break
-
-    # Extract connectivity
-    for conn, keywords in CONNECTIVITY.items():
-        if any(kw in text for kw in keywords):
-            specs.connectivity = conn
-            break
+    # Extract qualitative specs (first matching label per vocabulary)
+    specs.material = _first_label(text, _MATERIAL_KEYWORDS)
+    specs.power_source = _first_label(text, _POWER_SOURCE_KEYWORDS)
+    specs.connectivity = _first_label(text, _CONNECTIVITY_KEYWORDS)
 
     # Extract features
     specs.features = [f for f in FEATURES if f in text]
+    for f in specs.features:
+        specs.feature_mask |= 1 << FEATURE_INDEX[f]
 
     # Extract product type
-    for ptype, keywords in PRODUCT_TYPES.items():
-        if any(kw in text for kw in keywords):
-            specs.product_type = ptype
-            break
+    specs.product_type = _first_label(text, _PRODUCT_TYPE_KEYWORDS)
 
     return specs
 
 
-def calculate_similarity(spec1: ProductSpecs, spec2: ProductSpecs) -> float:
+# Similarity of products with different known types (near zero)
+TYPE_MISMATCH_SIMILARITY = 0.05
+
+# Quantitative comparisons: field, weight, tolerance (relative difference scoring 0)
+QUANT_FIELDS = (
+    ("weight_grams", 0.15, 0.5),  # 50% - more lenient
+    ("capacity_ml", 0.10, 0.4),
+    ("power_watts", 0.08, 0.4),
+    ("lumens", 0.08, 0.4),
+    ("battery_mah", 0.08, 0.4),
+    ("quantity", 0.06, 0.3),
+)
+
+# Qualitative comparisons (exact match or not): field, weight
+QUAL_FIELDS = (
+    ("material", 0.10),
+    ("power_source", 0.08),
+    ("connectivity", 0.08),
+)
+
+# Weight of feature overlap (Jaccard similarity)
+FEATURE_WEIGHT = 0.15
+
+# Slack for float rounding when ruling a candidate out before scoring every field
+_EARLY_EXIT_EPSILON = 1e-9
+
+# Attribute getters for the compared fields (avoids string-based getattr per candidate)
+FIELD_GETTERS = {
+    field_name: attrgetter(field_name)
+    for field_name in [f for f, _, _ in QUANT_FIELDS] + [f for f, _ in QUAL_FIELDS]
+}
+
+
+@dataclass(slots=True)
+class _SimilarityProfile:
+    """One side of a comparison, reduced to the fields it can be compared on.
+
+    Built once per source product so a batch of candidates only checks the
+    fields the source actually has.
+    """
+
+    product_type: str | None
+    quant: list[tuple[attrgetter, float, float, float]]  # getter, value, weight, tolerance
+    qual: list[tuple[attrgetter, str, float]]  # getter, value, weight
+    feature_mask: int
+    # Most weight the fields after each comparison stage can still add
+    weight_after_quant: float = 0.0
+    weight_after_qual: float = 0.0
+
+
+def _similarity_profile(specs: ProductSpecs) -> _SimilarityProfile:
+    """Resolve the comparable fields of specs."""
+    profile = _SimilarityProfile(
+        product_type=specs.product_type,
+        quant=[
+            (FIELD_GETTERS[field_name], value, weight, tolerance)
+            for field_name, weight, tolerance in QUANT_FIELDS
+            if (value := getattr(specs, field_name)) is not None
+        ],
+        qual=[
+            (FIELD_GETTERS[field_name], value, weight)
+            for field_name, weight in QUAL_FIELDS
+            if (value := getattr(specs, field_name)) is not None
+        ],
+        feature_mask=specs.feature_mask,
+    )
+    profile.weight_after_qual = FEATURE_WEIGHT if specs.feature_mask else 0.0
+    profile.weight_after_quant = (
+        sum(weight for _, _, weight in profile.qual) + profile.weight_after_qual
+    )
+    return profile
+
+
+def calculate_similarity(
+    spec1: ProductSpecs,
+    spec2: ProductSpecs,
+    min_similarity: float = 0.0,
+) -> float:
     """Calculate similarity score between two products.
 
+    Args:
+        spec1: First product's specs
+        spec2: Second product's specs
+        min_similarity: Stop early and return 0.0 once the score can no
+            longer reach this value (exact scores are only guaranteed above it)
+
     Returns:
         Similarity score from 0.0 to 1.0
     """
+    return _profile_similarity(_similarity_profile(spec1), spec2, min_similarity)
+
+
+def _cannot_reach(
+    weighted_sum: float,
+    total_weight: float,
+    remaining_weight: float,
+    min_similarity: float,
+) -> bool:
+    """Whether the weighted mean stays below min_similarity even if every
+    remaining field scored 1.0."""
+    if not total_weight:
+        return False  # Nothing compared yet; the baseline may still apply
+    best = (weighted_sum + remaining_weight) / (total_weight + remaining_weight)
+    return best < min_similarity - _EARLY_EXIT_EPSILON
+
+
+def _profile_similarity(
+    profile: _SimilarityProfile,
+    spec2: ProductSpecs,
+    min_similarity: float = 0.0,
+) -> float:
+    """Similarity between a resolved profile and another product's specs."""
     # Product type is critical - different types = very low similarity
-    if spec1.product_type and spec2.product_type:
-        if spec1.product_type != spec2.product_type:
-            return 0.05  # Different product types = near zero similarity
+    if profile.product_type and spec2.product_type:
+        if profile.product_type != spec2.product_type:
+            return TYPE_MISMATCH_SIMILARITY
         type_match = True
     else:
         type_match = False
 
-    scores = []
-    weights = []
+    # Weighted mean of per-field scores, accumulated as fields are compared
+    weighted_sum = 0.0
+    total_weight = 0.0
 
     # Product type match bonus (if both have types and match)
     if type_match:
-        scores.append(1.0)
-        weights.append(0.30)  # 30% weight for matching type
+        weighted_sum += 0.30  # 30% weight for matching type, score 1.0
+        total_weight += 0.30
 
     # Quantitative comparisons (weighted by importance)
-    quant_fields = [
-        ("weight_grams", 0.15, 0.5),  # field, weight, tolerance (50% - more lenient)
-        ("capacity_ml", 0.10, 0.4),
-        ("power_watts", 0.08, 0.4),
-        ("lumens", 0.08, 0.4),
-        ("battery_mah", 0.08, 0.4),
-        ("quantity", 0.06, 0.3),
-    ]
-
-    for field_name, weight, tolerance in quant_fields:
-        val1 = getattr(spec1, field_name)
-        val2 = getattr(spec2, field_name)
-
-        if val1 is not None and val2 is not None:
+    for getter, val1, weight, tolerance in profile.quant:
+        val2 = getter(spec2)
+
+        if val2 is not None:
             # Calculate how close they are within tolerance
             max_val = max(val1, val2)
             if max_val > 0:
                 diff_pct = abs(val1 - val2) / max_val
                 score = max(0, 1 - (diff_pct / tolerance))
-                scores.append(score)
-                weights.append(weight)
+                weighted_sum += score * weight
+                total_weight += weight
+
+    if _cannot_reach(weighted_sum, total_weight, profile.weight_after_quant, min_similarity):
+        return 0.0
 
     # Qualitative comparisons (exact match or not)
-    qual_fields = [
-        ("material", 0.10),
-        ("power_source", 0.08),
-        ("connectivity", 0.08),
-    ]
-
-    for field_name, weight in qual_fields:
-        val1 = getattr(spec1, field_name)
-        val2 = getattr(spec2, field_name)
-
-        if val1 is not None and val2 is not None:
-            score = 1.0 if val1 == val2 else 0.0
-            scores.append(score)
-            weights.append(weight)
-
-    # Feature overlap (Jaccard similarity)
-    if spec1.features and spec2.features:
-        set1 = set(spec1.features)
-        set2 = set(spec2.features)
-        intersection = len(set1 & set2)
-        union = len(set1 | set2)
-        if union > 0:
-            feature_score = intersection / union
-            scores.append(feature_score)
-            weights.append(0.15)
+    for getter, val1, weight in profile.qual:
+        val2 = getter(spec2)
 
-    # If no specs could be compared, use a baseline based on having same type
-    if not scores:
-        return 0.3 if type_match else 0.1
+        if val2 is not None:
+            if val1 == val2:
+                weighted_sum += weight
+            total_weight += weight
 
-    total_weight = sum(weights)
-    if total_weight == 0:
+    if _cannot_reach(weighted_sum, total_weight, profile.weight_after_qual, min_similarity):
+        return 0.0
+
+    # Feature overlap (Jaccard similarity on the feature bitmasks)
+    if profile.feature_mask and spec2.feature_mask:
+        intersection = (profile.feature_mask & spec2.feature_mask).bit_count()
+        union = (profile.feature_mask | spec2.feature_mask).bit_count()
+        weighted_sum += intersection / union * FEATURE_WEIGHT
+        total_weight += FEATURE_WEIGHT
+
+    # If no specs could be compared, use a baseline based on having same type
+    if not total_weight:
         return 0.3 if type_match else 0.1
 
-    weighted_sum = sum(s * w for s, w in zip(scores, weights))
     return weighted_sum / total_weight
 
 
+# Below this many candidates, process startup outweighs parallel scoring
+PARALLEL_MIN_PRODUCTS = 256
+
+
 def filter_similar_products(
     source_specs: ProductSpecs,
     amazon_products: list[dict],
     min_similarity: float = 0.3,
+    workers: int | None = None,
 ) -> list[tuple[dict, ProductSpecs, float]]:
     """Filter Amazon products by similarity to source product.
 
@@ -296,19 +517,30 @@ def filter_similar_products(
         source_specs: Specs of the source product (CJ)
         amazon_products: List of Amazon product dicts with 'title', 'price', etc.
         min_similarity: Minimum similarity score to include (0.0-1.0)
+        workers: Score in this many processes when there are more than
+            PARALLEL_MIN_PRODUCTS candidates (default: in-process)
 
     Returns:
         List of (product, specs, similarity_score) tuples, sorted by similarity desc
     """
-    results = []
-
-    for product in amazon_products:
-        title = product.get("title", "")
-        amazon_specs = extract_specs(title)
-        similarity = calculate_similarity(source_specs, amazon_specs)
+    total = len(amazon_products)
+    if workers and workers > 1 and total > PARALLEL_MIN_PRODUCTS:
+        chunk_size = -(-total // workers)
+        starts = range(0, total, chunk_size)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = pool.map(
+                _score_candidates,
+                repeat(source_specs),
+                [amazon_products[start:start + chunk_size] for start in starts],
+                repeat(min_similarity),
+                starts,
+            )
+            scored = [hit for part in parts for hit in part]
+    else:
+        scored = _score_candidates(source_specs, amazon_products, min_similarity)
 
-        if similarity >= min_similarity:
-            results.append((product, amazon_specs, similarity))
+    # Workers return indexes so results hold the caller's own product dicts
+    results = [(amazon_products[index], specs, similarity) for index, specs, similarity in scored]
 
     # Sort by similarity descending
     results.sort(key=lambda x: x[2], reverse=True)
@@ -316,6 +548,42 @@ def filter_similar_products(
     return results
 
 
+def _score_candidates(
+    source_specs: ProductSpecs,
+    amazon_products: list[dict],
+    min_similarity: float,
+    offset: int = 0,
+) -> list[tuple[int, ProductSpecs, float]]:
+    """Score candidates against the source, keeping those at or above min_similarity.
+
+    Returns:
+        (index into the full candidate list, specs, similarity) in input order
+    """
+    scored = []
+    profile = _similarity_profile(source_specs)
+
+    # A type mismatch alone decides the score, so such candidates can be
+    # dropped before the full extraction when they'd fall below the threshold
+    skip_mismatched_types = bool(source_specs.product_type) and (
+        TYPE_MISMATCH_SIMILARITY < min_similarity
+    )
+
+    for index, product in enumerate(amazon_products, start=offset):
+        title = product.get("title", "")
+        if skip_mismatched_types:
+            product_type = extract_product_type(title)
+            if product_type and product_type != source_specs.product_type:
+                continue
+        # Score against the shared cached specs; only kept candidates get a copy
+        amazon_specs = _extract_specs_cached(title, "", None)
+        similarity = _profile_similarity(profile, amazon_specs, min_similarity)
+
+        if similarity >= min_similarity:
+            scored.append((index, _copy_specs(amazon_specs), similarity))
+
+    return scored
+
+
 def calculate_market_price(
     similar_products: list[tuple[dict, ProductSpecs, float]],
     weight_by_similarity: bool = True,
@@ -340,8 +608,10 @@ def calculate_market_price(
             "sample_size": 0,
         }
 
-    prices = []
-    weights = []
+    # (price, weight) pairs; weight totals accumulate in the same pass
+    pairs = []
+    total_weight = 0.0
+    weighted_sum = 0.0
 
     for product, specs, similarity in similar_products:
         price = product.get("price")
@@ -357,13 +627,14 @@ def calculate_market_price(
         if weight_by_reviews:
             reviews = product.get("review_count", 0)
             # Log scale for reviews: 1 review = 1, 100 reviews = 2, 10000 = 3
-            review_weight = 1 + (0.5 * (len(str(reviews + 1)) - 1))
+            review_weight = 1 + (0.5 * math.floor(math.log10(reviews + 1)))
             weight *= review_weight
 
-        prices.append(price)
-        weights.append(weight)
+        pairs.append((price, weight))
+        total_weight += weight
+        weighted_sum += price * weight
 
-    if not prices:
+    if not pairs:
         return {
             "weighted_median": None,
             "weighted_avg": None,
@@ -373,15 +644,15 @@ def calculate_market_price(
         }
 
     # Weighted average
-    total_weight = sum(weights)
-    weighted_avg = sum(p * w for p, w in zip(prices, weights)) / total_weight
+    weighted_avg = weighted_sum / total_weight
 
-    # Weighted median (approximate using sorted weighted values)
-    sorted_pairs = sorted(zip(prices, weights))
+    # Weighted median (approximate using sorted weighted values); the sorted
+    # pairs also give min and max
+    pairs.sort()
     cumsum = 0
-    weighted_median = sorted_pairs[0][0]
+    weighted_median = pairs[0][0]
     half_weight = total_weight / 2
-    for price, weight in sorted_pairs:
+    for price, weight in pairs:
         cumsum += weight
         if cumsum >= half_weight:
             weighted_median = price
@@ -390,7 +661,7 @@ def calculate_market_price(
     return {
         "weighted_median": round(weighted_median, 2),
         "weighted_avg": round(weighted_avg, 2),
-        "min": round(min(prices), 2),
-        "max": round(max(prices), 2),
-        "sample_size": len(prices),
+        "min": round(pairs[0][0], 2),
+        "max": round(pairs[-1][0], 2),
+        "sample_size": len(pairs),
     }
@@ -1,45 +1,116 @@
-"""Pytest fixtures for database testing."""
+"""Shared pytest fixtures: test database and integration configs."""
 
+import sys
+import types
 from collections.abc import AsyncGenerator
 from typing import Any
+from unittest.mock import MagicMock
 
 import pytest
 import pytest_asyncio
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
 
-from ecom_arb.api.app import app
-from ecom_arb.db.base import Base, get_db
+
+def _install_google_ads_stub() -> None:
+    """Register light stand-ins for the google-ads modules the app imports.
+
+    Importing google.ads.googleads loads its full protobuf descriptor set
+    (a large share of cold test startup), while every test patches the API
+    client anyway. Must run before ecom_arb is imported; a no-op if the
+    real package is already loaded.
+    """
+    if "google.ads.googleads" in sys.modules:
+        return
+
+    class GoogleAdsException(Exception):
+        """Mirrors google.ads.googleads.errors.GoogleAdsException."""
+
+        def __init__(self, error: Any, call: Any, failure: Any, request_id: str) -> None:
+            self.error = error
+            self.call = call
+            self.failure = failure
+            self.request_id = request_id
+
+    client = types.ModuleType("google.ads.googleads.client")
+    client.GoogleAdsClient = MagicMock(name="GoogleAdsClient")
+    errors = types.ModuleType("google.ads.googleads.errors")
+    errors.GoogleAdsException = GoogleAdsException
+    googleads = types.ModuleType("google.ads.googleads")
+    googleads.client, googleads.errors = client, errors
+    ads = types.ModuleType("google.ads")
+    ads.googleads = googleads
+
+    sys.modules.update({
+        "google.ads": ads,
+        "google.ads.googleads": googleads,
+        "google.ads.googleads.client": client,
+        "google.ads.googleads.errors": errors,
+    })
+
+
+_install_google_ads_stub()
+
+from ecom_arb.api.app import app  # noqa: E402
+from ecom_arb.db.base import Base, get_db  # noqa: E402
+from ecom_arb.integrations.google_ads import GoogleAdsConfig  # noqa: E402
 
 
 # Use SQLite in-memory for tests
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
 
-@pytest_asyncio.fixture
-async def test_db() -> AsyncGenerator[AsyncSession, None]:
-    """Provide a test database session with isolated transactions.
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def test_engine() -> AsyncGenerator[AsyncEngine, None]:
+    """Provide one in-memory database engine for the whole test session.
 
-    Creates an in-memory SQLite database, creates all tables,
-    and yields a session. Overrides app's get_db dependency.
+    Tables are created once. StaticPool keeps a single connection so every
+    test sees the same in-memory database.
     """
-    # Create test engine
     engine = create_async_engine(
         TEST_DATABASE_URL,
         echo=False,
+        poolclass=StaticPool,
     )
 
-    # Create all tables
+    # pysqlite's implicit transaction handling breaks SAVEPOINT; let
+    # SQLAlchemy emit BEGIN itself so per-test rollbacks are reliable
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_implicit_begin(dbapi_connection: Any, connection_record: Any) -> None:
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn: Any) -> None:
+        conn.exec_driver_sql("BEGIN")
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
-    # Create session
-    async_session_maker = async_sessionmaker(
-        engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
+    yield engine
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def test_db(test_engine: AsyncEngine) -> AsyncGenerator[AsyncSession, None]:
+    """Provide a test database session with isolated transactions.
+
+    Each test runs inside an outer transaction that is rolled back
+    afterwards; commits made by the code under test only release a
+    SAVEPOINT. Overrides app's get_db dependency.
+    """
+    async with test_engine.connect() as conn:
+        trans = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
 
-    async with async_session_maker() as session:
         # Override app's get_db dependency
         async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
             try:
@@ -55,10 +126,17 @@ async def test_db() -> AsyncGenerator[AsyncSession, None]:
         finally:
             # Clean up
             app.dependency_overrides.clear()
-            await session.rollback()
+            await session.close()
+            await trans.rollback()
 
-    # Drop all tables after test
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
 
-    await engine.dispose()
+@pytest.fixture(scope="session")
+def google_ads_config() -> GoogleAdsConfig:
+    """Valid Google Ads config (only read by clients, so built once)."""
+    return GoogleAdsConfig(
+        client_id="test-client-id.apps.googleusercontent.com",
+        client_secret="test-secret",
+        refresh_token="test-refresh-token",
+        developer_token="test-dev-token",
+        customer_id="123-456-7890",
+    )
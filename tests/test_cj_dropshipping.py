@@ -10,10 +10,13 @@ See: PLAN/04_risks_and_spikes.md (SPIKE-003)
 """
 
 from decimal import Decimal
-from unittest.mock import MagicMock, patch
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
+import requests
 
+from ecom_arb.integrations import cj_dropshipping
 from ecom_arb.integrations.cj_dropshipping import (
     CJConfig,
     CJDropshippingClient,
@@ -25,6 +28,247 @@ from ecom_arb.integrations.cj_dropshipping import (
     ProductVariant,
 )
 
+# Expected Decimal amounts, parsed once instead of per assertion
+_D_19_99 = Decimal("19.99")
+_D_4_71 = Decimal("4.71")
+_D_2_50 = Decimal("2.50")
+_D_24_70 = Decimal("24.70")
+_D_0_5 = Decimal("0.5")
+_D_30_54 = Decimal("30.54")
+
+
+# Canned API payloads. The client only reads them, so they are built once
+# and shared read-only (mappings as MappingProxyType, lists as tuples).
+
+_ACCESS_TOKEN_DATA = MappingProxyType({
+    "accessToken": "test-access-token",
+    "accessTokenExpiryDate": "2025-01-15T00:00:00Z",
+    "refreshToken": "test-refresh-token",
+    "refreshTokenExpiryDate": "2025-06-15T00:00:00Z",
+})
+
+_REFRESH_TOKEN_DATA = MappingProxyType({
+    "accessToken": "new-access-token",
+    "accessTokenExpiryDate": "2025-01-30T00:00:00Z",
+    "refreshToken": "new-refresh-token",
+    "refreshTokenExpiryDate": "2025-07-01T00:00:00Z",
+})
+
+_PRODUCT_LIST_DATA = MappingProxyType({
+    "pageNum": 1,
+    "pageSize": 20,
+    "total": 100,
+    "list": (
+        MappingProxyType({
+            "pid": "product-123",
+            "productName": "Test Product",
+            "productNameEn": "Test Product EN",
+            "productSku": "SKU-123",
+            "productImage": "https://example.com/image.jpg",
+            "sellPrice": 19.99,
+            "categoryId": "cat-1",
+            "categoryName": "Electronics",
+            "listedNum": 500,
+            "supplierId": "sup-1",
+            "supplierName": "Test Supplier",
+        }),
+    ),
+})
+
+_EMPTY_PRODUCT_LIST_DATA = MappingProxyType({
+    "pageNum": 1,
+    "pageSize": 20,
+    "total": 5,
+    "list": (),
+})
+
+_VARIANT_DATA = MappingProxyType({
+    "vid": "variant-1",
+    "variantName": "Black",
+    "variantNameEn": "Black",
+    "variantSku": "SKU-123-BLK",
+    "variantWeight": 0.5,
+    "variantSellPrice": 19.99,
+})
+
+_PRODUCT_DETAIL_DATA = MappingProxyType({
+    "pid": "product-123",
+    "productName": "Test Product",
+    "productNameEn": "Test Product EN",
+    "productSku": "SKU-123",
+    "productImage": "https://example.com/image.jpg",
+    "productWeight": 0.5,
+    "productType": "NORMAL",
+    "categoryId": "cat-1",
+    "categoryName": "Electronics",
+    "description": "Product description",
+    "variants": (_VARIANT_DATA,),
+})
+
+_USPS_FREIGHT_DATA = MappingProxyType({
+    "logisticName": "USPS+",
+    "logisticPrice": 4.71,
+    "logisticPriceCn": 30.54,
+    "logisticAging": "2-5",
+})
+
+_FREIGHT_OPTIONS_DATA = (
+    _USPS_FREIGHT_DATA,
+    MappingProxyType({
+        "logisticName": "CJPacket Ordinary",
+        "logisticPrice": 2.50,
+        "logisticPriceCn": 16.20,
+        "logisticAging": "7-15",
+    }),
+)
+
+_SINGLE_FREIGHT_OPTION_DATA = (
+    MappingProxyType({
+        "logisticName": "Standard",
+        "logisticPrice": 3.00,
+        "logisticPriceCn": 19.50,
+        "logisticAging": "5-10",
+    }),
+)
+
+_CREATED_ORDER_DATA = MappingProxyType({
+    "orderId": "order-123",
+    "orderNumber": "ORD-2025-001",
+    "shipmentOrderId": "ship-456",
+    "postageAmount": 4.71,
+    "productAmount": 19.99,
+    "orderAmount": 24.70,
+    "orderStatus": "CREATED",
+    "productInfoList": (
+        MappingProxyType({"vid": "variant-1", "quantity": 1}),
+    ),
+})
+
+_SHIPPED_ORDER_DATA = MappingProxyType({
+    "orderId": "order-123",
+    "orderNumber": "ORD-2025-001",
+    "orderStatus": "SHIPPED",
+    "trackNumber": "TRACK123456",
+    "postageAmount": 4.71,
+    "productAmount": 19.99,
+    "orderAmount": 24.70,
+})
+
+_ORDER_LIST_DATA = MappingProxyType({
+    "pageNum": 1,
+    "pageSize": 20,
+    "total": 2,
+    "list": (
+        MappingProxyType({
+            "orderId": "order-1",
+            "orderNumber": "ORD-001",
+            "orderStatus": "CREATED",
+            "postageAmount": 4.71,
+            "productAmount": 19.99,
+            "orderAmount": 24.70,
+        }),
+        MappingProxyType({
+            "orderId": "order-2",
+            "orderNumber": "ORD-002",
+            "orderStatus": "SHIPPED",
+            "trackNumber": "TRACK789",
+            "postageAmount": 5.00,
+            "productAmount": 29.99,
+            "orderAmount": 34.99,
+        }),
+    ),
+})
+
+_VARIANT_DETAIL_DATA = MappingProxyType({
+    "vid": "v-123",
+    "variantName": "Black / Large",
+    "variantNameEn": "Black / Large",
+    "variantSku": "SKU-BLK-L",
+    "variantWeight": 0.5,
+    "variantSellPrice": 19.99,
+})
+
+
+_BASE_ORDER_KWARGS = MappingProxyType({
+    "order_number": "ORD-2025-001",
+    "shipping_country_code": "US",
+    "shipping_country": "United States",
+    "shipping_province": "California",
+    "shipping_city": "Los Angeles",
+    "shipping_address": "123 Main St",
+    "shipping_zip": "90001",
+    "shipping_customer_name": "John Doe",
+    "shipping_phone": "555-1234",
+    "logistic_name": "USPS+",
+    "from_country_code": "CN",
+    "products": [{"vid": "variant-1", "quantity": 1}],
+})
+
+
+def _order_kwargs(**overrides):
+    """create_order() arguments: the shared valid order with overrides applied."""
+    return {**_BASE_ORDER_KWARGS, **overrides}
+
+
+def _make_response(data, code=200, result=True, message="Success"):
+    """Build a fake CJ API response wrapping data in the standard envelope.
+
+    A plain namespace is enough here; MagicMock is only needed where a test
+    sets side effects.
+    """
+    payload = {
+        "code": code,
+        "result": result,
+        "message": message,
+        "data": data,
+        "requestId": "test-request-id",
+    }
+    return SimpleNamespace(
+        status_code=200,
+        json=lambda: payload,
+        raise_for_status=lambda: None,
+    )
+
+
+@pytest.fixture
+def patched_requests():
+    """Replace requests.get/post used by the CJ client with MagicMocks.
+
+    Plain attribute swaps, restored after the test, instead of patch() calls.
+    """
+    http = cj_dropshipping.requests
+    original_get, original_post = http.get, http.post
+    http.get, http.post = MagicMock(), MagicMock()
+    try:
+        yield http
+    finally:
+        http.get, http.post = original_get, original_post
+
+
+@pytest.fixture(scope="session")
+def config():
+    """Valid CJ config (immutable in use, so built once)."""
+    return CJConfig(api_key="CJ123@api@abc123def456")
+
+
+@pytest.fixture(scope="module")
+def authed_client(config):
+    """Client with a token preset, shared by the module.
+
+    Requests go through the mocked HTTP layer and never touch the
+    tokens, so no state leaks between tests.
+    """
+    client = CJDropshippingClient(config)
+    client._access_token = "test-token"
+    client._refresh_token = "test-refresh-token"
+    return client
+
+
+@pytest.fixture
+def fresh_client(config):
+    """Unauthenticated client, rebuilt for tests that set or need no token."""
+    return CJDropshippingClient(config)
+
 
 class TestCJConfig:
     """Tests for CJConfig dataclass."""
@@ -48,216 +292,97 @@ class TestCJConfig:
 class TestCJDropshippingClient:
     """Tests for CJDropshippingClient."""
 
-    @pytest.fixture
-    def config(self):
-        """Valid CJ config."""
-        return CJConfig(api_key="CJ123@api@abc123def456")
-
-    @pytest.fixture
-    def mock_response(self):
-        """Create mock response factory."""
-        def _make_response(data, code=200, result=True, message="Success"):
-            response = MagicMock()
-            response.status_code = 200
-            response.json.return_value = {
-                "code": code,
-                "result": result,
-                "message": message,
-                "data": data,
-                "requestId": "test-request-id",
-            }
-            return response
-        return _make_response
-
     # Authentication tests
 
-    @patch("ecom_arb.integrations.cj_dropshipping.requests.post")
-    def test_get_access_token_success(self, mock_post, config, mock_response):
+    def test_get_access_token_success(self, patched_requests, fresh_client):
         """Successfully gets access token."""
-        mock_post.return_value = mock_response({
-            "accessToken": "test-access-token",
-            "accessTokenExpiryDate": "2025-01-15T00:00:00Z",
-            "refreshToken": "test-refresh-token",
-            "refreshTokenExpiryDate": "2025-06-15T00:00:00Z",
-        })
+        patched_requests.post.return_value = _make_response(_ACCESS_TOKEN_DATA)
 
-        client = CJDropshippingClient(config)
-        token = client.get_access_token()
+        token = fresh_client.get_access_token()
 
         assert token == "test-access-token"
-        assert client._access_token == "test-access-token"
-        assert client._refresh_token == "test-refresh-token"
-
-    @patch("ecom_arb.integrations.cj_dropshipping.requests.post")
-    def test_get_access_token_failure(self, mock_post, config, mock_response):
-        """Failed auth raises CJError."""
-        mock_post.return_value = mock_response(
-            None, code=1600100, result=False, message="Invalid API key"
-        )
-
-        client = CJDropshippingClient(config)
-        with pytest.raises(CJError, match="Invalid API key"):
-            client.get_access_token()
+        assert fresh_client._access_token == "test-access-token"
+        assert fresh_client._refresh_token == "test-refresh-token"
 
-    @patch("ecom_arb.integrations.cj_dropshipping.requests.post")
-    def test_refresh_access_token(self, mock_post, config, mock_response):
+    def test_refresh_access_token(self, patched_requests, fresh_client):
         """Successfully refreshes access token."""
-        mock_post.return_value = mock_response({
-            "accessToken": "new-access-token",
-            "accessTokenExpiryDate": "2025-01-30T00:00:00Z",
-            "refreshToken": "new-refresh-token",
-            "refreshTokenExpiryDate": "2025-07-01T00:00:00Z",
-        })
+        patched_requests.post.return_value = _make_response(_REFRESH_TOKEN_DATA)
 
-        client = CJDropshippingClient(config)
-        client._refresh_token = "old-refresh-token"
-        token = client.refresh_access_token()
+        fresh_client._refresh_token = "old-refresh-token"
+        token = fresh_client.refresh_access_token()
 
         assert token == "new-access-token"
-        assert client._access_token == "new-access-token"
+        assert fresh_client._access_token == "new-access-token"
+
+    def test_close_drops_tokens(self, fresh_client):
+        """close() forgets cached tokens."""
+        fresh_client._access_token = "test-token"
+        fresh_client._refresh_token = "test-refresh-token"
+
+        fresh_client.close()
+
+        assert fresh_client._access_token is None
+        assert fresh_client._refresh_token is None
 
     # Product catalog tests
 
-    @patch("ecom_arb.integrations.cj_dropshipping.requests.get")
-    def test_list_products_success(self, mock_get, config, mock_response):
+    def test_list_products_success(self, patched_requests, authed_client):
         """Successfully lists products."""
-        mock_get.return_value = mock_response({
-            "pageNum": 1,
-            "pageSize": 20,
-            "total": 100,
-            "list": [
-                {
-                    "pid": "product-123",
-                    "productName": "Test Product",
-                    "productNameEn": "Test Product EN",
-                    "productSku": "SKU-123",
-                    "productImage": "https://example.com/image.jpg",
-                    "sellPrice": 19.99,
-                    "categoryId": "cat-1",
-                    "categoryName": "Electronics",
-                    "listedNum": 500,
-                    "supplierId": "sup-1",
-                    "supplierName": "Test Supplier",
-                },
-            ],
-        })
-
-        client = CJDropshippingClient(config)
-        client._access_token = "test-token"
-        products = client.list_products(page=1, page_size=20)
+        patched_requests.get.return_value = _make_response(_PRODUCT_LIST_DATA)
+
+        products = authed_client.list_products(page=1, page_size=20)
 
         assert len(products) == 1
         assert products[0].pid == "product-123"
         assert products[0].name == "Test Product EN"
         assert products[0].sku == "SKU-123"
-        assert products[0].sell_price == Decimal("19.99")
+        assert products[0].sell_price == _D_19_99
 
-    @patch("ecom_arb.integrations.cj_dropshipping.requests.get")
-    def test_list_products_with_keyword(self, mock_get, config, mock_response):
+    def test_list_products_with_keyword(self, patched_requests, authed_client):
         """Lists products filtered by keyword."""
-        mock_get.return_value = mock_response({
-            "pageNum": 1,
-            "pageSize": 20,
-            "total": 5,
-            "list": [],
-        })
-
-        client = CJDropshippingClient(config)
-        client._access_token = "test-token"
-        client.list_products(keyword="fitness tracker")
-
-        call_args = mock_get.call_args
+        patched_requests.get.return_value = _make_response(_EMPTY_PRODUCT_LIST_DATA)
+
+        authed_client.list_products(keyword="fitness tracker")
+
+        call_args = patched_requests.get.call_args
         params = call_args.kwargs.get("params", {})
         assert "productNameEn" in params and params["productNameEn"] == "fitness tracker"
 
-    @patch("ecom_arb.integrations.cj_dropshipping.requests.get")
-    def test_get_product_by_id(self, mock_get, config, mock_response):
-        """Gets product by ID with variants."""
-        mock_get.return_value = mock_response({
-            "pid": "product-123",
-            "productName": "Test Product",
-            "productNameEn": "Test Product EN",
-            "productSku": "SKU-123",
-            "productImage": "https://example.com/image.jpg",
-            "productWeight": 0.5,
-            "productType": "NORMAL",
-            "categoryId": "cat-1",
-            "categoryName": "Electronics",
-            "description": "Product description",
-            "variants": [
-                {
-                    "vid": "variant-1",
-                    "variantName": "Black",
-                    "variantNameEn": "Black",
-                    "variantSku": "SKU-123-BLK",
-                    "variantWeight": 0.5,
-                    "variantSellPrice": 19.99,
-                },
-            ],
-        })
-
-        client = CJDropshippingClient(config)
-        client._access_token = "test-token"
-        product = client.get_product(pid="product-123")
-
+    @pytest.mark.parametrize(
+        "kwargs,expected_params",
+        [
+            ({"pid": "product-123"}, {"pid": "product-123"}),
+            ({"sku": "SKU-123"}, {"productSku": "SKU-123"}),
+        ],
+        ids=["by_id", "by_sku"],
+    )
+    def test_get_product(
+        self, patched_requests, authed_client, kwargs, expected_params
+    ):
+        """Gets product with variants by ID or by SKU."""
+        patched_requests.get.return_value = _make_response(_PRODUCT_DETAIL_DATA)
+
+        product = authed_client.get_product(**kwargs)
+
+        assert patched_requests.get.call_args.kwargs["params"] == expected_params
         assert product.pid == "product-123"
+        assert product.sku == "SKU-123"
         assert len(product.variants) == 1
         assert product.variants[0].vid == "variant-1"
-        assert product.variants[0].sell_price == Decimal("19.99")
-
-    @patch("ecom_arb.integrations.cj_dropshipping.requests.get")
-    def test_get_product_by_sku(self, mock_get, config, mock_response):
-        """Gets product by SKU."""
-        mock_get.return_value = mock_response({
-            "pid": "product-123",
-            "productName": "Test Product",
-            "productNameEn": "Test Product EN",
-            "productSku": "SKU-123",
-            "productImage": "https://example.com/image.jpg",
-            "productWeight": 0.5,
-            "productType": "NORMAL",
-            "categoryId": "cat-1",
-            "categoryName": "Electronics",
-            "variants": [],
-        })
-
-        client = CJDropshippingClient(config)
-        client._access_token = "test-token"
-        product = client.get_product(sku="SKU-123")
-
-        assert product.sku == "SKU-123"
+        assert product.variants[0].sell_price == _D_19_99
 
-    def test_get_product_requires_id_or_sku(self, config):
+    def test_get_product_requires_id_or_sku(self, authed_client):
         """get_product requires either pid or sku."""
-        client = CJDropshippingClient(config)
-        client._access_token = "test-token"
-
         with pytest.raises(ValueError, match="Either pid or sku must be provided"):
-            client.get_product()
+            authed_client.get_product()
 
     # Freight calculation tests
 
-    @patch("ecom_arb.integrations.cj_dropshipping.requests.post")
-    def test_calculate_freight_success(self, mock_post, config, mock_response):
+    def test_calculate_freight_success(self, patched_requests, authed_client):
         """Successfully calculates freight options."""
-        mock_post.return_value = mock_response([
-            {
-                "logisticName": "USPS+",
-                "logisticPrice": 4.71,
-                "logisticPriceCn": 30.54,
-                "logisticAging": "2-5",
-            },
-            {
-                "logisticName": "CJPacket Ordinary",
-                "logisticPrice": 2.50,
-                "logisticPriceCn": 16.20,
-                "logisticAging": "7-15",
-            },
-        ])
-
-        client = CJDropshippingClient(config)
-        client._access_token = "test-token"
-        options = client.calculate_freight(
+        patched_requests.post.return_value = _make_response(_FREIGHT_OPTIONS_DATA)
+
+        options = authed_client.calculate_freight(
             start_country="CN",
             end_country="US",
             products=[{"vid": "variant-1", "quantity": 2}],
@@ -266,27 +391,17 @@ class TestCJDropshippingClient:
         assert len(options) == 2
         # Sorted by price ascending, so CJPacket (2.50) comes first
         assert options[0].name == "CJPacket Ordinary"
-        assert options[0].price == Decimal("2.50")
+        assert options[0].price == _D_2_50
         assert options[0].delivery_days == "7-15"
         # USPS+ is second (4.71)
         assert options[1].name == "USPS+"
-        assert options[1].price == Decimal("4.71")
+        assert options[1].price == _D_4_71
 
-    @patch("ecom_arb.integrations.cj_dropshipping.requests.post")
-    def test_calculate_freight_with_sku(self, mock_post, config, mock_response):
+    def test_calculate_freight_with_sku(self, patched_requests, authed_client):
         """Calculates freight using SKU instead of variant ID."""
-        mock_post.return_value = mock_response([
-            {
-                "logisticName": "Standard",
-                "logisticPrice": 3.00,
-                "logisticPriceCn": 19.50,
-                "logisticAging": "5-10",
-            },
-        ])
-
-        client = CJDropshippingClient(config)
-        client._access_token = "test-token"
-        options = client.calculate_freight(
+        patched_requests.post.return_value = _make_response(_SINGLE_FREIGHT_OPTION_DATA)
+
+        options = authed_client.calculate_freight(
             start_country="CN",
             end_country="US",
             products=[{"sku": "SKU-123", "quantity": 1}],
@@ -296,126 +411,36 @@ class TestCJDropshippingClient:
 
     # Order creation tests
 
-    @patch("ecom_arb.integrations.cj_dropshipping.requests.post")
-    def test_create_order_success(self, mock_post, config, mock_response):
+    def test_create_order_success(self, patched_requests, authed_client):
         """Successfully creates an order."""
-        mock_post.return_value = mock_response({
-            "orderId": "order-123",
-            "orderNumber": "ORD-2025-001",
-            "shipmentOrderId": "ship-456",
-            "postageAmount": 4.71,
-            "productAmount": 19.99,
-            "orderAmount": 24.70,
-            "orderStatus": "CREATED",
-            "productInfoList": [
-                {"vid": "variant-1", "quantity": 1},
-            ],
-        })
-
-        client = CJDropshippingClient(config)
-        client._access_token = "test-token"
-        order = client.create_order(
-            order_number="ORD-2025-001",
-            shipping_country_code="US",
-            shipping_country="United States",
-            shipping_province="California",
-            shipping_city="Los Angeles",
-            shipping_address="123 Main St",
-            shipping_zip="90001",
-            shipping_customer_name="John Doe",
-            shipping_phone="555-1234",
-            logistic_name="USPS+",
-            from_country_code="CN",
-            products=[{"vid": "variant-1", "quantity": 1}],
-        )
+        patched_requests.post.return_value = _make_response(_CREATED_ORDER_DATA)
+
+        order = authed_client.create_order(**_order_kwargs())
 
         assert order.order_id == "order-123"
         assert order.order_number == "ORD-2025-001"
-        assert order.postage_amount == Decimal("4.71")
-        assert order.product_amount == Decimal("19.99")
-        assert order.order_amount == Decimal("24.70")
+        assert order.postage_amount == _D_4_71
+        assert order.product_amount == _D_19_99
+        assert order.order_amount == _D_24_70
         assert order.status == OrderStatus.CREATED
 
-    @patch("ecom_arb.integrations.cj_dropshipping.requests.post")
-    def test_create_order_validation_error(self, mock_post, config, mock_response):
-        """Order with invalid data raises CJError."""
-        mock_post.return_value = mock_response(
-            None, code=1600100, result=False, message="Param error"
-        )
-
-        client = CJDropshippingClient(config)
-        client._access_token = "test-token"
-
-        with pytest.raises(CJError, match="Param error"):
-            client.create_order(
-                order_number="ORD-2025-001",
-                shipping_country_code="XX",  # Invalid country
-                shipping_country="Invalid",
-                shipping_province="Invalid",
-                shipping_city="Invalid",
-                shipping_address="Invalid",
-                shipping_zip="00000",
-                shipping_customer_name="Test",
-                shipping_phone="000",
-                logistic_name="USPS+",
-                from_country_code="CN",
-                products=[{"vid": "variant-1", "quantity": 1}],
-            )
-
     # Order query tests
 
-    @patch("ecom_arb.integrations.cj_dropshipping.requests.get")
-    def test_get_order_success(self, mock_get, config, mock_response):
+    def test_get_order_success(self, patched_requests, authed_client):
         """Successfully gets order details."""
-        mock_get.return_value = mock_response({
-            "orderId": "order-123",
-            "orderNumber": "ORD-2025-001",
-            "orderStatus": "SHIPPED",
-            "trackNumber": "TRACK123456",
-            "postageAmount": 4.71,
-            "productAmount": 19.99,
-            "orderAmount": 24.70,
-        })
+        patched_requests.get.return_value = _make_response(_SHIPPED_ORDER_DATA)
 
-        client = CJDropshippingClient(config)
-        client._access_token = "test-token"
-        order = client.get_order(order_id="order-123")
+        order = authed_client.get_order(order_id="order-123")
 
         assert order.order_id == "order-123"
         assert order.status == OrderStatus.SHIPPED
         assert order.tracking_number == "TRACK123456"
 
-    @patch("ecom_arb.integrations.cj_dropshipping.requests.get")
-    def test_list_orders_success(self, mock_get, config, mock_response):
+    def test_list_orders_success(self, patched_requests, authed_client):
         """Successfully lists orders."""
-        mock_get.return_value = mock_response({
-            "pageNum": 1,
-            "pageSize": 20,
-            "total": 2,
-            "list": [
-                {
-                    "orderId": "order-1",
-                    "orderNumber": "ORD-001",
-                    "orderStatus": "CREATED",
-                    "postageAmount": 4.71,
-                    "productAmount": 19.99,
-                    "orderAmount": 24.70,
-                },
-                {
-                    "orderId": "order-2",
-                    "orderNumber": "ORD-002",
-                    "orderStatus": "SHIPPED",
-                    "trackNumber": "TRACK789",
-                    "postageAmount": 5.00,
-                    "productAmount": 29.99,
-                    "orderAmount": 34.99,
-                },
-            ],
-        })
-
-        client = CJDropshippingClient(config)
-        client._access_token = "test-token"
-        orders = client.list_orders(page=1, page_size=20)
+        patched_requests.get.return_value = _make_response(_ORDER_LIST_DATA)
+
+        orders = authed_client.list_orders(page=1, page_size=20)
 
         assert len(orders) == 2
         assert orders[0].order_id == "order-1"
@@ -423,47 +448,56 @@ class TestCJDropshippingClient:
 
     # Error handling tests
 
-    @patch("ecom_arb.integrations.cj_dropshipping.requests.get")
-    def test_api_error_response(self, mock_get, config, mock_response):
-        """API error response raises CJError with details."""
-        mock_get.return_value = mock_response(
-            None,
-            code=1600100,
-            result=False,
-            message="Product not found",
-        )
-
-        client = CJDropshippingClient(config)
-        client._access_token = "test-token"
-
-        with pytest.raises(CJError) as exc_info:
-            client.get_product(pid="invalid-id")
-
-        assert "Product not found" in str(exc_info.value)
-        assert exc_info.value.code == 1600100
+    @pytest.mark.parametrize(
+        "client_fixture,http_method,call,kwargs,message,code",
+        [
+            pytest.param(
+                "fresh_client", "post", "get_access_token", {},
+                "Invalid API key", 1600100,
+                id="auth_failure",
+            ),
+            pytest.param(
+                "authed_client", "post", "create_order",
+                _order_kwargs(shipping_country_code="XX"),  # Invalid country
+                "Param error", 1600100,
+                id="order_validation",
+            ),
+            pytest.param(
+                "authed_client", "get", "get_product", {"pid": "invalid-id"},
+                "Product not found", 1600100,
+                id="api_error",
+            ),
+            pytest.param(
+                "fresh_client", None, "list_products", {},
+                "Not authenticated", 0,
+                id="not_authenticated",
+            ),
+        ],
+    )
+    def test_error_raises_cj_error(
+        self, request, patched_requests, client_fixture, http_method, call, kwargs, message, code,
+    ):
+        """API errors and missing auth raise CJError with message and code."""
+        if http_method:
+            getattr(patched_requests, http_method).return_value = _make_response(
+                None, code=code, result=False, message=message
+            )
+        client = request.getfixturevalue(client_fixture)
 
-    @patch("ecom_arb.integrations.cj_dropshipping.requests.get")
-    def test_requires_authentication(self, mock_get, config):
-        """API calls without token raise CJError."""
-        client = CJDropshippingClient(config)
-        # No token set
+        with pytest.raises(CJError, match=message) as exc_info:
+            getattr(client, call)(**kwargs)
 
-        with pytest.raises(CJError, match="Not authenticated"):
-            client.list_products()
+        assert exc_info.value.code == code
 
-    @patch("ecom_arb.integrations.cj_dropshipping.requests.get")
-    def test_http_error_handling(self, mock_get, config):
+    def test_http_error_handling(self, patched_requests, authed_client):
         """HTTP errors are wrapped in CJError."""
-        import requests as req
-        mock_get.return_value = MagicMock()
-        mock_get.return_value.status_code = 500
-        mock_get.return_value.raise_for_status.side_effect = req.HTTPError("Server error")
-
-        client = CJDropshippingClient(config)
-        client._access_token = "test-token"
+        error_response = MagicMock()
+        error_response.status_code = 500
+        error_response.raise_for_status.side_effect = requests.HTTPError("Server error")
+        patched_requests.get.return_value = error_response
 
         with pytest.raises(CJError, match="Server error"):
-            client.list_products()
+            authed_client.list_products()
 
 
 class TestProductVariant:
@@ -471,22 +505,13 @@ class TestProductVariant:
 
     def test_from_api_response(self):
         """Creates variant from API response data."""
-        data = {
-            "vid": "v-123",
-            "variantName": "Black / Large",
-            "variantNameEn": "Black / Large",
-            "variantSku": "SKU-BLK-L",
-            "variantWeight": 0.5,
-            "variantSellPrice": 19.99,
-        }
-
-        variant = ProductVariant.from_api_response(data)
+        variant = ProductVariant.from_api_response(_VARIANT_DETAIL_DATA)
 
         assert variant.vid == "v-123"
         assert variant.name == "Black / Large"
         assert variant.sku == "SKU-BLK-L"
-        assert variant.weight == Decimal("0.5")
-        assert variant.sell_price == Decimal("19.99")
+        assert variant.weight == _D_0_5
+        assert variant.sell_price == _D_19_99
 
 
 class TestFreightOption:
@@ -494,18 +519,11 @@ class TestFreightOption:
 
     def test_from_api_response(self):
         """Creates freight option from API response."""
-        data = {
-            "logisticName": "USPS+",
-            "logisticPrice": 4.71,
-            "logisticPriceCn": 30.54,
-            "logisticAging": "2-5",
-        }
-
-        option = FreightOption.from_api_response(data)
+        option = FreightOption.from_api_response(_USPS_FREIGHT_DATA)
 
         assert option.name == "USPS+"
-        assert option.price == Decimal("4.71")
-        assert option.price_cny == Decimal("30.54")
+        assert option.price == _D_4_71
+        assert option.price_cny == _D_30_54
         assert option.delivery_days == "2-5"
 
 
@@ -0,0 +1,164 @@
+"""Tests for CJ product page parser."""
+
+import json
+from decimal import Decimal
+
+import pytest
+
+from ecom_arb.services.cj_parser import (
+    CJParserError,
+    _dec,
+    _extract_json_with_balanced_braces,
+    _fix_javascript_json,
+    _looks_like_html,
+    parse_product_detail_data,
+)
+
+_PRODUCT_JS = (
+    '{"id": "1234", "nameEn": "Dog Bed", "sellPrice": 12.5,'
+    ' "variants": [{"vid": "v1", "attrs": {"size": "L"}},],'
+    " \"remark\": undefined,}"
+)
+
+
+def _page(script: str) -> str:
+    """Wrap an inline script in a minimal CJ product page."""
+    return f"<html><head><script>{script}</script></head><body>cjdropshipping</body></html>"
+
+
+@pytest.fixture
+def product_page():
+    """Product page embedding productDetailData as a JS object literal."""
+    return _page(f"window.productDetailData = {_PRODUCT_JS};")
+
+
+class TestExtractJsonWithBalancedBraces:
+    """Tests for _extract_json_with_balanced_braces."""
+
+    def test_extracts_nested_object(self, product_page):
+        """Stops at the brace that closes the opening one, not the first '}'."""
+        start = product_page.index("{")
+
+        assert _extract_json_with_balanced_braces(product_page, start) == _PRODUCT_JS
+
+    def test_truncated_payload_returns_empty(self, product_page):
+        """A page cut off mid-object yields no JSON."""
+        truncated = product_page[:product_page.index('"remark"')]
+
+        assert _extract_json_with_balanced_braces(truncated, truncated.index("{")) == ""
+
+    def test_unbalanced_within_max_len_returns_empty(self):
+        """Scanning gives up after max_len characters without a closing brace."""
+        text = '{"a": {"b": 1}' + " " * 100 + "}"
+
+        assert _extract_json_with_balanced_braces(text, 0, max_len=50) == ""
+
+    def test_truncated_page_raises(self, product_page):
+        """parse_product_detail_data reports a truncated payload as a parser error."""
+        truncated = product_page[:product_page.index('"remark"')]
+
+        with pytest.raises(CJParserError, match="empty"):
+            parse_product_detail_data(truncated)
+
+
+class TestFixJavascriptJson:
+    """Tests for _fix_javascript_json."""
+
+    @pytest.mark.parametrize(
+        "js,expected",
+        [
+            ('{"a": undefined}', {"a": None}),
+            ('{"a":undefined, "b": 1}', {"a": None, "b": 1}),
+            ('{"a": 1,}', {"a": 1}),
+            ('{"a": [1, 2,\n]}', {"a": [1, 2]}),
+            ('{"a": {"b": undefined,},}', {"a": {"b": None}}),
+        ],
+    )
+    def test_js_literals_become_valid_json(self, js, expected):
+        """undefined values and trailing commas are rewritten in one pass."""
+        assert json.loads(_fix_javascript_json(js)) == expected
+
+    @pytest.mark.parametrize(
+        "js,expected",
+        [
+            ("{'a': 'b'}", {"a": "b"}),
+            ("""{"a": 'it\\'s', "b": 'say "hi"'}""", {"a": "it's", "b": 'say "hi"'}),
+            ("""{"a": ['x', 'y',], "b": undefined}""", {"a": ["x", "y"], "b": None}),
+            (
+                """{"name": "Men's 'Classic' shoe", "c": 'x'}""",
+                {"name": "Men's 'Classic' shoe", "c": "x"},
+            ),
+        ],
+    )
+    def test_single_quoted_strings_become_valid_json(self, js, expected):
+        """Single-quoted strings convert; quotes inside double-quoted strings are kept."""
+        assert json.loads(_fix_javascript_json(js)) == expected
+
+    def test_apostrophes_skip_string_pass(self):
+        """Apostrophes inside double-quoted strings leave the payload untouched."""
+        js = '{"name": "Men\'s shoe", "size": 9}'
+
+        assert _fix_javascript_json(js) == js
+
+    def test_parses_product_page(self, product_page):
+        """The full page round-trips to the product dict."""
+        data = parse_product_detail_data(product_page)
+
+        assert data["id"] == "1234"
+        assert data["remark"] is None
+        assert data["variants"] == [{"vid": "v1", "attrs": {"size": "L"}}]
+
+
+class TestDec:
+    """Tests for _dec."""
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            (12.1, "12.1"),
+            (19.999, "19.999"),
+            (1.005, "1.005"),
+            (2.675, "2.675"),
+            (0.125, "0.125"),
+            ("0.125", "0.125"),
+            (7, "7"),
+            (Decimal("3.456"), "3.456"),
+            ("4.5", "4.5"),
+            (None, "0"),
+            ("", "0"),
+        ],
+    )
+    def test_converts_to_decimal(self, value, expected):
+        """Floats keep the digits CJ sent, with no rounding; other values convert exactly."""
+        result = _dec(value)
+
+        assert isinstance(result, Decimal)
+        assert str(result) == expected
+
+
+class TestLooksLikeHtml:
+    """Tests for _looks_like_html."""
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            b"<!DOCTYPE html><html></html>",
+            b"\n\t  <html><body></body></html>",
+            b"\xef\xbb\xbf<html></html>",
+        ],
+    )
+    def test_plain_html(self, content):
+        """Decoded markup, with optional BOM and leading whitespace, is HTML."""
+        assert _looks_like_html(content) is True
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            b"\x1b\x8a\x05\x00\xe4\x8d\x94\xa1\x0c\x8b\x1f\x3c",
+            b"\x8b\x02\x80<html>",
+            b"",
+        ],
+    )
+    def test_brotli_bytes(self, content):
+        """Compressed (or empty) bodies are not mistaken for HTML."""
+        assert _looks_like_html(content) is False
@@ -16,33 +16,75 @@ from ecom_arb.scoring.models import ProductCategory
 from ecom_arb.services.discovery import DiscoveredProduct, DiscoveryService
 
 
-class TestDiscoveredProduct:
-    """Tests for DiscoveredProduct."""
+@pytest.fixture(scope="module")
+def cj_product():
+    """Sample CJ product (only read by the tests, so built once)."""
+    return CJProduct(
+        pid="CJ123",
+        name="Garden Tool Set",
+        sku="SKU123",
+        image_url="https://example.com/img.jpg",
+        sell_price=Decimal("25.99"),
+        category_id="garden",
+        category_name="Garden Tools",
+        weight=Decimal("800"),
+        variants=[],
+    )
+
+
+@pytest.fixture(scope="module")
+def freight():
+    """Sample freight option (only read by the tests, so built once)."""
+    return FreightOption(
+        name="ePacket",
+        price=Decimal("4.99"),
+        price_cny=Decimal("35.00"),
+        delivery_days="7-14",
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_keepa_data():
+    """Sample Keepa product with Amazon buy box (only read, so built once)."""
+    return KeepaProduct(
+        asin="B08TEST123",
+        title="Similar Product",
+        brand="TestBrand",
+        product_group="Garden",
+        current_price_cents=5999,
+        current_amazon_price_cents=5499,
+        current_new_price_cents=5999,
+        current_used_price_cents=-1,
+        buy_box=BuyBoxData(
+            is_amazon=True,
+            is_fba=True,
+            seller_id=None,
+            price_cents=5499,
+            shipping_cents=0,
+        ),
+        is_prime_eligible=True,
+        is_available=True,
+        review_count=150,
+        rating=Decimal("4.5"),
+        sales_rank=5000,
+        price_history=[],
+    )
+
+
+@pytest.fixture(scope="session")
+def cpc_estimate():
+    """Sample Google Ads CPC estimate (only read, so built once)."""
+    return CPCEstimate(
+        keyword="garden tools",
+        avg_monthly_searches=5000,
+        competition="MEDIUM",
+        low_cpc=Decimal("0.35"),
+        high_cpc=Decimal("0.75"),
+    )
 
-    @pytest.fixture
-    def cj_product(self):
-        """Sample CJ product."""
-        return CJProduct(
-            pid="CJ123",
-            name="Garden Tool Set",
-            sku="SKU123",
-            image_url="https://example.com/img.jpg",
-            sell_price=Decimal("25.99"),
-            category_id="garden",
-            category_name="Garden Tools",
-            weight=Decimal("800"),
-            variants=[],
-        )
 
-    @pytest.fixture
-    def freight(self):
-        """Sample freight option."""
-        return FreightOption(
-            name="ePacket",
-            price=Decimal("4.99"),
-            price_cny=Decimal("35.00"),
-            delivery_days="7-14",
-        )
+class TestDiscoveredProduct:
+    """Tests for DiscoveredProduct."""
 
     def test_to_scoring_product_basic(self, cj_product, freight):
         """Should convert to scoring Product with basic data."""
@@ -69,36 +111,12 @@ class TestDiscoveredProduct:
         assert product.shipping_days_max == 14
         assert product.source == "cj"
 
-    def test_to_scoring_product_with_amazon_data(self, cj_product, freight):
+    def test_to_scoring_product_with_amazon_data(self, cj_product, freight, sample_keepa_data):
         """Should include Amazon competition data from Keepa."""
-        keepa_data = KeepaProduct(
-            asin="B08TEST123",
-            title="Similar Product",
-            brand="TestBrand",
-            product_group="Garden",
-            current_price_cents=5999,
-            current_amazon_price_cents=5499,
-            current_new_price_cents=5999,
-            current_used_price_cents=-1,
-            buy_box=BuyBoxData(
-                is_amazon=True,
-                is_fba=True,
-                seller_id=None,
-                price_cents=5499,
-                shipping_cents=0,
-            ),
-            is_prime_eligible=True,
-            is_available=True,
-            review_count=150,
-            rating=Decimal("4.5"),
-            sales_rank=5000,
-            price_history=[],
-        )
-
         discovered = DiscoveredProduct(
             cj_product=cj_product,
             freight=freight,
-            keepa_data=keepa_data,
+            keepa_data=sample_keepa_data,
             amazon_asin="B08TEST123",
             cpc_estimate=None,
             category=ProductCategory.GARDEN,
@@ -110,16 +128,8 @@ class TestDiscoveredProduct:
         assert product.amazon_prime_exists is True
         assert product.amazon_review_count == 150
 
-    def test_to_scoring_product_with_cpc_data(self, cj_product, freight):
+    def test_to_scoring_product_with_cpc_data(self, cj_product, freight, cpc_estimate):
         """Should include CPC data from Google Ads."""
-        cpc_estimate = CPCEstimate(
-            keyword="garden tools",
-            avg_monthly_searches=5000,
-            competition="MEDIUM",
-            low_cpc=Decimal("0.35"),
-            high_cpc=Decimal("0.75"),
-        )
-
         discovered = DiscoveredProduct(
             cj_product=cj_product,
             freight=freight,
@@ -160,43 +170,70 @@ class TestDiscoveredProduct:
         assert product.shipping_days_max == 5
 
 
-class TestDiscoveryService:
-    """Tests for DiscoveryService."""
+@pytest.fixture(scope="session")
+def mock_cj_config():
+    """Mock CJ config that passes validation (built once per session).
+
+    Validation is only bypassed while constructing it, so CJConfig tests
+    elsewhere still see the real __post_init__.
+    """
+    original = CJConfig.__post_init__
+    CJConfig.__post_init__ = lambda self: None
+    try:
+        return CJConfig(api_key="TEST123@api@KEY456")
+    finally:
+        CJConfig.__post_init__ = original
 
-    @pytest.fixture
-    def mock_cj_config(self):
-        """Mock CJ config that passes validation."""
-        with patch.object(CJConfig, "__post_init__"):
-            return CJConfig(api_key="TEST123@api@KEY456")
 
-    def test_map_category_direct_match(self, mock_cj_config):
-        """Should map known categories."""
-        with patch("ecom_arb.services.discovery.CJDropshippingClient"):
-            service = DiscoveryService(mock_cj_config)
+@pytest.fixture(scope="module")
+def _cj_client_class():
+    """Patch the CJ client class used by DiscoveryService once for the whole module."""
+    with patch("ecom_arb.services.discovery.CJDropshippingClient") as mock:
+        yield mock
 
-        assert service._map_category("pet") == ProductCategory.PET
-        assert service._map_category("tools") == ProductCategory.TOOLS
-        assert service._map_category("garden") == ProductCategory.GARDEN
 
-    def test_map_category_partial_match(self, mock_cj_config):
-        """Should match partial category names."""
-        with patch("ecom_arb.services.discovery.CJDropshippingClient"):
-            service = DiscoveryService(mock_cj_config)
+@pytest.fixture
+def mock_cj_client_class(_cj_client_class):
+    """Mocked CJ client class, reset before each test.
 
-        assert service._map_category("pet supplies") == ProductCategory.PET
-        assert service._map_category("outdoor camping gear") == ProductCategory.OUTDOOR
+    Tests that need a configured client set ``return_value``.
+    """
+    _cj_client_class.reset_mock(return_value=True, side_effect=True)
+    return _cj_client_class
 
-    def test_map_category_unknown(self, mock_cj_config):
-        """Should default to HOME_DECOR for unknown categories."""
-        with patch("ecom_arb.services.discovery.CJDropshippingClient"):
-            service = DiscoveryService(mock_cj_config)
 
-        assert service._map_category("xyz random stuff") == ProductCategory.HOME_DECOR
+@pytest.fixture(scope="module")
+def service(_cj_client_class, mock_cj_config):
+    """DiscoveryService with a mocked CJ client, shared by read-only tests."""
+    service = DiscoveryService(mock_cj_config)
+    yield service
+    service.close()
 
-    def test_calculate_selling_price(self, mock_cj_config):
+
+class TestDiscoveryService:
+    """Tests for DiscoveryService."""
+
+    @pytest.mark.parametrize(
+        "cj_category,expected",
+        [
+            # Direct matches
+            ("pet", ProductCategory.PET),
+            ("tools", ProductCategory.TOOLS),
+            ("garden", ProductCategory.GARDEN),
+            # Partial matches
+            ("pet supplies", ProductCategory.PET),
+            ("outdoor camping gear", ProductCategory.OUTDOOR),
+            # Unknown categories default to HOME_DECOR
+            ("xyz random stuff", ProductCategory.HOME_DECOR),
+        ],
+    )
+    def test_map_category(self, service, cj_category, expected):
+        """Should map known and partial category names, defaulting to HOME_DECOR."""
+        assert service._map_category(cj_category) == expected
+
+    def test_calculate_selling_price(self, mock_cj_client_class, mock_cj_config):
         """Should apply markup and round to .99."""
-        with patch("ecom_arb.services.discovery.CJDropshippingClient"):
-            service = DiscoveryService(mock_cj_config, markup=Decimal("2.5"))
+        service = DiscoveryService(mock_cj_config, markup=Decimal("2.5"))
 
         cj_product = CJProduct(
             pid="TEST1",
@@ -210,23 +247,35 @@ class TestDiscoveryService:
         )
 
         price = service._calculate_selling_price(cj_product)
+        service.close()
+
         assert price == Decimal("50.99")
 
-    @patch("ecom_arb.services.discovery.CJDropshippingClient")
-    def test_discover_products_empty(self, mock_cj_class, mock_cj_config):
+    def test_close_closes_clients(self, mock_cj_client_class, mock_cj_config):
+        """Should close both the CJ and the Keepa client."""
+        with patch("ecom_arb.services.discovery.KeepaClient") as mock_keepa_class:
+            service = DiscoveryService(mock_cj_config, keepa_config=MagicMock())
+            service.close()
+
+        mock_cj_client_class.return_value.close.assert_called_once_with()
+        mock_keepa_class.return_value.close.assert_called_once_with()
+
+    @pytest.mark.asyncio
+    async def test_discover_products_empty(self, mock_cj_client_class, mock_cj_config):
         """Should return empty list when no products found."""
         mock_cj = MagicMock()
         mock_cj.get_products.return_value = []
-        mock_cj_class.return_value = mock_cj
+        mock_cj_client_class.return_value = mock_cj
 
         service = DiscoveryService(mock_cj_config)
-        products = service.discover_products(category="pet", limit=10)
+        products = await service.discover_products(category="pet", limit=10)
+        service.close()
 
         assert products == []
         mock_cj.get_products.assert_called_once()
 
-    @patch("ecom_arb.services.discovery.CJDropshippingClient")
-    def test_discover_products_with_freight(self, mock_cj_class, mock_cj_config):
+    @pytest.mark.asyncio
+    async def test_discover_products_with_freight(self, mock_cj_client_class, mock_cj_config):
         """Should fetch freight for each product."""
         mock_cj = MagicMock()
         mock_cj.get_products.return_value = [
@@ -249,17 +298,18 @@ class TestDiscoveryService:
                 delivery_days="10-20",
             )
         ]
-        mock_cj_class.return_value = mock_cj
+        mock_cj_client_class.return_value = mock_cj
 
         service = DiscoveryService(mock_cj_config)
-        products = service.discover_products(limit=1)
+        products = await service.discover_products(limit=1)
+        service.close()
 
         assert len(products) == 1
         assert products[0].freight is not None
         assert products[0].freight.price == Decimal("3.99")
 
-    @patch("ecom_arb.services.discovery.CJDropshippingClient")
-    def test_discover_products_freight_failure(self, mock_cj_class, mock_cj_config):
+    @pytest.mark.asyncio
+    async def test_discover_products_freight_failure(self, mock_cj_client_class, mock_cj_config):
         """Should handle freight calculation failures gracefully."""
         mock_cj = MagicMock()
         mock_cj.get_products.return_value = [
@@ -275,10 +325,36 @@ class TestDiscoveryService:
             )
         ]
         mock_cj.calculate_freight.side_effect = Exception("API Error")
-        mock_cj_class.return_value = mock_cj
+        mock_cj_client_class.return_value = mock_cj
 
         service = DiscoveryService(mock_cj_config)
-        products = service.discover_products(limit=1)
+        products = await service.discover_products(limit=1)
+        service.close()
 
         assert len(products) == 1
         assert products[0].freight is None  # Graceful failure
+
+    @pytest.mark.asyncio
+    async def test_discover_by_keywords_dedupes(self, mock_cj_client_class, mock_cj_config):
+        """Should fetch freight once per unique product across keywords."""
+        product = CJProduct(
+            pid="P1",
+            name="Product 1",
+            sku="SKU1",
+            image_url="",
+            sell_price=Decimal("10.00"),
+            category_id="pet",
+            category_name="Pet",
+            variants=[],
+        )
+        mock_cj = MagicMock()
+        mock_cj.search_products.return_value = [product, product]
+        mock_cj.calculate_freight.return_value = []
+        mock_cj_client_class.return_value = mock_cj
+
+        service = DiscoveryService(mock_cj_config)
+        products = await service.discover_by_keywords(["dog bowl", "pet bowl"])
+        service.close()
+
+        assert len(products) == 1
+        mock_cj.calculate_freight.assert_called_once()
@@ -9,9 +9,11 @@ Tests cover:
 """
 
 from decimal import Decimal
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
+from google.ads.googleads.errors import GoogleAdsException
 
 from ecom_arb.integrations.google_ads import (
     GoogleAdsClient,
@@ -23,6 +25,56 @@ from ecom_arb.integrations.google_ads import (
 )
 
 
+def _kw_result(text, searches, competition, low_micros, high_micros):
+    """Keyword Planner idea row, as read by get_keyword_cpc_estimates()."""
+    return SimpleNamespace(
+        text=text,
+        keyword_idea_metrics=SimpleNamespace(
+            avg_monthly_searches=searches,
+            competition=competition,
+            low_top_of_page_bid_micros=low_micros,
+            high_top_of_page_bid_micros=high_micros,
+        ),
+    )
+
+
+def _campaign_row(campaign_id, name, status, budget_micros):
+    """GoogleAdsService campaign row, as read by get_campaign()/list_campaigns()."""
+    return SimpleNamespace(
+        campaign=SimpleNamespace(id=campaign_id, name=name, status=status),
+        campaign_budget=SimpleNamespace(amount_micros=budget_micros),
+    )
+
+
+@pytest.fixture(scope="module")
+def _google_ads_api_client():
+    """Patch the google-ads library client once for the whole module."""
+    with patch("ecom_arb.integrations.google_ads.GoogleAdsApiClient") as mock:
+        # load_from_dict is a class method that returns a client instance
+        mock.load_from_dict.return_value = MagicMock()
+        yield mock
+
+
+@pytest.fixture(scope="module")
+def google_ads_client(_google_ads_api_client, google_ads_config):
+    """GoogleAdsClient built once; it only holds config and the mocked API client."""
+    return GoogleAdsClient(google_ads_config)
+
+
+@pytest.fixture
+def mock_google_ads_client(_google_ads_api_client):
+    """Mock google-ads library client with call history and behaviour reset per test.
+
+    The API client instance is kept (the shared google_ads_client holds it);
+    only its configured services and side effects are wiped.
+    """
+    _google_ads_api_client.reset_mock()
+    _google_ads_api_client.load_from_dict.return_value.reset_mock(
+        return_value=True, side_effect=True
+    )
+    return _google_ads_api_client
+
+
 class TestGoogleAdsConfig:
     """Test configuration validation."""
 
@@ -64,50 +116,26 @@ class TestGoogleAdsConfig:
 class TestGoogleAdsClient:
     """Test Google Ads client operations."""
 
-    @pytest.fixture
-    def config(self):
-        """Valid test config."""
-        return GoogleAdsConfig(
-            client_id="test-client-id.apps.googleusercontent.com",
-            client_secret="test-secret",
-            refresh_token="test-refresh-token",
-            developer_token="test-dev-token",
-            customer_id="123-456-7890",
-        )
-
-    @pytest.fixture
-    def mock_google_ads_client(self):
-        """Mock the google-ads library client."""
-        with patch("ecom_arb.integrations.google_ads.GoogleAdsApiClient") as mock:
-            # load_from_dict is a class method that returns a client instance
-            mock_instance = MagicMock()
-            mock.load_from_dict.return_value = mock_instance
-            yield mock
-
-    def test_client_initialization(self, config, mock_google_ads_client):
+    def test_client_initialization(self, google_ads_config, mock_google_ads_client):
         """Client initializes with valid config."""
-        client = GoogleAdsClient(config)
+        client = GoogleAdsClient(google_ads_config)
         assert client.customer_id == "1234567890"
         mock_google_ads_client.load_from_dict.assert_called_once()
 
-    def test_get_keyword_cpc_estimates(self, config, mock_google_ads_client):
+    def test_get_keyword_cpc_estimates(self, google_ads_client, mock_google_ads_client):
         """Get CPC estimates for keywords from Keyword Planner."""
         # Setup mock response
         mock_service = MagicMock()
         mock_google_ads_client.load_from_dict.return_value.get_service.return_value = mock_service
 
-        mock_result = MagicMock()
-        mock_metric = MagicMock()
-        mock_metric.text = "fitness tracker"
-        mock_metric.keyword_idea_metrics.avg_monthly_searches = 10000
-        mock_metric.keyword_idea_metrics.competition = 2  # MEDIUM
-        mock_metric.keyword_idea_metrics.low_top_of_page_bid_micros = 500000  # $0.50
-        mock_metric.keyword_idea_metrics.high_top_of_page_bid_micros = 1500000  # $1.50
-        mock_result.results = [mock_metric]
-        mock_service.generate_keyword_ideas.return_value = mock_result
+        mock_service.generate_keyword_ideas.return_value = SimpleNamespace(
+            results=[
+                # MEDIUM competition, $0.50-$1.50 bids
+                _kw_result("fitness tracker", 10000, 2, 500000, 1500000),
+            ]
+        )
 
-        client = GoogleAdsClient(config)
-        estimates = client.get_keyword_cpc_estimates(["fitness tracker"])
+        estimates = google_ads_client.get_keyword_cpc_estimates(["fitness tracker"])
 
         assert len(estimates) == 1
         assert estimates[0].keyword == "fitness tracker"
@@ -115,25 +143,23 @@ class TestGoogleAdsClient:
         assert estimates[0].low_cpc == Decimal("0.50")
         assert estimates[0].high_cpc == Decimal("1.50")
 
-    def test_get_keyword_cpc_estimates_empty_keywords(self, config, mock_google_ads_client):
+    def test_get_keyword_cpc_estimates_empty_keywords(self, google_ads_client):
         """Empty keyword list returns empty results."""
-        client = GoogleAdsClient(config)
-        estimates = client.get_keyword_cpc_estimates([])
+        estimates = google_ads_client.get_keyword_cpc_estimates([])
         assert estimates == []
 
-    def test_create_campaign(self, config, mock_google_ads_client):
+    def test_create_campaign(self, google_ads_client, mock_google_ads_client):
         """Create a new Google Ads campaign."""
         mock_instance = mock_google_ads_client.load_from_dict.return_value
         mock_service = MagicMock()
         mock_instance.get_service.return_value = mock_service
 
         # Mock campaign creation response
-        mock_response = MagicMock()
-        mock_response.results = [MagicMock(resource_name="customers/123/campaigns/456")]
-        mock_service.mutate_campaigns.return_value = mock_response
+        mock_service.mutate_campaigns.return_value = SimpleNamespace(
+            results=[SimpleNamespace(resource_name="customers/123/campaigns/456")]
+        )
 
-        client = GoogleAdsClient(config)
-        campaign = client.create_campaign(
+        campaign = google_ads_client.create_campaign(
             name="Test Campaign",
             daily_budget_cents=5000,  # $50.00
             max_cpc_cents=75,  # $0.75
@@ -143,92 +169,67 @@ class TestGoogleAdsClient:
         assert campaign.name == "Test Campaign"
         assert campaign.status == CampaignStatus.ENABLED
 
-    def test_pause_campaign(self, config, mock_google_ads_client):
-        """Pause an existing campaign."""
+    @pytest.mark.parametrize(
+        "status", [CampaignStatus.PAUSED, CampaignStatus.ENABLED], ids=["pause", "enable"]
+    )
+    def test_set_campaign_status(self, google_ads_client, mock_google_ads_client, status):
+        """Pause an existing campaign or enable a paused one."""
         mock_instance = mock_google_ads_client.load_from_dict.return_value
         mock_service = MagicMock()
         mock_instance.get_service.return_value = mock_service
 
-        client = GoogleAdsClient(config)
-        result = client.set_campaign_status("456", CampaignStatus.PAUSED)
+        result = google_ads_client.set_campaign_status("456", status)
 
         assert result is True
         mock_service.mutate_campaigns.assert_called_once()
 
-    def test_enable_campaign(self, config, mock_google_ads_client):
-        """Enable a paused campaign."""
-        mock_instance = mock_google_ads_client.load_from_dict.return_value
-        mock_service = MagicMock()
-        mock_instance.get_service.return_value = mock_service
-
-        client = GoogleAdsClient(config)
-        result = client.set_campaign_status("456", CampaignStatus.ENABLED)
-
-        assert result is True
-
-    def test_get_campaign(self, config, mock_google_ads_client):
+    def test_get_campaign(self, google_ads_client, mock_google_ads_client):
         """Get campaign details by ID."""
         mock_instance = mock_google_ads_client.load_from_dict.return_value
         mock_service = MagicMock()
         mock_instance.get_service.return_value = mock_service
 
         # Mock search response - search_stream returns iterator of batches with .results
-        mock_row = MagicMock()
-        mock_row.campaign.id = 456
-        mock_row.campaign.name = "Test Campaign"
-        mock_row.campaign.status = 2  # ENABLED
-        mock_row.campaign_budget.amount_micros = 50000000  # $50.00
-        mock_batch = MagicMock()
-        mock_batch.results = [mock_row]
-        mock_service.search_stream.return_value = [mock_batch]
-
-        client = GoogleAdsClient(config)
-        campaign = client.get_campaign("456")
+        mock_service.search_stream.return_value = [
+            # ENABLED, $50.00 budget
+            SimpleNamespace(results=[_campaign_row(456, "Test Campaign", 2, 50000000)])
+        ]
+
+        campaign = google_ads_client.get_campaign("456")
 
         assert campaign.id == "456"
         assert campaign.name == "Test Campaign"
         assert campaign.status == CampaignStatus.ENABLED
         assert campaign.daily_budget_cents == 5000
 
-    def test_get_campaign_not_found(self, config, mock_google_ads_client):
+    def test_get_campaign_not_found(self, google_ads_client, mock_google_ads_client):
         """Get campaign returns None if not found."""
         mock_instance = mock_google_ads_client.load_from_dict.return_value
         mock_service = MagicMock()
         mock_instance.get_service.return_value = mock_service
-        mock_batch = MagicMock()
-        mock_batch.results = []  # Empty results
-        mock_service.search_stream.return_value = [mock_batch]
+        mock_service.search_stream.return_value = [SimpleNamespace(results=[])]
 
-        client = GoogleAdsClient(config)
-        campaign = client.get_campaign("999")
+        campaign = google_ads_client.get_campaign("999")
 
         assert campaign is None
 
-    def test_list_campaigns(self, config, mock_google_ads_client):
+    def test_list_campaigns(self, google_ads_client, mock_google_ads_client):
         """List all campaigns."""
         mock_instance = mock_google_ads_client.load_from_dict.return_value
         mock_service = MagicMock()
         mock_instance.get_service.return_value = mock_service
 
         # Mock search response with multiple campaigns
-        mock_row1 = MagicMock()
-        mock_row1.campaign.id = 456
-        mock_row1.campaign.name = "Campaign 1"
-        mock_row1.campaign.status = 2  # ENABLED
-        mock_row1.campaign_budget.amount_micros = 50000000
-
-        mock_row2 = MagicMock()
-        mock_row2.campaign.id = 789
-        mock_row2.campaign.name = "Campaign 2"
-        mock_row2.campaign.status = 3  # PAUSED
-        mock_row2.campaign_budget.amount_micros = 100000000
-
-        mock_batch = MagicMock()
-        mock_batch.results = [mock_row1, mock_row2]
-        mock_service.search_stream.return_value = [mock_batch]
+        mock_service.search_stream.return_value = [
+            SimpleNamespace(
+                results=[
+                    _campaign_row(456, "Campaign 1", 2, 50000000),  # ENABLED
+                    _campaign_row(789, "Campaign 2", 3, 100000000),  # PAUSED
+                ]
+            )
+        ]
 
-        client = GoogleAdsClient(config)
-        campaigns = client.list_campaigns()
+        campaigns = google_ads_client.list_campaigns()
 
         assert len(campaigns) == 2
         assert campaigns[0].name == "Campaign 1"
@@ -238,27 +239,8 @@ class TestGoogleAdsClient:
 class TestErrorHandling:
     """Test error handling scenarios."""
 
-    @pytest.fixture
-    def config(self):
-        return GoogleAdsConfig(
-            client_id="test-client-id.apps.googleusercontent.com",
-            client_secret="test-secret",
-            refresh_token="test-refresh-token",
-            developer_token="test-dev-token",
-            customer_id="123-456-7890",
-        )
-
-    @pytest.fixture
-    def mock_google_ads_client(self):
-        with patch("ecom_arb.integrations.google_ads.GoogleAdsApiClient") as mock:
-            mock_instance = MagicMock()
-            mock.load_from_dict.return_value = mock_instance
-            yield mock
-
-    def test_api_error_wrapped(self, config, mock_google_ads_client):
+    def test_api_error_wrapped(self, google_ads_client, mock_google_ads_client):
         """API errors are wrapped in GoogleAdsError."""
-        from google.ads.googleads.errors import GoogleAdsException
-
         mock_instance = mock_google_ads_client.load_from_dict.return_value
         mock_service = MagicMock()
         mock_instance.get_service.return_value = mock_service
@@ -269,16 +251,13 @@ class TestErrorHandling:
             request_id="test-request",
         )
 
-        client = GoogleAdsClient(config)
         with pytest.raises(GoogleAdsError) as exc_info:
-            client.get_keyword_cpc_estimates(["test keyword"])
+            google_ads_client.get_keyword_cpc_estimates(["test keyword"])
 
         assert "test-request" in str(exc_info.value)
 
-    def test_rate_limit_error(self, config, mock_google_ads_client):
+    def test_rate_limit_error(self, google_ads_client, mock_google_ads_client):
         """Rate limit errors include retry info."""
-        from google.ads.googleads.errors import GoogleAdsException
-
         mock_failure = MagicMock()
         mock_error = MagicMock()
         mock_error.error_code.quota_error = 1  # RESOURCE_EXHAUSTED
@@ -294,9 +273,8 @@ class TestErrorHandling:
             request_id="rate-limit-test",
         )
 
-        client = GoogleAdsClient(config)
         with pytest.raises(GoogleAdsError) as exc_info:
-            client.get_keyword_cpc_estimates(["test keyword"])
+            google_ads_client.get_keyword_cpc_estimates(["test keyword"])
 
         assert exc_info.value.is_rate_limit_error
 
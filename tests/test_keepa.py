@@ -16,6 +16,55 @@ from ecom_arb.integrations.keepa import (
     ProductType,
 )
 
+# Price history and product for the 90-day low/high test. Only read, so built once.
+_HISTORY = (
+    PricePoint(datetime(2024, 1, 1), 2999),
+    PricePoint(datetime(2024, 1, 15), 3499),
+    PricePoint(datetime(2024, 2, 1), 2499),  # Low
+    PricePoint(datetime(2024, 2, 15), 3999),  # High
+    PricePoint(datetime(2024, 3, 1), -1),  # Out of stock
+)
+
+_PRODUCT_WITH_HISTORY = ProductData(
+    asin="B08N5WRWNW",
+    title="Test",
+    brand=None,
+    product_group=None,
+    current_price_cents=2999,
+    current_amazon_price_cents=-1,
+    current_new_price_cents=2999,
+    current_used_price_cents=-1,
+    buy_box=None,
+    is_prime_eligible=False,
+    is_available=True,
+    review_count=0,
+    rating=None,
+    sales_rank=None,
+    price_history=_HISTORY,
+)
+
+
+@pytest.fixture(scope="module")
+def _keepa_request():
+    """Patch KeepaClient._request once for the whole module."""
+    with patch.object(KeepaClient, "_request") as mock:
+        yield mock
+
+
+@pytest.fixture
+def mock_request(_keepa_request):
+    """Mocked KeepaClient._request, reset before each test."""
+    _keepa_request.reset_mock(return_value=True, side_effect=True)
+    return _keepa_request
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Test client, shared by the session (requests go through mock_request)."""
+    client = KeepaClient(KeepaConfig(api_key="test-key"))
+    yield client
+    client.close()
+
 
 class TestKeepaConfig:
     """Tests for KeepaConfig."""
@@ -142,43 +191,13 @@ class TestProductData:
 
     def test_price_90d_low_high(self):
         """Should calculate 90-day low/high prices."""
-        history = [
-            PricePoint(datetime(2024, 1, 1), 2999),
-            PricePoint(datetime(2024, 1, 15), 3499),
-            PricePoint(datetime(2024, 2, 1), 2499),  # Low
-            PricePoint(datetime(2024, 2, 15), 3999),  # High
-            PricePoint(datetime(2024, 3, 1), -1),  # Out of stock
-        ]
-        product = ProductData(
-            asin="B08N5WRWNW",
-            title="Test",
-            brand=None,
-            product_group=None,
-            current_price_cents=2999,
-            current_amazon_price_cents=-1,
-            current_new_price_cents=2999,
-            current_used_price_cents=-1,
-            buy_box=None,
-            is_prime_eligible=False,
-            is_available=True,
-            review_count=0,
-            rating=None,
-            sales_rank=None,
-            price_history=history,
-        )
-        assert product.price_90d_low_cents == 2499
-        assert product.price_90d_high_cents == 3999
+        assert _PRODUCT_WITH_HISTORY.price_90d_low_cents == 2499
+        assert _PRODUCT_WITH_HISTORY.price_90d_high_cents == 3999
 
 
 class TestKeepaClient:
     """Tests for KeepaClient."""
 
-    @pytest.fixture
-    def client(self):
-        """Create a test client."""
-        config = KeepaConfig(api_key="test-key")
-        return KeepaClient(config)
-
     def test_keepa_time_conversion(self, client):
         """Should convert Keepa time to datetime."""
         # Keepa time is minutes since 2011-01-01
@@ -201,8 +220,26 @@ class TestKeepaClient:
         assert history[1].price_cents == 3499
         assert history[2].price_cents == -1  # Out of stock
 
-    @patch.object(KeepaClient, "_request")
-    def test_get_tokens_left(self, mock_request, client):
+    def test_parse_price_history_bulk(self, client):
+        """Should parse long histories (real responses hold thousands of pairs)."""
+        rows = 10_000
+        row = []
+        for i in range(rows):
+            row += [525600 + i, -5 if i % 7 == 0 else 1000 + i]
+        row.append(525600 + rows)  # Trailing time without a price is ignored
+        row[2:4] = [None, 1234]  # Pairs with a missing value are skipped
+
+        history = client._parse_price_history([None, row], 1)
+
+        assert len(history) == rows - 1
+        assert history[0].timestamp == datetime(2012, 1, 1)
+        assert history[0].price_cents == -1  # Negative prices normalize to -1
+        assert history[1].timestamp == datetime(2012, 1, 1) + timedelta(minutes=2)
+        assert history[1].price_cents == 1002
+        assert history[-1].timestamp == datetime(2012, 1, 1) + timedelta(minutes=rows - 1)
+        assert history[-1].price_cents == 1000 + rows - 1
+
+    def test_get_tokens_left(self, client, mock_request):
         """Should return remaining tokens."""
         mock_request.return_value = {"tokensLeft": 500}
 
@@ -211,8 +248,7 @@ class TestKeepaClient:
         assert tokens == 500
         mock_request.assert_called_once()
 
-    @patch.object(KeepaClient, "_request")
-    def test_get_products(self, mock_request, client):
+    def test_get_products(self, client, mock_request):
         """Should parse product response."""
         mock_request.return_value = {
             "products": [
@@ -247,69 +283,68 @@ class TestKeepaClient:
         assert product.review_count == 150
         assert product.sales_rank == 1000
 
-    @patch.object(KeepaClient, "_request")
-    def test_get_product_single(self, mock_request, client):
-        """Should get single product."""
-        mock_request.return_value = {
-            "products": [
-                {
-                    "asin": "B08N5WRWNW",
-                    "title": "Test",
-                    "stats": {"current": [2999, 2999, -1, 500]},
-                }
-            ]
-        }
-
-        product = client.get_product("B08N5WRWNW")
-
-        assert product is not None
-        assert product.asin == "B08N5WRWNW"
-
-    @patch.object(KeepaClient, "_request")
-    def test_get_product_not_found(self, mock_request, client):
-        """Should return None for non-existent product."""
-        mock_request.return_value = {"products": []}
-
-        product = client.get_product("INVALID123")
-
-        assert product is None
-
-    @patch.object(KeepaClient, "_request")
-    def test_check_competition_with_amazon(self, mock_request, client):
-        """Should detect Amazon competition."""
-        mock_request.return_value = {
-            "products": [
+    @pytest.mark.parametrize(
+        "products,asin,found",
+        [
+            (
+                [
+                    {
+                        "asin": "B08N5WRWNW",
+                        "title": "Test",
+                        "stats": {"current": [2999, 2999, -1, 500]},
+                    }
+                ],
+                "B08N5WRWNW",
+                True,
+            ),
+            ([], "INVALID123", False),
+        ],
+        ids=["single", "not_found"],
+    )
+    def test_get_product(self, client, mock_request, products, asin, found):
+        """Should get a single product, or None for a non-existent one."""
+        mock_request.return_value = {"products": products}
+
+        product = client.get_product(asin)
+
+        if found:
+            assert product is not None
+            assert product.asin == asin
+        else:
+            assert product is None
+
+    @pytest.mark.parametrize(
+        "product,expected",
+        [
+            (
                 {
                     "asin": "B08N5WRWNW",
                     "title": "Test",
                     "stats": {"current": [2999, 2999, -1, 500]},
                     "buyBoxSellerIdHistory": [525600, "ATVPDKIKX0DER"],  # Amazon US
                     "csv": [None] * 19,  # 19 price types
-                }
-            ]
-        }
-
-        result = client.check_competition("B08N5WRWNW")
-
-        assert result["has_amazon"] is True
-        assert result["is_competitive"] is True
-
-    @patch.object(KeepaClient, "_request")
-    def test_check_competition_no_amazon(self, mock_request, client):
-        """Should detect when Amazon is not competing."""
-        mock_request.return_value = {
-            "products": [
+                },
+                {"has_amazon": True, "is_competitive": True},
+            ),
+            (
                 {
                     "asin": "B08N5WRWNW",
                     "title": "Test",
                     "stats": {"current": [-1, 2999, -1, 500]},  # No Amazon price
-                }
-            ]
-        }
+                },
+                {"has_amazon": False},
+            ),
+        ],
+        ids=["with_amazon", "no_amazon"],
+    )
+    def test_check_competition(self, client, mock_request, product, expected):
+        """Should detect whether Amazon is competing on the listing."""
+        mock_request.return_value = {"products": [product]}
 
         result = client.check_competition("B08N5WRWNW")
 
-        assert result["has_amazon"] is False
+        for key, value in expected.items():
+            assert result[key] is value
 
     def test_max_asins_validation(self, client):
         """Should reject more than 100 ASINs."""
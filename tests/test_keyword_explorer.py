@@ -0,0 +1,413 @@
+"""Tests for keyword exploration service."""
+
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from ecom_arb.integrations.google_ads import CPCEstimate, GoogleAdsError
+from ecom_arb.services.keyword_explorer import (
+    EstimateCache,
+    ExplorationResult,
+    KeywordExplorer,
+    KeywordOpportunity,
+    ScoreCache,
+    _canonical_keyword,
+    _estimate_cache,
+)
+from ecom_arb.services.llm_analyzer import KeywordScore, ProductUnderstanding
+
+
+def _estimate(keyword: str, volume: int = 1000) -> CPCEstimate:
+    """Keyword Planner estimate with a $1-2 CPC range."""
+    return CPCEstimate(
+        keyword=keyword,
+        avg_monthly_searches=volume,
+        competition="LOW",
+        low_cpc=Decimal("1.00"),
+        high_cpc=Decimal("2.00"),
+    )
+
+
+async def _score_all(keywords, product_understanding, relevance=80):
+    """score_keyword_relevance stand-in that rates every keyword the same."""
+    return [KeywordScore(keyword=kw, relevance=relevance, reason="match") for kw in keywords]
+
+
+def _estimates_by_seeds(responses: dict[frozenset[str], list[CPCEstimate]]):
+    """get_keyword_cpc_estimates stand-in answering per seed set."""
+    def get_estimates(keywords):
+        return responses.get(frozenset(keywords), [])
+    return get_estimates
+
+
+def _scored_keywords(mock_scoring) -> list[str]:
+    """Every keyword sent to the mocked LLM scorer, across calls."""
+    return [kw for call in mock_scoring.await_args_list for kw in call.args[0]]
+
+
+@pytest.fixture
+def mock_scoring():
+    """Patch the LLM relevance call made by the explorer."""
+    with patch(
+        "ecom_arb.services.keyword_explorer.score_keyword_relevance",
+        new=AsyncMock(side_effect=_score_all),
+    ) as mock:
+        yield mock
+
+
+@pytest.fixture
+def explorer():
+    """Explorer with a mocked Ads client, no score cache and a clean estimate cache."""
+    _estimate_cache.clear()
+    explorer = KeywordExplorer(google_ads_client=MagicMock(), max_depth=1)
+    explorer.score_cache = None
+    yield explorer
+    explorer.close()
+    _estimate_cache.clear()
+
+
+@pytest.fixture
+def understanding():
+    """Minimal analyzed product."""
+    return ProductUnderstanding(
+        product_type="dog bed",
+        style=["modern"],
+        materials=["memory foam"],
+        use_cases=["sleeping"],
+        buyer_persona="dog owners",
+        quality_tier="mid-range",
+        price_expectation="$40-80",
+        seed_keywords={"exact": ["dog bed"], "specific": [], "broad": []},
+    )
+
+
+class TestKeywordOpportunity:
+    """Tests for KeywordOpportunity relevance normalization."""
+
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            (85, 85),
+            (72.9, 72),
+            ("64", 64),
+            ("88.5", 88),
+            (150, 100),
+            (-5, 0),
+            (None, 0),
+            ("high", 0),
+            ("", 0),
+            (float("nan"), 0),
+        ],
+    )
+    def test_relevance_coerced(self, raw, expected):
+        """LLM relevance of any shape becomes a 0-100 int instead of raising."""
+        opportunity = KeywordOpportunity(
+            keyword="dog bed",
+            monthly_volume=1000,
+            avg_cpc=1.5,
+            competition="LOW",
+            relevance_score=raw,
+            relevance_reason="",
+            tier="exact",
+            source="seed",
+            depth=0,
+        )
+
+        assert opportunity.relevance_score == expected
+
+
+class TestExplorationResult:
+    """Tests for ExplorationResult derived views."""
+
+    def test_keywords_frozen_for_cached_views(self):
+        """Keywords are stored as a tuple, so by_tier and top_opportunities stay valid."""
+        opportunity = KeywordOpportunity(
+            keyword="dog bed",
+            monthly_volume=1000,
+            avg_cpc=1.5,
+            competition="LOW",
+            relevance_score=90,
+            relevance_reason="",
+            tier="exact",
+            source="seed",
+            depth=0,
+        )
+        keywords = [opportunity]
+        result = ExplorationResult(keywords=keywords, total_explored=1, depth_reached=0)
+        keywords.append(opportunity)
+
+        assert result.keywords == (opportunity,)
+        assert result.by_tier["exact"] == [opportunity]
+        assert result.top_opportunities == [opportunity]
+
+
+class TestCanonicalKeyword:
+    """Tests for the near-duplicate keyword key."""
+
+    @pytest.mark.parametrize(
+        "first,second",
+        [
+            ("running shoes", "running shoe"),
+            ("the running shoes", "running shoe"),
+            ("Dog Bed", "dog bed"),
+            ("case for phone", "case phone"),
+        ],
+    )
+    def test_variants_share_key(self, first, second):
+        """Plural, filler-word and case variants map to the same key."""
+        assert _canonical_keyword(first) == _canonical_keyword(second)
+
+    @pytest.mark.parametrize(
+        "first,second",
+        [
+            ("dog bed for cats", "cat bed for dogs"),
+            ("case for phone", "phone case"),
+            ("shoes for running", "running shoes"),
+        ],
+    )
+    def test_word_order_matters(self, first, second):
+        """Reordered keywords can mean different things, so keys differ."""
+        assert _canonical_keyword(first) != _canonical_keyword(second)
+
+
+class TestScoreCache:
+    """Tests for ScoreCache exact lookups."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Empty score cache."""
+        cache = ScoreCache(str(tmp_path / "scores.db"))
+        yield cache
+        cache.close()
+
+    def test_round_trip_hits_only(self, cache):
+        """Stored scores come back for their product; misses are omitted."""
+        cache.put_many("product-a", {"dog bed": {"relevance": 90, "reason": "exact"}})
+
+        assert cache.get_many("product-a", ["dog bed", "cat tree"]) == {
+            "dog bed": {"relevance": 90, "reason": "exact"},
+        }
+        assert cache.get_many("product-b", ["dog bed"]) == {}
+
+    def test_put_replaces_existing(self, cache):
+        """Re-scoring a keyword overwrites the old score."""
+        cache.put_many("product-a", {"dog bed": {"relevance": 40, "reason": "old"}})
+        cache.put_many("product-a", {"dog bed": {"relevance": 85, "reason": "new"}})
+
+        assert cache.get_many("product-a", ["dog bed"])["dog bed"]["relevance"] == 85
+
+    def test_lookup_past_parameter_limit(self, cache):
+        """Lookups larger than one IN (...) batch are chunked."""
+        keywords = [f"keyword {i}" for i in range(ScoreCache._MAX_PARAMS * 2 + 7)]
+        cache.put_many("product-a", {kw: {"relevance": 60, "reason": ""} for kw in keywords})
+
+        assert len(cache.get_many("product-a", keywords)) == len(keywords)
+
+    def test_reopen_keeps_scores(self, tmp_path):
+        """Scores persist across cache instances on the same file."""
+        path = str(tmp_path / "scores.db")
+        first = ScoreCache(path)
+        first.put_many("product-a", {"dog bed": {"relevance": 90, "reason": "exact"}})
+        first.close()
+
+        second = ScoreCache(path)
+        try:
+            assert "dog bed" in second.get_many("product-a", ["dog bed"])
+        finally:
+            second.close()
+
+
+class TestEstimateCache:
+    """Tests for the Keyword Planner EstimateCache."""
+
+    def test_key_ignores_order_and_case(self):
+        """Seed sets hit the same entry regardless of order, case or repeats."""
+        assert EstimateCache.key(["Dog Bed", "cat tree"]) == EstimateCache.key(
+            ["cat tree", "dog bed", "dog bed"]
+        )
+
+    def test_entry_expires_after_ttl(self):
+        """Entries are served until ttl elapses, then dropped."""
+        cache = EstimateCache(ttl=60)
+        key = EstimateCache.key(["dog bed"])
+        with patch("ecom_arb.services.keyword_explorer.time.monotonic", return_value=1000.0):
+            cache.put(key, [_estimate("dog bed")])
+        with patch("ecom_arb.services.keyword_explorer.time.monotonic", return_value=1059.0):
+            assert cache.get(key) == [_estimate("dog bed")]
+        with patch("ecom_arb.services.keyword_explorer.time.monotonic", return_value=1060.0):
+            assert cache.get(key) is None
+
+    def test_evicts_least_recently_used(self):
+        """A full cache drops the entry read or written longest ago."""
+        cache = EstimateCache(maxsize=2)
+        first, second, third = (EstimateCache.key([kw]) for kw in ("a", "b", "c"))
+        cache.put(first, [])
+        cache.put(second, [])
+        cache.get(first)  # first is now the most recently used
+
+        cache.put(third, [])
+
+        assert cache.get(second) is None
+        assert cache.get(first) == []
+        assert cache.get(third) == []
+
+    def test_get_returns_copy(self):
+        """Callers mutating a result never corrupt the cached entry."""
+        cache = EstimateCache()
+        key = EstimateCache.key(["dog bed"])
+        cache.put(key, [_estimate("dog bed")])
+
+        cache.get(key).clear()
+
+        assert len(cache.get(key)) == 1
+
+
+class TestScoreCacheNearDuplicates:
+    """Tests for ScoreCache.get_near_duplicates."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Score cache with one scored keyword per product."""
+        cache = ScoreCache(str(tmp_path / "scores.db"))
+        cache.put_many("product-a", {"dog bed for cats": {"relevance": 90, "reason": "match"}})
+        yield cache
+        cache.close()
+
+    def test_reuses_paraphrase_score(self, cache):
+        """A plural/filler variant reuses the cached score."""
+        result = cache.get_near_duplicates("product-a", ["dog beds for the cat"])
+
+        assert result == {"dog beds for the cat": {"relevance": 90, "reason": "match"}}
+
+    def test_reordered_keyword_not_reused(self, cache):
+        """A keyword with swapped words is scored on its own."""
+        assert cache.get_near_duplicates("product-a", ["cat bed for dogs"]) == {}
+
+    def test_other_product_not_reused(self, cache):
+        """Scores never leak across product fingerprints."""
+        assert cache.get_near_duplicates("product-b", ["dog bed for cats"]) == {}
+
+
+class TestScoreCacheFingerprint:
+    """Tests for ScoreCache.fingerprint."""
+
+    def test_stable_for_same_product_and_model(self, understanding):
+        """The same product and model always hash the same."""
+        assert ScoreCache.fingerprint(understanding, "model-a") == ScoreCache.fingerprint(
+            understanding, "model-a"
+        )
+
+    def test_differs_by_model(self, understanding):
+        """Scores from one model are never served for another."""
+        assert ScoreCache.fingerprint(understanding, "model-a") != ScoreCache.fingerprint(
+            understanding, "model-b"
+        )
+
+
+class TestCrossTierScoring:
+    """Tests for scoring keywords shared by concurrently explored tiers."""
+
+    @pytest.mark.asyncio
+    async def test_shared_keyword_scored_once(self, explorer, understanding, mock_scoring):
+        """A keyword every tier surfaces costs one LLM score, kept by the first tier."""
+        understanding.seed_keywords = {"exact": ["dog bed"], "specific": ["orthopedic dog bed"]}
+        explorer.google_client.get_keyword_cpc_estimates.return_value = [
+            _estimate("dog bed"),
+            _estimate("large dog bed"),
+        ]
+
+        result = await explorer.explore(understanding)
+
+        assert sorted(_scored_keywords(mock_scoring)) == ["dog bed", "large dog bed"]
+        assert {kw.keyword: kw.tier for kw in result.keywords} == {
+            "dog bed": "exact",
+            "large dog bed": "exact",
+        }
+
+
+class TestExplore:
+    """Tests for KeywordExplorer.explore expansion and tier merging."""
+
+    @pytest.mark.asyncio
+    async def test_expands_breadth_first_from_relevant_keywords(
+        self, explorer, understanding, mock_scoring
+    ):
+        """Each depth expands from the previous depth's keywords scoring 70+."""
+        relevance = {
+            "dog bed": 90,
+            "large dog bed": 80,
+            "dog leash": 20,
+            "orthopedic dog bed": 85,
+            "dog bowl": 60,
+            "memory foam dog bed": 75,
+        }
+
+        async def score(keywords, product_understanding):
+            return [KeywordScore(kw, relevance[kw], "") for kw in keywords]
+
+        mock_scoring.side_effect = score
+        explorer.max_depth = 2
+        understanding.seed_keywords = {"exact": ["dog bed"]}
+        explorer.google_client.get_keyword_cpc_estimates.side_effect = _estimates_by_seeds({
+            frozenset({"dog bed"}): [
+                _estimate("dog bed", 1000),
+                _estimate("large dog bed", 800),
+                _estimate("dog leash", 900),
+            ],
+            frozenset({"dog bed", "large dog bed", "dog leash"}): [
+                _estimate("dog bed", 1000),
+                _estimate("orthopedic dog bed", 500),
+                _estimate("dog bowl", 400),
+            ],
+            # dog bowl (60) is kept but too weak to expand from
+            frozenset({"orthopedic dog bed"}): [_estimate("memory foam dog bed", 300)],
+        })
+
+        result = await explorer.explore(understanding)
+
+        assert {kw.keyword: (kw.source, kw.depth) for kw in result.keywords} == {
+            "dog bed": ("seed", 0),
+            "large dog bed": ("seed", 0),
+            "orthopedic dog bed": ("expanded", 1),
+            "dog bowl": ("expanded", 1),
+            "memory foam dog bed": ("expanded", 2),
+        }
+        assert result.total_explored == 5  # 1 seed + 3 depth-1 seeds + 1 depth-2 seed
+        assert result.depth_reached == 2
+        assert sorted(_scored_keywords(mock_scoring)) == sorted(relevance)
+
+    @pytest.mark.asyncio
+    async def test_failing_tier_keeps_other_tiers(self, explorer, understanding, mock_scoring):
+        """A tier whose Ads call fails reports an error without cancelling the rest."""
+        understanding.seed_keywords = {"exact": ["dog bed"], "broad": ["pet supplies"]}
+
+        def get_estimates(keywords):
+            if keywords == ["pet supplies"]:
+                raise GoogleAdsError("quota exceeded")
+            return [_estimate("dog bed")]
+
+        explorer.google_client.get_keyword_cpc_estimates.side_effect = get_estimates
+
+        result = await explorer.explore(understanding)
+
+        assert [kw.keyword for kw in result.keywords] == ["dog bed"]
+        assert result.errors == ["Google Ads error for broad tier: quota exceeded"]
+
+    @pytest.mark.asyncio
+    async def test_seed_repeated_across_tiers_queried_once(
+        self, explorer, understanding, mock_scoring
+    ):
+        """A seed listed in several tiers is only queried for the first tier."""
+        understanding.seed_keywords = {
+            "exact": ["dog bed"],
+            "specific": ["Dog Bed", "orthopedic dog bed"],
+        }
+        explorer.google_client.get_keyword_cpc_estimates.return_value = []
+
+        await explorer.explore(understanding)
+
+        queried = [
+            call.args[0] for call in explorer.google_client.get_keyword_cpc_estimates.call_args_list
+        ]
+        assert sorted(queried) == [["dog bed"], ["orthopedic dog bed"]]
@@ -0,0 +1,366 @@
+"""Tests for LLM product analyzer."""
+
+import json
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from ecom_arb.config import get_settings
+from ecom_arb.services import llm_analyzer
+from ecom_arb.services.llm_analyzer import (
+    AMAZON_MIN_CANDIDATES,
+    AmazonMatch,
+    KeywordScore,
+    LLMResponseCache,
+    ProductUnderstanding,
+    _amazon_candidates,
+    _call_openrouter,
+    _market_price,
+    _stream_completion,
+    _weighted_median,
+    filter_related_keywords,
+)
+
+_MESSAGES = [{"role": "user", "content": "Score these keywords"}]
+
+
+def _sse(*events: str) -> bytes:
+    """Server-sent event stream body from raw data payloads."""
+    return "".join(f"data: {event}\n\n" for event in events).encode()
+
+
+def _delta(content: str, finish_reason: str | None = None) -> str:
+    """One streamed chat completion chunk carrying content."""
+    return json.dumps(
+        {"choices": [{"delta": {"content": content}, "finish_reason": finish_reason}]}
+    )
+
+
+def _client(handler) -> httpx.AsyncClient:
+    """AsyncClient answering every request through handler."""
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.fixture
+def understanding():
+    """Minimal analyzed product."""
+    return ProductUnderstanding(
+        product_type="dog bed",
+        style=["modern"],
+        materials=["memory foam"],
+        use_cases=["sleeping"],
+        buyer_persona="dog owners",
+        quality_tier="mid-range",
+        price_expectation="$40-80",
+        seed_keywords={"exact": ["dog bed"], "specific": [], "broad": []},
+    )
+
+
+@pytest.fixture
+def openrouter():
+    """Configured OpenRouter call with the stream, cache and backoff sleep mocked.
+
+    Tests set ``stream.side_effect`` to the (status, content, retry_after)
+    results of successive attempts.
+    """
+    settings = get_settings().model_copy(update={"openrouter_api_key": "test-key"})
+    with (
+        patch.object(llm_analyzer, "get_settings", return_value=settings),
+        patch.object(llm_analyzer, "_default_llm_cache", return_value=None) as default_cache,
+        patch.object(llm_analyzer, "_get_client", return_value=MagicMock()),
+        patch.object(llm_analyzer, "_stream_completion", new=AsyncMock()) as stream,
+        patch.object(llm_analyzer.asyncio, "sleep", new=AsyncMock()) as sleep,
+    ):
+        yield MagicMock(stream=stream, sleep=sleep, default_cache=default_cache)
+
+
+class TestLLMResponseCache:
+    """Tests for LLMResponseCache."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Response cache with a one-minute TTL."""
+        cache = LLMResponseCache(str(tmp_path / "llm.db"), ttl=60)
+        yield cache
+        cache.close()
+
+    def test_key_ignores_dict_order(self):
+        """Equal payloads hash the same however their keys are ordered."""
+        first = {"model": "m", "messages": _MESSAGES, "temperature": 0.2}
+        second = {"temperature": 0.2, "messages": _MESSAGES, "model": "m"}
+
+        assert LLMResponseCache.key(first) == LLMResponseCache.key(second)
+        assert LLMResponseCache.key(first) != LLMResponseCache.key({**first, "model": "n"})
+
+    def test_round_trip(self, cache):
+        """A stored response is returned until it expires."""
+        cache.put("abc", {"scores": [1, 2]})
+
+        assert cache.get("abc") == {"scores": [1, 2]}
+        assert cache.get("missing") is None
+
+    def test_entry_expires_after_ttl(self, cache):
+        """Entries older than ttl are misses."""
+        with patch.object(llm_analyzer.time, "time", return_value=1000.0):
+            cache.put("abc", {"ok": True})
+        with patch.object(llm_analyzer.time, "time", return_value=1059.0):
+            assert cache.get("abc") == {"ok": True}
+        with patch.object(llm_analyzer.time, "time", return_value=1061.0):
+            assert cache.get("abc") is None
+
+    def test_reopen_purges_expired(self, tmp_path):
+        """Opening the cache deletes expired rows and keeps fresh ones."""
+        path = str(tmp_path / "llm.db")
+        first = LLMResponseCache(path, ttl=60)
+        with patch.object(llm_analyzer.time, "time", return_value=1000.0):
+            first.put("old", {"n": 1})
+        first.put("new", {"n": 2})
+        first.close()
+
+        second = LLMResponseCache(path, ttl=60)
+        try:
+            rows = second._conn.execute("SELECT hash FROM llm_cache").fetchall()
+            assert rows == [("new",)]
+        finally:
+            second.close()
+
+
+class TestStreamCompletion:
+    """Tests for _stream_completion SSE assembly."""
+
+    @pytest.mark.asyncio
+    async def test_assembles_deltas(self):
+        """Content deltas are joined; comments, blank lines and [DONE] are skipped."""
+        body = b": OPENROUTER PROCESSING\n\n" + _sse(
+            _delta('{"score"'),
+            json.dumps({"choices": []}),
+            _delta(": 90}", finish_reason="stop"),
+            "[DONE]",
+            _delta("ignored after done"),
+        )
+        async with _client(lambda request: httpx.Response(200, content=body)) as client:
+            result = await _stream_completion(client, {}, {"model": "m"}, 5.0)
+
+        assert result == (200, '{"score": 90}', None)
+
+    @pytest.mark.asyncio
+    async def test_requests_stream(self):
+        """The payload is sent with stream enabled."""
+        sent = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(json.loads(request.content))
+            return httpx.Response(200, content=_sse("[DONE]"))
+
+        async with _client(handler) as client:
+            await _stream_completion(client, {}, {"model": "m"}, 5.0)
+
+        assert sent == [{"model": "m", "stream": True}]
+
+    @pytest.mark.asyncio
+    async def test_error_status_returns_body_and_retry_after(self):
+        """Non-200 responses return their body and parsed Retry-After."""
+        response = httpx.Response(429, headers={"Retry-After": "3"}, content=b"slow down")
+        async with _client(lambda request: response) as client:
+            result = await _stream_completion(client, {}, {"model": "m"}, 5.0)
+
+        assert result == (429, "slow down", 3.0)
+
+    @pytest.mark.asyncio
+    async def test_stream_error_raises(self):
+        """An error event in the middle of the stream fails the call."""
+        body = _sse(_delta("{"), json.dumps({"error": {"message": "overloaded"}}))
+        async with _client(lambda request: httpx.Response(200, content=body)) as client:
+            with pytest.raises(Exception, match="overloaded"):
+                await _stream_completion(client, {}, {"model": "m"}, 5.0)
+
+
+class TestCallOpenRouterRetries:
+    """Tests for _call_openrouter retry and backoff."""
+
+    @pytest.mark.asyncio
+    async def test_retries_rate_limit_and_server_errors(self, openrouter):
+        """429 and 5xx responses are retried until a 200 arrives."""
+        openrouter.stream.side_effect = [
+            (429, "rate limited", None),
+            (502, "bad gateway", None),
+            (200, '```json\n{"ok": true}\n```', None),
+        ]
+
+        result = await _call_openrouter(_MESSAGES)
+
+        assert result == {"ok": True}
+        assert openrouter.stream.await_count == 3
+        first, second = (call.args[0] for call in openrouter.sleep.await_args_list)
+        assert 1.0 <= first < 1.1
+        assert 2.0 <= second < 2.1
+
+    @pytest.mark.asyncio
+    async def test_honors_retry_after(self, openrouter):
+        """A Retry-After longer than the backoff delay is waited out."""
+        openrouter.stream.side_effect = [(429, "", 12.5), (200, "{}", None)]
+
+        await _call_openrouter(_MESSAGES)
+
+        openrouter.sleep.assert_awaited_once_with(12.5)
+
+    @pytest.mark.asyncio
+    async def test_retries_transport_errors_then_raises(self, openrouter):
+        """Timeouts and connection errors are retried, then surfaced."""
+        openrouter.stream.side_effect = httpx.ReadTimeout("idle")
+
+        with pytest.raises(Exception, match="ReadTimeout"):
+            await _call_openrouter(_MESSAGES)
+
+        assert openrouter.stream.await_count == llm_analyzer.OPENROUTER_MAX_RETRIES + 1
+        assert openrouter.sleep.await_count == llm_analyzer.OPENROUTER_MAX_RETRIES
+
+    @pytest.mark.asyncio
+    async def test_client_error_not_retried(self, openrouter):
+        """Other 4xx responses fail immediately."""
+        openrouter.stream.side_effect = [(400, "bad request", None)]
+
+        with pytest.raises(Exception, match="400"):
+            await _call_openrouter(_MESSAGES)
+
+        openrouter.sleep.assert_not_awaited()
+
+
+class TestCallOpenRouterCache:
+    """Tests for _call_openrouter response cache access."""
+
+    @pytest.mark.asyncio
+    async def test_cache_opened_off_event_loop(self, openrouter):
+        """The shared cache is fetched in a worker thread, since opening it hits disk."""
+        threads = []
+        openrouter.default_cache.side_effect = lambda: threads.append(threading.current_thread())
+        openrouter.stream.side_effect = [(200, "{}", None)]
+
+        await _call_openrouter(_MESSAGES)
+
+        assert len(threads) == 1
+        assert threads[0] is not threading.main_thread()
+
+
+class TestWeightedMedian:
+    """Tests for _weighted_median."""
+
+    @pytest.mark.parametrize(
+        "weighted_values,expected",
+        [
+            ([(30.0, 1.0), (10.0, 1.0), (20.0, 1.0)], 20.0),
+            ([(10.0, 1.0), (20.0, 1.0)], 10.0),
+            ([(10.0, 1.0), (50.0, 5.0)], 50.0),
+            ([(10.0, 0.0), (20.0, 2.0)], 20.0),
+            ([(10.0, 0.0)], None),
+            ([], None),
+        ],
+    )
+    def test_weighted_median(self, weighted_values, expected):
+        """Smallest value where cumulative weight reaches half the total."""
+        assert _weighted_median(weighted_values) == expected
+
+    def test_precomputed_total(self):
+        """A supplied total is used instead of summing the weights again."""
+        weighted_values = [(10.0, 1.0), (20.0, 1.0), (30.0, 1.0)]
+
+        assert _weighted_median(weighted_values, total=3.0) == 20.0
+        assert _weighted_median(weighted_values, total=0.0) is None
+
+
+class TestMarketPrice:
+    """Tests for _market_price."""
+
+    def test_median_min_and_max(self):
+        """Unpriced matches are ignored; prices are weighted by similarity and reviews."""
+        matches = [
+            AmazonMatch(0, "Cheap", 19.99, 0, 90, ""),
+            AmazonMatch(1, "Popular", 34.5, 9999, 90, ""),
+            AmazonMatch(2, "Pricey", 79.0, 9, 80, ""),
+            AmazonMatch(3, "No price", 0.0, 500, 95, ""),
+        ]
+
+        assert _market_price(matches) == {"weighted_median": 34.5, "min": 19.99, "max": 79.0}
+
+    def test_no_priced_matches(self):
+        """Without a positive price every statistic is None."""
+        matches = [AmazonMatch(0, "No price", 0.0, 10, 90, "")]
+
+        assert _market_price(matches) == {"weighted_median": None, "min": None, "max": None}
+
+
+class TestAmazonCandidates:
+    """Tests for _amazon_candidates."""
+
+    def test_keeps_titles_sharing_product_words(self, understanding):
+        """Only titles sharing a descriptive word are sent to the LLM."""
+        titles = [
+            "Orthopedic Dog Bed",
+            "Memory Foam Pillow",
+            "Modern Sofa",
+            "Dog Beds for Large Dogs",
+            "Sleeping Mask",
+            "Garden Hose with Nozzle",
+        ]
+        products = [{"title": title} for title in titles]
+
+        assert _amazon_candidates(understanding, products) == [0, 1, 2, 3, 4]
+
+    def test_filler_words_do_not_match(self, understanding):
+        """Shared filler words alone are not a match."""
+        understanding.use_cases = ["for the garden"]
+        products = [{"title": "Dog Bed"}] * AMAZON_MIN_CANDIDATES + [{"title": "Hose for the Yard"}]
+
+        assert _amazon_candidates(understanding, products) == list(range(AMAZON_MIN_CANDIDATES))
+
+    def test_too_few_candidates_keeps_all(self, understanding):
+        """Below AMAZON_MIN_CANDIDATES matches, every product is compared."""
+        products = [{"title": "Dog Bed"}, {"title": "Garden Hose"}, {"title": None}]
+
+        assert _amazon_candidates(understanding, products) == [0, 1, 2]
+
+
+class TestFilterRelatedKeywords:
+    """Tests for filter_related_keywords."""
+
+    @pytest.fixture
+    def mock_scoring(self):
+        """Patch the LLM relevance call."""
+        with patch.object(llm_analyzer, "score_keyword_relevance", new=AsyncMock()) as mock:
+            yield mock
+
+    @pytest.mark.asyncio
+    async def test_accepts_descriptive_keywords_locally(self, understanding, mock_scoring):
+        """Keywords built from the product's own words skip the LLM."""
+        mock_scoring.return_value = [
+            KeywordScore("cat tree", 20, "different product"),
+            KeywordScore("pet bed", 75, "close match"),
+        ]
+
+        result = await filter_related_keywords(
+            ["memory foam dog beds", "modern dog bed", "cat tree", "pet bed"],
+            understanding,
+        )
+
+        assert result == ["memory foam dog beds", "modern dog bed", "pet bed"]
+        mock_scoring.assert_awaited_once_with(["cat tree", "pet bed"], understanding)
+
+    @pytest.mark.asyncio
+    async def test_keywords_without_product_type_go_to_llm(self, understanding, mock_scoring):
+        """Keywords of only style, material or use-case words are scored by the LLM."""
+        mock_scoring.return_value = [KeywordScore("modern memory foam", 30, "could be a mattress")]
+
+        result = await filter_related_keywords(
+            ["modern memory foam", "memory foam dog bed"], understanding
+        )
+
+        assert result == ["memory foam dog bed"]
+        mock_scoring.assert_awaited_once_with(["modern memory foam"], understanding)
+
+    @pytest.mark.asyncio
+    async def test_all_local_skips_llm(self, understanding, mock_scoring):
+        """No LLM call is made when every keyword is accepted locally."""
+        assert await filter_related_keywords(["dog bed"], understanding) == ["dog bed"]
+        mock_scoring.assert_not_awaited()
@@ -12,11 +12,13 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 import pytest_asyncio
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
 from ecom_arb.db.base import Base
 from ecom_arb.db.models import ScoredProduct
 from ecom_arb.scoring.models import Product, ProductCategory, ProductScore
+from ecom_arb.services.llm_analyzer import ProductUnderstanding
 from ecom_arb.services.pipeline import (
     PipelineService,
     PipelineResult,
@@ -177,6 +179,24 @@ class TestSaveScores:
         count = result.scalar()
         assert count == 1
 
+    @pytest.mark.asyncio
+    async def test_save_without_product_keeps_pricing(
+        self, sample_product: Product, db_session: AsyncSession
+    ):
+        """Re-saving a score without its Product updates scores but not pricing."""
+        scores = score_products([sample_product])
+        await save_scores(scores, db_session, [sample_product])
+
+        updated = sample_product.model_copy()
+        updated.name = "Fitness Tracker Band v2"
+        updated.product_cost = 10.00
+        saved = await save_scores(score_products([updated]), db_session)
+
+        assert len(saved) == 1
+        assert saved[0].name == "Fitness Tracker Band v2"
+        assert saved[0].product_cost == Decimal("20.00")
+        assert saved[0].category == "outdoor"
+
     @pytest.mark.asyncio
     async def test_save_rejected_products(self, sample_products: list[Product], db_session: AsyncSession):
         """Rejected products are also saved (for tracking)."""
@@ -205,7 +225,7 @@ class TestPipelineService:
         mock_discovered = MagicMock()
         mock_discovered.to_scoring_product.return_value = sample_product
 
-        mock.discover_products.return_value = [mock_discovered]
+        mock.discover_products = AsyncMock(return_value=[mock_discovered])
         return mock
 
     @pytest.mark.asyncio
@@ -248,6 +268,48 @@ class TestPipelineService:
         assert result.passed_count == 1
         assert result.rejected_count == 1
 
+    @pytest.mark.asyncio
+    async def test_run_pipeline_analyzes_passing_products(
+        self, mock_discovery_service, sample_products: list[Product], db_session: AsyncSession
+    ):
+        """Pipeline with analyze=True stores LLM understanding for passing products only."""
+        mock_discovered = []
+        for p in sample_products:
+            mock_dp = MagicMock()
+            mock_dp.to_scoring_product.return_value = p
+            mock_discovered.append(mock_dp)
+        mock_discovery_service.discover_products.return_value = mock_discovered
+
+        understanding = ProductUnderstanding(
+            product_type="fitness tracker",
+            style=["sporty"],
+            materials=["silicone"],
+            use_cases=["running"],
+            buyer_persona="runners",
+            quality_tier="mid-range",
+            price_expectation="$80-150",
+            seed_keywords={"exact": [], "specific": [], "broad": []},
+        )
+
+        service = PipelineService(
+            discovery_service=mock_discovery_service,
+            db_session=db_session,
+        )
+
+        with patch(
+            "ecom_arb.services.llm_analyzer.analyze_product",
+            AsyncMock(return_value=understanding),
+        ) as mock_analyze:
+            result = await service.run_pipeline(analyze=True)
+
+        assert result.analyzed_count == 1
+        mock_analyze.assert_awaited_once()
+
+        rows = (await db_session.execute(select(ScoredProduct))).scalars().all()
+        by_id = {r.source_product_id: r for r in rows}
+        assert by_id["pass-001"].product_understanding["product_type"] == "fitness tracker"
+        assert by_id["fail-001"].product_understanding is None
+
     @pytest.mark.asyncio
     async def test_score_and_save_products(self, sample_products: list[Product], db_session: AsyncSession):
         """Test score_and_save convenience method."""
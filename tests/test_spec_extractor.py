@@ -0,0 +1,188 @@
+"""Tests for product spec extraction and comparison."""
+
+import pytest
+
+from ecom_arb.services.spec_extractor import (
+    PARALLEL_MIN_PRODUCTS,
+    TYPE_MISMATCH_SIMILARITY,
+    ProductSpecs,
+    calculate_similarity,
+    extract_specs,
+    filter_similar_products,
+)
+
+
+class TestExtractSpecs:
+    """Tests for extract_specs quantity parsing."""
+
+    @pytest.mark.parametrize(
+        "title,field_name,expected",
+        [
+            ("Kettle 1.5kg", "weight_grams", 1500),
+            ("Mug 350g", "weight_grams", 350),
+            ("Flour 500 grams", "weight_grams", 500),
+            ("Dumbbell 2 lbs", "weight_grams", 907),
+            ("Bottle 1.5L", "capacity_ml", 1500),
+            ("Cup 500 ml", "capacity_ml", 500),
+            ("Fan 10W", "power_watts", 10),
+            ("Heater 100 watts", "power_watts", 100),
+            ("Torch 1000 lumens", "lumens", 1000),
+            ("Bulb 800lm", "lumens", 800),
+            ("Power bank 5000mAh", "battery_mah", 5000),
+            ("Shelf 30cm", "length_cm", 30.0),
+            ("Ruler 100mm", "length_cm", 10.0),
+            ("Frame 5 inches", "length_cm", 12.7),
+            ('Photo frame 8"x10"', "length_cm", 20.32),
+            ("Rug 2m", "length_cm", 200.0),
+            ("Hooks 3pcs", "quantity", 3),
+            ("Socks 5 pack", "quantity", 5),
+            ("Coasters set of 4", "quantity", 4),
+            ("Organizer Set 6", "quantity", 6),
+            ("Charging cable 3 in 1", "quantity", 3),
+        ],
+    )
+    def test_unit_golden(self, title, field_name, expected):
+        """Each unit spelling fills its field with the converted number."""
+        assert getattr(extract_specs(title), field_name) == pytest.approx(expected)
+
+    def test_higher_priority_unit_wins(self):
+        """A kg reading beats a gram reading wherever it appears in the text."""
+        assert extract_specs("Bag 500g 1kg").weight_grams == 1000
+
+    def test_oz_fills_weight_and_volume(self):
+        """An oz reading fills both the weight and the fluid volume."""
+        specs = extract_specs("Tumbler 20 oz")
+
+        assert specs.weight_grams == 567
+        assert specs.capacity_ml == 591
+
+    def test_in_without_one_is_only_inches(self):
+        """An "N in" not followed by 1 is a length, not a set."""
+        specs = extract_specs("Frame 5 in wide")
+
+        assert specs.length_cm == pytest.approx(12.7)
+        assert specs.quantity is None
+
+    @pytest.mark.parametrize(
+        "title,field_name,expected",
+        [
+            ("Power bank 10.5mAh", "battery_mah", 5),
+            ("Lantern 2.25 lumens", "lumens", 25),
+            ("Hooks 1.5pcs", "quantity", 5),
+        ],
+    )
+    def test_integer_units_take_digits_after_point(self, title, field_name, expected):
+        """Whole-number units read only the digits after a decimal point."""
+        assert getattr(extract_specs(title), field_name) == expected
+
+    def test_known_weight_wins(self):
+        """A supplied weight overrides one parsed from the title."""
+        assert extract_specs("Lamp 2kg", weight_grams=300).weight_grams == 300
+
+
+class TestCalculateSimilarity:
+    """Tests for calculate_similarity."""
+
+    def test_identical_products(self):
+        """Products with the same specs score 1.0."""
+        specs = extract_specs("Metal bluetooth speaker 10W portable")
+
+        assert calculate_similarity(specs, specs) == pytest.approx(1.0)
+
+    def test_type_mismatch(self):
+        """Different known product types score near zero."""
+        lamp = extract_specs("LED desk lamp 10W")
+        speaker = extract_specs("Bluetooth speaker 10W")
+
+        assert calculate_similarity(lamp, speaker) == TYPE_MISMATCH_SIMILARITY
+
+    @pytest.mark.parametrize(
+        "spec1,spec2,expected",
+        [
+            (ProductSpecs(), ProductSpecs(), 0.1),
+            (ProductSpecs(product_type="lamp"), ProductSpecs(product_type="lamp"), 1.0),
+            (ProductSpecs(weight_grams=100), ProductSpecs(weight_grams=125), 0.6),
+            (ProductSpecs(weight_grams=100), ProductSpecs(weight_grams=300), 0.0),
+            (ProductSpecs(material="metal"), ProductSpecs(material="wood"), 0.0),
+        ],
+    )
+    def test_weighted_fields(self, spec1, spec2, expected):
+        """Scores are the weighted mean of the fields both products have."""
+        assert calculate_similarity(spec1, spec2) == pytest.approx(expected)
+
+    def test_min_similarity_stops_early(self):
+        """A score that cannot reach min_similarity is cut to 0.0."""
+        spec1 = ProductSpecs(weight_grams=100, material="metal")
+        spec2 = ProductSpecs(weight_grams=1000, material="metal")
+
+        assert calculate_similarity(spec1, spec2) == pytest.approx(0.4)
+        assert calculate_similarity(spec1, spec2, min_similarity=0.4) == pytest.approx(0.4)
+        assert calculate_similarity(spec1, spec2, min_similarity=0.5) == 0.0
+
+    def test_min_similarity_keeps_reachable_scores(self):
+        """Scores at or above min_similarity are exact."""
+        pairs = [
+            ("LED desk lamp 10W metal", "LED floor lamp 12W metal dimmable"),
+            ("Bluetooth speaker 5000mAh", "Portable bluetooth speaker 4000mAh"),
+            ("Wooden shelf 30cm", "Metal shelf 35cm"),
+        ]
+        for title1, title2 in pairs:
+            spec1, spec2 = extract_specs(title1), extract_specs(title2)
+            full = calculate_similarity(spec1, spec2)
+            for threshold in (0.0, 0.3, 0.5, 0.7, 0.9):
+                result = calculate_similarity(spec1, spec2, min_similarity=threshold)
+                assert result == full if full >= threshold else result in (0.0, full)
+
+
+class TestFilterSimilarProducts:
+    """Tests for filter_similar_products."""
+
+    @pytest.fixture
+    def source(self):
+        """Specs of a CJ desk lamp."""
+        return extract_specs("LED desk lamp 10W 500 lumens metal")
+
+    def test_filters_and_sorts(self, source):
+        """Matches are sorted by similarity; mismatched types are dropped."""
+        products = [
+            {"title": "Bluetooth speaker 10W"},
+            {"title": "LED floor lamp 40W 2000 lumens"},
+            {"title": "LED desk lamp 10W 500 lumens metal"},
+        ]
+
+        results = filter_similar_products(source, products, min_similarity=0.3)
+
+        assert [product["title"] for product, _, _ in results] == [
+            "LED desk lamp 10W 500 lumens metal",
+            "LED floor lamp 40W 2000 lumens",
+        ]
+        assert results[0][0] is products[2]
+        assert results[0][2] == pytest.approx(1.0)
+
+    def test_returned_specs_are_copies(self, source):
+        """Callers may modify returned specs without affecting later calls."""
+        products = [{"title": "LED desk lamp 10W 500 lumens metal"}]
+
+        filter_similar_products(source, products)[0][1].features.append("edited")
+
+        assert "edited" not in filter_similar_products(source, products)[0][1].features
+
+    def test_workers_match_serial(self, source):
+        """Scoring across processes returns exactly the serial result."""
+        titles = [
+            "LED desk lamp 10W 500 lumens metal",
+            "LED floor lamp 40W 2000 lumens",
+            "Bluetooth speaker 10W",
+            "Table lamp wooden dimmable",
+            "USB desk light 5W",
+        ]
+        products = [
+            {"title": titles[i % len(titles)], "asin": f"B{i:05d}"}
+            for i in range(PARALLEL_MIN_PRODUCTS + 50)
+        ]
+
+        serial = filter_similar_products(source, products)
+        parallel = filter_similar_products(source, products, workers=2)
+
+        assert parallel == serial
+        assert all(p is s for (p, _, _), (s, _, _) in zip(parallel, serial))